@@ -45,7 +45,7 @@ from dotenv import load_dotenv
 
 from adw_modules.state import ADWState
 from adw_modules.git_ops import commit_changes, finalize_git_operations, get_current_branch
-from adw_modules.github import fetch_issue, make_issue_comment, get_repo_url, extract_repo_path
+from adw_modules.github import fetch_issue_meta, make_issue_comment, get_repo_url, extract_repo_path
 from adw_modules.workflow_ops import (
     implement_plan,
     create_commit,
@@ -432,7 +432,7 @@ def run_github_mode(context: dict) -> int:
 
     # Fetch issue data for commit message generation
     logger.info("Fetching issue data for commit message")
-    issue = fetch_issue(issue_number, repo_path)
+    issue = fetch_issue_meta(issue_number, repo_path)
 
     # Get issue classification from state or classify if needed
     issue_command = state.get("issue_class")
@@ -27,7 +27,7 @@ from dotenv import load_dotenv
 
 from adw_modules.state import ADWState
 from adw_modules.git_ops import commit_changes, finalize_git_operations
-from adw_modules.github import fetch_issue, make_issue_comment, get_repo_url, extract_repo_path
+from adw_modules.github import fetch_issue_meta, make_issue_comment, get_repo_url, extract_repo_path
 from adw_modules.workflow_ops import (
     create_commit,
     format_issue_message,
@@ -301,7 +301,7 @@ def main():
             
             # Fetch issue details for commit message
             try:
-                issue = fetch_issue(issue_number, repo_path)
+                issue = fetch_issue_meta(issue_number, repo_path)
                 logger.info(f"Fetched issue #{issue_number} for commit message")
             except Exception as e:
                 logger.error(f"Failed to fetch issue: {e}")
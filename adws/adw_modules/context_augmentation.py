@@ -20,7 +20,7 @@ Dependencies:
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 from .memory import PersistentLearningsLayer, get_memory
 from .gemini_search import (
@@ -32,6 +32,24 @@ from .gemini_search import (
 )
 
 
+# One bullet per file in _format_file_list
+_FILE_LINE_TEMPLATE = "- `{path}`{source}{line}"
+
+# Phase-specific section headers for the code context
+_PHASE_HEADERS = {
+    "scout": "DISCOVERED CONTEXT",
+    "plan": "PLANNING CONTEXT",
+    "build": "IMPLEMENTATION CONTEXT",
+}
+
+# Phase-specific memory lookups
+_PHASE_HINTS: dict[str, Callable[[PersistentLearningsLayer, str], str]] = {
+    "scout": lambda memory, task: memory.get_scout_hints(task),
+    "plan": lambda memory, task: memory.get_planning_lessons(task),
+    "build": lambda memory, task: memory.get_build_patterns(),
+}
+
+
 @dataclass
 class AugmentedContext:
     """Result of context augmentation for an agent prompt."""
@@ -77,9 +95,9 @@ class ContextAugmenter:
         self.memory = memory or get_memory(self.project_name)
         self.search = search_client or HybridSearchClient()
 
-        logging.debug(f"ContextAugmenter initialized for project: {self.project_name}")
-        logging.debug(f"Memory enabled: {self.memory.enabled}")
-        logging.debug(f"Gemini enabled: {self.search.gemini_enabled}")
+        logging.debug("ContextAugmenter initialized for project: %s", self.project_name)
+        logging.debug("Memory enabled: %s", self.memory.enabled)
+        logging.debug("Gemini enabled: %s", self.search.gemini_enabled)
 
     def augment_prompt_with_context(
         self,
@@ -99,6 +117,9 @@ class ContextAugmenter:
         4. Store new learnings
         5. Format and inject context
 
+        Fixed-phase callers should prefer ``augment_scout``, ``augment_plan``
+        or ``augment_build``, which have the phase resolved up front.
+
         Args:
             task: The current task description
             base_prompt: The base prompt to augment
@@ -107,6 +128,97 @@ class ContextAugmenter:
             path_filter: Optional path prefix filter
             language_filter: Optional language filter
 
+        Returns:
+            AugmentedContext with all augmentation details
+        """
+        return self._augment(
+            task,
+            base_prompt,
+            _PHASE_HINTS.get(phase),
+            _PHASE_HEADERS.get(phase, "CONTEXT"),
+            max_snippets,
+            path_filter,
+            language_filter,
+        )
+
+    def augment_scout(
+        self,
+        task: str,
+        base_prompt: str,
+        max_snippets: int = 10,
+        path_filter: Optional[str] = None,
+        language_filter: Optional[str] = None,
+    ) -> AugmentedContext:
+        """Augment a prompt for the scout phase (see augment_prompt_with_context)."""
+        return self._augment(
+            task,
+            base_prompt,
+            _PHASE_HINTS["scout"],
+            _PHASE_HEADERS["scout"],
+            max_snippets,
+            path_filter,
+            language_filter,
+        )
+
+    def augment_plan(
+        self,
+        task: str,
+        base_prompt: str,
+        max_snippets: int = 10,
+        path_filter: Optional[str] = None,
+        language_filter: Optional[str] = None,
+    ) -> AugmentedContext:
+        """Augment a prompt for the plan phase (see augment_prompt_with_context)."""
+        return self._augment(
+            task,
+            base_prompt,
+            _PHASE_HINTS["plan"],
+            _PHASE_HEADERS["plan"],
+            max_snippets,
+            path_filter,
+            language_filter,
+        )
+
+    def augment_build(
+        self,
+        task: str,
+        base_prompt: str,
+        max_snippets: int = 10,
+        path_filter: Optional[str] = None,
+        language_filter: Optional[str] = None,
+    ) -> AugmentedContext:
+        """Augment a prompt for the build phase (see augment_prompt_with_context)."""
+        return self._augment(
+            task,
+            base_prompt,
+            _PHASE_HINTS["build"],
+            _PHASE_HEADERS["build"],
+            max_snippets,
+            path_filter,
+            language_filter,
+        )
+
+    def _augment(
+        self,
+        task: str,
+        base_prompt: str,
+        get_hints: Optional[Callable[[PersistentLearningsLayer, str], str]],
+        header: str,
+        max_snippets: int,
+        path_filter: Optional[str],
+        language_filter: Optional[str],
+    ) -> AugmentedContext:
+        """Run the augmentation pipeline with the phase already resolved.
+
+        Args:
+            task: The current task description
+            base_prompt: The base prompt to augment
+            get_hints: Memory lookup for the phase (None for no hints)
+            header: Section header for the code context
+            max_snippets: Maximum code snippets to include
+            path_filter: Optional path prefix filter
+            language_filter: Optional language filter
+
         Returns:
             AugmentedContext with all augmentation details
         """
@@ -115,18 +227,11 @@ class ContextAugmenter:
         # =====================================================================
         # Step 1: Get hints from memory
         # =====================================================================
-        memory_hints = ""
-
-        if phase == "scout":
-            memory_hints = self.memory.get_scout_hints(task)
-        elif phase == "plan":
-            memory_hints = self.memory.get_planning_lessons(task)
-        elif phase == "build":
-            memory_hints = self.memory.get_build_patterns()
+        memory_hints = get_hints(self.memory, task) if get_hints else ""
 
         if memory_hints:
             sources_used.append("memory")
-            logging.debug(f"Got memory hints: {len(memory_hints)} chars")
+            logging.debug("Got memory hints: %d chars", len(memory_hints))
 
         # =====================================================================
         # Step 2: Augment query with memory context
@@ -159,13 +264,13 @@ class ContextAugmenter:
                 files=file_paths,
                 source="hybrid_search"
             )
-            logging.debug(f"Recorded discovery: {len(file_paths)} files")
+            logging.debug("Recorded discovery: %d files", len(file_paths))
 
         # =====================================================================
         # Step 5: Format context block
         # =====================================================================
         context_block = self._format_context_block(
-            search_results.snippets,
+            search_results,
             max_snippets
         )
 
@@ -176,7 +281,7 @@ class ContextAugmenter:
             base_prompt=base_prompt,
             memory_hints=memory_hints,
             context_block=context_block,
-            phase=phase
+            header=header
         )
 
         return AugmentedContext(
@@ -260,23 +365,26 @@ class ContextAugmenter:
 
     def _format_context_block(
         self,
-        snippets: list[Snippet],
+        search_results: SearchResult,
         max_snippets: int
     ) -> str:
         """Format snippets into a context block for prompts.
 
+        Only the first ``max_snippets`` snippets are visited; the
+        ``SearchResult`` column views would each walk every snippet.
+
         Args:
-            snippets: List of code snippets
+            search_results: Search result holding the snippets
             max_snippets: Maximum to include
 
         Returns:
             Formatted markdown context block
         """
-        if not snippets:
+        if not search_results.snippets:
             return "No relevant code snippets found."
 
         parts = []
-        for i, snippet in enumerate(snippets[:max_snippets], 1):
+        for i, snippet in enumerate(search_results.snippets[:max_snippets], 1):
             # Format each snippet
             source_tag = f"[{snippet.source}]" if snippet.source != "unknown" else ""
             line_info = f":{snippet.line_start}" if snippet.line_start else ""
@@ -304,22 +412,21 @@ class ContextAugmenter:
         if not snippets:
             return "No files found."
 
-        lines = []
-        for snippet in snippets:
-            source = f" ({snippet.source})" if snippet.source != "unknown" else ""
-            line = f"- `{snippet.file_path}`{source}"
-            if snippet.line_start:
-                line += f" line {snippet.line_start}"
-            lines.append(line)
-
-        return "\n".join(lines)
+        return "\n".join(
+            _FILE_LINE_TEMPLATE.format(
+                path=snippet.file_path,
+                source=f" ({snippet.source})" if snippet.source != "unknown" else "",
+                line=f" line {snippet.line_start}" if snippet.line_start else "",
+            )
+            for snippet in snippets
+        )
 
     def _build_augmented_prompt(
         self,
         base_prompt: str,
         memory_hints: str,
         context_block: str,
-        phase: str
+        header: str
     ) -> str:
         """Build the final augmented prompt.
 
@@ -327,19 +434,11 @@ class ContextAugmenter:
             base_prompt: The original prompt
             memory_hints: Hints from memory
             context_block: Formatted code context
-            phase: Current phase
+            header: Phase-specific section header
 
         Returns:
             Complete augmented prompt
         """
-        # Phase-specific headers
-        phase_headers = {
-            "scout": "DISCOVERED CONTEXT",
-            "plan": "PLANNING CONTEXT",
-            "build": "IMPLEMENTATION CONTEXT",
-        }
-        header = phase_headers.get(phase, "CONTEXT")
-
         sections = [base_prompt]
 
         # Add memory section if we have hints
@@ -440,7 +539,7 @@ def augment_for_scout(task: str, base_prompt: str) -> str:
         Augmented prompt with context
     """
     augmenter = get_augmenter()
-    result = augmenter.augment_prompt_with_context(task, base_prompt, phase="scout")
+    result = augmenter.augment_scout(task, base_prompt)
     return result.augmented_prompt
 
 
@@ -455,7 +554,7 @@ def augment_for_plan(task: str, base_prompt: str) -> str:
         Augmented prompt with context
     """
     augmenter = get_augmenter()
-    result = augmenter.augment_prompt_with_context(task, base_prompt, phase="plan")
+    result = augmenter.augment_plan(task, base_prompt)
     return result.augmented_prompt
 
 
@@ -470,5 +569,5 @@ def augment_for_build(task: str, base_prompt: str) -> str:
         Augmented prompt with context
     """
     augmenter = get_augmenter()
-    result = augmenter.augment_prompt_with_context(task, base_prompt, phase="build")
+    result = augmenter.augment_build(task, base_prompt)
     return result.augmented_prompt
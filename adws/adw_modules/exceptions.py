@@ -5,9 +5,25 @@ Exception catches throughout the codebase. Each exception type includes context
 tracking and recovery strategies.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from datetime import datetime
+import functools
+import json
 import logging
+import time
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; to_json_bytes falls back to the stdlib encoder
+    orjson = None
+
+
+def _merge_context(context: Dict[str, Any], **fields: Any) -> Dict[str, Any]:
+    """Fold the non-None named fields into ``context`` with a single update."""
+    context.update({k: v for k, v in fields.items() if v is not None})
+    return context
 
 
 class ADWError(Exception):
@@ -17,6 +33,10 @@ class ADWError(Exception):
     - Structured error context
     - Timestamp tracking
     - Optional correlation ID for multi-operation tracking
+
+    The raise time is captured as an epoch float (``timestamp_epoch``); the
+    datetime and its ISO string are only built when first read, which keeps
+    raise-heavy retry loops cheap.
     """
 
     def __init__(
@@ -36,7 +56,15 @@ class ADWError(Exception):
         self.message = message
         self.context = context or {}
         self.correlation_id = correlation_id
-        self.timestamp = datetime.now()
+        self.timestamp_epoch = time.time()
+        self._timestamp: Optional[datetime] = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local datetime at which the error was raised (built on first access)."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.timestamp_epoch)
+        return self._timestamp
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging/serialization."""
@@ -48,6 +76,23 @@ class ADWError(Exception):
             "timestamp": self.timestamp.isoformat(),
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize exception straight to UTF-8 JSON for log pipelines.
+
+        Same fields as ``to_dict``. Uses orjson when installed; non-JSON context
+        values are rendered with ``str``.
+        """
+        payload = {
+            "error_type": self.__class__.__name__,
+            "message": self.message,
+            "context": self.context,
+            "correlation_id": self.correlation_id,
+            "timestamp": self.timestamp.isoformat(),
+        }
+        if orjson is not None:
+            return orjson.dumps(payload, default=str)
+        return json.dumps(payload, default=str).encode("utf-8")
+
 
 # =============================================================================
 # Validation & Input Errors
@@ -72,9 +117,7 @@ class ValidationError(ADWError):
             field: Name of field that failed validation
             **context: Additional context (expected_type, actual_value, etc.)
         """
-        if field:
-            context["field"] = field
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(context, field=field))
 
 
 class StateError(ADWError):
@@ -96,9 +139,7 @@ class StateError(ADWError):
             adw_id: ADW ID associated with problematic state
             **context: Additional context (state_path, missing_fields, etc.)
         """
-        if adw_id:
-            context["adw_id"] = adw_id
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(context, adw_id=adw_id))
 
 
 # =============================================================================
@@ -133,13 +174,12 @@ class GitOperationError(ADWError):
             stderr: Error output from git
             **context: Additional context (branch_name, commit_sha, etc.)
         """
-        if command:
-            context["command"] = command
-        if returncode is not None:
-            context["returncode"] = returncode
-        if stderr:
-            context["stderr"] = stderr
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(
+            context,
+            command=command,
+            returncode=returncode,
+            stderr=stderr,
+        ))
 
 
 class GitHubAPIError(ADWError):
@@ -168,11 +208,11 @@ class GitHubAPIError(ADWError):
             api_endpoint: GitHub API endpoint that failed
             **context: Additional context (repo_path, issue_number, etc.)
         """
-        if status_code:
-            context["status_code"] = status_code
-        if api_endpoint:
-            context["api_endpoint"] = api_endpoint
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(
+            context,
+            status_code=status_code,
+            api_endpoint=api_endpoint,
+        ))
 
 
 # =============================================================================
@@ -207,13 +247,12 @@ class AgentError(ADWError):
             session_id: Claude Code session ID if available
             **context: Additional context (output_file, model, etc.)
         """
-        if agent_name:
-            context["agent_name"] = agent_name
-        if slash_command:
-            context["slash_command"] = slash_command
-        if session_id:
-            context["session_id"] = session_id
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(
+            context,
+            agent_name=agent_name,
+            slash_command=slash_command,
+            session_id=session_id,
+        ))
 
 
 class WorkflowError(ADWError):
@@ -242,11 +281,11 @@ class WorkflowError(ADWError):
             step: Specific step that failed
             **context: Additional context (adw_id, issue_number, etc.)
         """
-        if workflow_name:
-            context["workflow_name"] = workflow_name
-        if step:
-            context["step"] = step
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(
+            context,
+            workflow_name=workflow_name,
+            step=step,
+        ))
 
 
 # =============================================================================
@@ -279,11 +318,11 @@ class TokenLimitError(ADWError):
             tokens_available: Number of tokens available
             **context: Additional context (model, prompt_size, etc.)
         """
-        if tokens_requested:
-            context["tokens_requested"] = tokens_requested
-        if tokens_available:
-            context["tokens_available"] = tokens_available
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(
+            context,
+            tokens_requested=tokens_requested,
+            tokens_available=tokens_available,
+        ))
 
 
 class RateLimitError(ADWError):
@@ -312,11 +351,11 @@ class RateLimitError(ADWError):
             limit_type: Type of limit (github, anthropic, etc.)
             **context: Additional context (requests_remaining, reset_time, etc.)
         """
-        if retry_after:
-            context["retry_after"] = retry_after
-        if limit_type:
-            context["limit_type"] = limit_type
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(
+            context,
+            retry_after=retry_after,
+            limit_type=limit_type,
+        ))
 
 
 # =============================================================================
@@ -347,9 +386,7 @@ class EnvironmentError(ADWError):
             missing_vars: List of missing environment variables
             **context: Additional context (required_tools, config_file, etc.)
         """
-        if missing_vars:
-            context["missing_vars"] = missing_vars
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(context, missing_vars=missing_vars))
 
 
 class FileSystemError(ADWError):
@@ -379,17 +416,47 @@ class FileSystemError(ADWError):
             operation: Operation that failed (read, write, mkdir, etc.)
             **context: Additional context (permissions, disk_space, etc.)
         """
-        if path:
-            context["path"] = path
-        if operation:
-            context["operation"] = operation
-        super().__init__(message, context)
+        super().__init__(message, _merge_context(
+            context,
+            path=path,
+            operation=operation,
+        ))
 
 
 # =============================================================================
 # Error Handler Utilities
 # =============================================================================
 
+# GitHub comments are posted off the error path so handle_error never blocks
+# on a gh round-trip. Worker threads are joined at interpreter exit, so queued
+# comments are still delivered.
+_comment_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gh-comment")
+
+
+# Resolved on first use; importing at module load would be circular
+_make_issue_comment = None
+_format_issue_message = None
+
+
+def _comment_helpers():
+    """Return (make_issue_comment, format_issue_message), importing once."""
+    global _make_issue_comment, _format_issue_message
+
+    if _make_issue_comment is None:
+        from adw_modules.github import make_issue_comment
+        from adw_modules.workflow_ops import format_issue_message
+        _make_issue_comment, _format_issue_message = make_issue_comment, format_issue_message
+
+    return _make_issue_comment, _format_issue_message
+
+
+def _log_comment_failure(logger: logging.Logger, future: Future) -> None:
+    """Done-callback reporting a failed background GitHub comment."""
+    comment_error = future.exception()
+    if comment_error is not None:
+        logger.warning("Failed to post error to GitHub: %s", comment_error)
+
+
 def handle_error(
     error: ADWError,
     logger: logging.Logger,
@@ -398,6 +465,10 @@ def handle_error(
 ) -> Dict[str, Any]:
     """Centralized error handling with logging and GitHub comments.
 
+    The log record carries the whole error, pre-serialized once to JSON, in a
+    single ``adw_error`` attribute; formatters can emit it with
+    ``%(adw_error)s`` without re-encoding the context.
+
     Args:
         error: The ADW error to handle
         logger: Logger instance for recording error
@@ -407,31 +478,34 @@ def handle_error(
     Returns:
         Dictionary with error details and recommended action
     """
-    # Log error with appropriate level
-    error_dict = error.to_dict()
-
     # Determine severity and log level
     if isinstance(error, (TokenLimitError, RateLimitError)):
         # Recoverable resource limits
-        logger.warning(f"{error.__class__.__name__}: {error.message}", extra=error_dict)
-        severity = "warning"
-        recoverable = True
+        level, severity, recoverable = logging.WARNING, "warning", True
     elif isinstance(error, (ValidationError, EnvironmentError)):
         # User/config issues
-        logger.error(f"{error.__class__.__name__}: {error.message}", extra=error_dict)
-        severity = "error"
-        recoverable = False
+        level, severity, recoverable = logging.ERROR, "error", False
     else:
         # System/workflow failures
-        logger.error(f"{error.__class__.__name__}: {error.message}", extra=error_dict)
-        severity = "error"
-        recoverable = True
+        level, severity, recoverable = logging.ERROR, "error", True
+
+    # Log error with appropriate level. The message and serialized error are
+    # only built when the level is enabled; the error rides along as a single
+    # extra field (to_dict keys such as "message" would clash with LogRecord
+    # attributes)
+    if logger.isEnabledFor(level):
+        logger.log(
+            level,
+            "%s: %s",
+            error.__class__.__name__,
+            error.message,
+            extra={"adw_error": error.to_json_bytes().decode("utf-8")},
+        )
 
     # Post to GitHub if issue number provided
     if issue_number and adw_id:
         try:
-            from adw_modules.github import make_issue_comment
-            from adw_modules.workflow_ops import format_issue_message
+            make_issue_comment, format_issue_message = _comment_helpers()
 
             error_emoji = "⚠️" if recoverable else "❌"
             comment = format_issue_message(
@@ -439,9 +513,10 @@ def handle_error(
                 "error_handler",
                 f"{error_emoji} {error.__class__.__name__}: {error.message}"
             )
-            make_issue_comment(issue_number, comment)
+            future = _comment_executor.submit(make_issue_comment, issue_number, comment)
+            future.add_done_callback(functools.partial(_log_comment_failure, logger))
         except Exception as comment_error:
-            logger.warning(f"Failed to post error to GitHub: {comment_error}")
+            logger.warning("Failed to post error to GitHub: %s", comment_error)
 
     return {
         "error_type": error.__class__.__name__,
@@ -453,6 +528,36 @@ def handle_error(
     }
 
 
+def _environment_strategy(error: ADWError) -> str:
+    missing = error.context.get("missing_vars", [])
+    if missing:
+        return f"Set required environment variables: {', '.join(missing)}"
+    return "Check environment configuration and required tools."
+
+
+# Recovery instructions keyed by exception type (resolved through the MRO)
+_RECOVERY_STRATEGIES = {
+    GitOperationError: lambda e: (
+        "Run 'git status' to check repository state. "
+        "Consider 'git reset --hard' to recover."
+    ),
+    TokenLimitError: lambda e: "Reduce input size or chunk operation into smaller requests.",
+    RateLimitError: lambda e: (
+        f"Wait {e.context.get('retry_after', 60)} seconds before retrying. "
+        "Consider implementing exponential backoff."
+    ),
+    StateError: lambda e: "Check state file integrity or recreate from git history.",
+    ValidationError: lambda e: (
+        f"Fix validation error in field '{e.context.get('field', 'unknown')}' and retry."
+    ),
+    EnvironmentError: _environment_strategy,
+    AgentError: lambda e: (
+        "Check agent logs for details. Consider retrying with different parameters."
+    ),
+    WorkflowError: lambda e: "Review workflow state and resolve dependencies before continuing.",
+}
+
+
 def get_recovery_strategy(error: ADWError) -> str:
     """Get recommended recovery strategy for error type.
 
@@ -462,34 +567,9 @@ def get_recovery_strategy(error: ADWError) -> str:
     Returns:
         Human-readable recovery instructions
     """
-    if isinstance(error, GitOperationError):
-        return "Run 'git status' to check repository state. Consider 'git reset --hard' to recover."
-
-    elif isinstance(error, TokenLimitError):
-        return "Reduce input size or chunk operation into smaller requests."
-
-    elif isinstance(error, RateLimitError):
-        retry_after = error.context.get("retry_after", 60)
-        return f"Wait {retry_after} seconds before retrying. Consider implementing exponential backoff."
-
-    elif isinstance(error, StateError):
-        return "Check state file integrity or recreate from git history."
-
-    elif isinstance(error, ValidationError):
-        field = error.context.get("field", "unknown")
-        return f"Fix validation error in field '{field}' and retry."
+    for cls in type(error).__mro__:
+        strategy = _RECOVERY_STRATEGIES.get(cls)
+        if strategy is not None:
+            return strategy(error)
 
-    elif isinstance(error, EnvironmentError):
-        missing = error.context.get("missing_vars", [])
-        if missing:
-            return f"Set required environment variables: {', '.join(missing)}"
-        return "Check environment configuration and required tools."
-
-    elif isinstance(error, AgentError):
-        return "Check agent logs for details. Consider retrying with different parameters."
-
-    elif isinstance(error, WorkflowError):
-        return "Review workflow state and resolve dependencies before continuing."
-
-    else:
-        return "Check logs for details and contact support if issue persists."
+    return "Check logs for details and contact support if issue persists."
@@ -10,11 +10,160 @@ This module addresses the scattered output problem by providing:
 """
 
 import os
+import re
 import json
+import fnmatch
+import functools
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Root-level output patterns picked up by consolidate_scattered_files
+_SCATTERED_PATTERNS = [
+    ("*.md", "Root markdown files"),
+    ("MEOW_*.md", "MEOW loader files"),
+    ("*_relevant_files.json", "Scout outputs"),
+    ("*-build-report.md", "Build reports"),
+    ("*-review.md", "Review files")
+]
+_SCATTERED_RE = re.compile("|".join(
+    f"(?P<p{i}>{fnmatch.translate(pattern)})"
+    for i, (pattern, _) in enumerate(_SCATTERED_PATTERNS)
+))
+_EXPECTED_ROOT_FILES = frozenset({"README.md", "CLAUDE.md", "WHERE_ARE_THE_PLANS.md"})
+
+# Write buffer for streamed markdown outputs
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Anything other than alphanumerics, "-" and "_" becomes "_" in task dir names
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w-]")
+
+
+@functools.lru_cache(maxsize=4)
+def _dir_stamp(epoch_seconds: int) -> str:
+    """Directory-name stamp for one wall-clock second.
+
+    Bursts of task directories created within the same second reuse the
+    formatted stamp instead of re-formatting it per call.
+    """
+    return datetime.fromtimestamp(epoch_seconds).strftime("%Y%m%d-%H%M%S")
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON in a single call."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+@contextmanager
+def _replacing(path: str) -> Iterator[str]:
+    """Yield a temp path that atomically replaces ``path`` on success.
+
+    Readers never observe a truncated or half-written output; on failure the
+    temp file is removed and ``path`` is left untouched. The temp name carries
+    the thread id as well as the pid, so concurrent writers of one target
+    never share a temp file.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    """Atomically write an already-encoded payload with raw fd calls."""
+    with _replacing(path) as tmp:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def _write_chunks(path: str, chunks: Iterable[str]) -> None:
+    """Atomically stream text chunks to a file through a large write buffer."""
+    with _replacing(path) as tmp:
+        with open(tmp, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8"))
+
+
+def _mirror_file(src: str, dst: str) -> None:
+    """Atomically copy a just-written output to its second location.
+
+    shutil.copyfile copies in-kernel (sendfile) on Linux, so the payload is
+    not re-encoded or pushed through Python again. A hardlink would be
+    cheaper still, but legacy paths such as scout_outputs/relevant_files.json
+    are rewritten in place by other workflows, which would silently modify
+    the task-dir copy through the shared inode.
+    """
+    with _replacing(dst) as tmp:
+        shutil.copyfile(src, tmp)
+
+
+# Threads used to delete stale task directories concurrently
+_CLEANUP_WORKERS = 8
+
+# Directory-relative (*at) syscalls are POSIX-only; elsewhere use shutil.rmtree
+_FD_REMOVAL_SUPPORTED = (
+    {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+
+
+def _remove_tree_at(dir_fd: int, name: str) -> None:
+    """Remove directory ``name`` beneath the open ``dir_fd``.
+
+    Every unlink/rmdir is relative to an already-open directory handle, so no
+    path is re-resolved per file. Symlinks are removed, never followed.
+    """
+    fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=dir_fd)
+    try:
+        with os.scandir(fd) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    _remove_tree_at(fd, entry.name)
+                else:
+                    os.unlink(entry.name, dir_fd=fd)
+    finally:
+        os.close(fd)
+    os.rmdir(name, dir_fd=dir_fd)
+
+
+def _holds_payload(path: str, payload: bytes) -> bool:
+    """Check whether ``path`` already contains exactly ``payload``.
+
+    The size is compared first, so a changed file is usually rejected without
+    reading it.
+    """
+    try:
+        if os.stat(path).st_size != len(payload):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == payload
+    except FileNotFoundError:
+        return False
+
 
 class FileOrganizer:
     """Manages standardized file output for ADW workflows."""
@@ -22,7 +171,6 @@ class FileOrganizer:
     def __init__(self, base_dir: str = "ai_docs/outputs"):
         """Initialize with base output directory."""
         self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(parents=True, exist_ok=True)
 
         # Legacy directories for compatibility
         self.legacy_dirs = {
@@ -32,8 +180,12 @@ class FileOrganizer:
             "reviews": Path("ai_docs/reviews")
         }
 
-        # Ensure legacy dirs exist
-        for dir_path in self.legacy_dirs.values():
+        # String forms of the legacy dirs; save_* joins filenames onto these
+        # instead of building intermediate Path objects
+        self._legacy_dir_strs = {k: os.fspath(v) for k, v in self.legacy_dirs.items()}
+
+        # Ensure output and legacy dirs exist
+        for dir_path in (self.base_dir, *self.legacy_dirs.values()):
             dir_path.mkdir(parents=True, exist_ok=True)
 
     def create_task_directory(self,
@@ -49,12 +201,14 @@ class FileOrganizer:
         Returns:
             Path to the created directory
         """
-        # Generate timestamp
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        # Generate timestamp (one clock read shared with the metadata, whose
+        # "created" keeps microseconds so directories sort by creation)
+        now = time.time()
+        timestamp = _dir_stamp(int(now))
+        created = datetime.fromtimestamp(now).isoformat()
 
         # Clean task name for filesystem
-        clean_name = "".join(c if c.isalnum() or c in "-_" else "_"
-                            for c in task_name.lower())[:50]
+        clean_name = _UNSAFE_NAME_CHARS.sub("_", task_name.lower())[:50]
 
         # Build directory name
         if adw_id:
@@ -64,19 +218,19 @@ class FileOrganizer:
 
         # Create directory
         task_dir = self.base_dir / dir_name
-        task_dir.mkdir(parents=True, exist_ok=True)
+        task_dir_str = os.fspath(task_dir)
+        os.makedirs(task_dir_str, exist_ok=True)
 
         # Create metadata file
         metadata = {
-            "created": datetime.now().isoformat(),
+            "created": created,
             "task": task_name,
             "adw_id": adw_id,
             "timestamp": timestamp,
-            "directory": str(task_dir)
+            "directory": task_dir_str
         }
 
-        with open(task_dir / "metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
+        _atomic_write(os.path.join(task_dir_str, "metadata.json"), _json_bytes(metadata))
 
         # Update latest symlink
         self._update_latest_link(task_dir)
@@ -101,18 +255,20 @@ class FileOrganizer:
         if task_dir is None:
             task_dir = self.create_task_directory("scout-operation")
 
+        payload = _json_bytes(data)
+
         # Save to task directory
-        output_file = task_dir / "scout.json"
-        with open(output_file, "w") as f:
-            json.dump(data, f, indent=2)
+        output_file = os.path.join(task_dir, "scout.json")
+        _atomic_write(output_file, payload)
 
-        # Also save to legacy location for compatibility
+        # Also save to legacy location for compatibility, skipping the copy
+        # when it already holds this exact payload (idempotent reruns)
         if also_legacy:
-            legacy_file = self.legacy_dirs["scout"] / "relevant_files.json"
-            with open(legacy_file, "w") as f:
-                json.dump(data, f, indent=2)
+            legacy_file = os.path.join(self._legacy_dir_strs["scout"], "relevant_files.json")
+            if not _holds_payload(legacy_file, payload):
+                _mirror_file(output_file, legacy_file)
 
-        return output_file
+        return Path(output_file)
 
     def save_plan_output(self,
                         content: str,
@@ -130,24 +286,44 @@ class FileOrganizer:
             slug: URL-friendly slug
             task_dir: Optional task directory
 
+        Returns:
+            Path to saved file
+        """
+        return self.save_plan_output_stream((content,), issue_num, adw_id, slug, task_dir)
+
+    def save_plan_output_stream(self,
+                                chunks: Iterable[str],
+                                issue_num: str,
+                                adw_id: str,
+                                slug: str,
+                                task_dir: Optional[Path] = None) -> Path:
+        """
+        Save plan/spec output from an iterable of markdown chunks.
+
+        Chunks are written as they arrive, so large plans never need to be
+        held in memory as one string.
+
+        Args:
+            chunks: Plan markdown, in order
+            issue_num: Issue number
+            adw_id: ADW identifier
+            slug: URL-friendly slug
+            task_dir: Optional task directory
+
         Returns:
             Path to saved file
         """
         # Standard spec filename
         filename = f"issue-{issue_num}-adw-{adw_id}-{slug}.md"
 
-        # Save to specs directory (primary location)
-        spec_file = self.legacy_dirs["specs"] / filename
-        with open(spec_file, "w") as f:
-            f.write(content)
-
-        # Also save to task directory if provided
+        # Save to specs directory (primary location), and to the task
+        # directory if provided
+        spec_file = os.path.join(self._legacy_dir_strs["specs"], filename)
+        _write_chunks(spec_file, chunks)
         if task_dir:
-            task_file = task_dir / "plan.md"
-            with open(task_file, "w") as f:
-                f.write(content)
+            _mirror_file(spec_file, os.path.join(task_dir, "plan.md"))
 
-        return spec_file
+        return Path(spec_file)
 
     def save_build_output(self,
                          content: str,
@@ -164,19 +340,31 @@ class FileOrganizer:
         Returns:
             Path to saved file
         """
-        # Save to legacy location
-        filename = f"{slug}-build-report.md"
-        legacy_file = self.legacy_dirs["build_reports"] / filename
-        with open(legacy_file, "w") as f:
-            f.write(content)
+        return self.save_build_output_stream((content,), slug, task_dir)
+
+    def save_build_output_stream(self,
+                                 chunks: Iterable[str],
+                                 slug: str,
+                                 task_dir: Optional[Path] = None) -> Path:
+        """
+        Save build report from an iterable of markdown chunks.
+
+        Args:
+            chunks: Build report content, in order
+            slug: URL-friendly slug
+            task_dir: Optional task directory
 
-        # Also save to task directory if provided
+        Returns:
+            Path to saved file
+        """
+        # Save to legacy location, and to the task directory if provided
+        filename = f"{slug}-build-report.md"
+        legacy_file = os.path.join(self._legacy_dir_strs["build_reports"], filename)
+        _write_chunks(legacy_file, chunks)
         if task_dir:
-            task_file = task_dir / "build-report.md"
-            with open(task_file, "w") as f:
-                f.write(content)
+            _mirror_file(legacy_file, os.path.join(task_dir, "build-report.md"))
 
-        return legacy_file
+        return Path(legacy_file)
 
     def cleanup_old_outputs(self, days: int = 7, dry_run: bool = True):
         """
@@ -188,29 +376,54 @@ class FileOrganizer:
         """
         cutoff = datetime.now().timestamp() - (days * 86400)
 
-        for task_dir in self.base_dir.iterdir():
-            if not task_dir.is_dir():
-                continue
+        # scandir answers is_dir from the directory read and caches stat()
+        stale = []
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                # Skips the latest symlink along with plain files
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
 
-            # Skip latest symlink
-            if task_dir.name == "latest":
-                continue
+                # Check age
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    stale.append(entry)
 
-            # Check age
-            if task_dir.stat().st_mtime < cutoff:
-                if dry_run:
-                    print(f"Would remove: {task_dir}")
-                else:
-                    print(f"Removing: {task_dir}")
-                    shutil.rmtree(task_dir)
+        if dry_run:
+            for entry in stale:
+                print(f"Would remove: {entry.path}")
+            return
+
+        if not stale:
+            return
+
+        # Print in scan order, then overlap the I/O-bound removals
+        for entry in stale:
+            print(f"Removing: {entry.path}")
+        workers = min(_CLEANUP_WORKERS, len(stale))
+
+        if not _FD_REMOVAL_SUPPORTED:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(shutil.rmtree, [entry.path for entry in stale]))
+            return
+
+        # One open handle on base_dir serves every removal
+        base_fd = os.open(self.base_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(functools.partial(_remove_tree_at, base_fd),
+                              [entry.name for entry in stale]))
+        finally:
+            os.close(base_fd)
 
     def _update_latest_link(self, target_dir: Path):
         """Update the 'latest' symlink to point to the most recent directory."""
         latest_link = self.base_dir / "latest"
 
-        # Remove existing symlink if present
-        if latest_link.exists() or latest_link.is_symlink():
+        # Remove existing symlink if present (dangling links included)
+        try:
             latest_link.unlink()
+        except FileNotFoundError:
+            pass
 
         # Create new symlink (relative path for portability)
         try:
@@ -231,16 +444,19 @@ class FileOrganizer:
             return latest_link.resolve()
 
         # Check text file fallback
-        latest_txt = latest_link.with_suffix(".txt")
-        if latest_txt.exists():
-            with open(latest_txt) as f:
+        try:
+            with open(latest_link.with_suffix(".txt")) as f:
                 return Path(f.read().strip())
+        except FileNotFoundError:
+            pass
 
         # Find most recent directory by timestamp
-        dirs = [d for d in self.base_dir.iterdir()
-                if d.is_dir() and d.name != "latest"]
+        with os.scandir(self.base_dir) as entries:
+            dirs = [e for e in entries
+                    if e.is_dir(follow_symlinks=False) and e.name != "latest"]
         if dirs:
-            return max(dirs, key=lambda d: d.stat().st_mtime)
+            newest = max(dirs, key=lambda e: e.stat(follow_symlinks=False).st_mtime)
+            return Path(newest.path)
 
         return None
 
@@ -250,38 +466,57 @@ class FileOrganizer:
 
         This helps clean up the mess of files in various locations.
         """
-        patterns = [
-            ("*.md", "Root markdown files"),
-            ("MEOW_*.md", "MEOW loader files"),
-            ("*_relevant_files.json", "Scout outputs"),
-            ("*-build-report.md", "Build reports"),
-            ("*-review.md", "Review files")
-        ]
-
         consolidated_dir = self.base_dir / "consolidated"
         if not dry_run:
             consolidated_dir.mkdir(exist_ok=True)
 
-        for pattern, description in patterns:
-            print(f"\nSearching for {description} ({pattern})...")
-
-            # Search in project root
-            for file in Path(".").glob(pattern):
+        # One pass over the project root; each file goes to the first pattern
+        # it matches
+        found = [[] for _ in _SCATTERED_PATTERNS]
+        with os.scandir(".") as entries:
+            for entry in entries:
                 # Skip expected files
-                if file.name in ["README.md", "CLAUDE.md", "WHERE_ARE_THE_PLANS.md"]:
+                if entry.name in _EXPECTED_ROOT_FILES:
                     continue
+                match = _SCATTERED_RE.match(entry.name)
+                if match:
+                    found[int(match.lastgroup[1:])].append(entry.name)
+
+        for i, (pattern, description) in enumerate(_SCATTERED_PATTERNS):
+            print(f"\nSearching for {description} ({pattern})...")
 
+            for name in found[i]:
                 if dry_run:
-                    print(f"  Would move: {file}")
+                    print(f"  Would move: {name}")
                 else:
-                    dest = consolidated_dir / file.name
-                    print(f"  Moving: {file} -> {dest}")
-                    shutil.move(str(file), str(dest))
+                    dest = consolidated_dir / name
+                    print(f"  Moving: {name} -> {dest}")
+                    shutil.move(name, str(dest))
+
+
+# FileOrganizer instances keyed by (cwd, base_dir); paths are cwd-relative
+_organizers: Dict[Tuple[str, str], FileOrganizer] = {}
+
+
+def get_file_organizer(base_dir: str = "ai_docs/outputs") -> FileOrganizer:
+    """Get or create the shared FileOrganizer for a base directory.
+
+    Args:
+        base_dir: Base output directory
+
+    Returns:
+        FileOrganizer instance, constructed once per process
+    """
+    key = (os.getcwd(), base_dir)
+    organizer = _organizers.get(key)
+    if organizer is None:
+        organizer = _organizers[key] = FileOrganizer(base_dir)
+    return organizer
 
 
 def setup_file_organization():
     """One-time setup to organize existing files."""
-    organizer = FileOrganizer()
+    organizer = get_file_organizer()
 
     print("=== File Organization Setup ===\n")
 
@@ -312,8 +547,8 @@ def setup_file_organization():
 def example_usage():
     """Example of how to use FileOrganizer in ADW workflows."""
 
-    # Initialize organizer
-    organizer = FileOrganizer()
+    # Get the shared organizer
+    organizer = get_file_organizer()
 
     # Create task directory for a new feature
     task_dir = organizer.create_task_directory(
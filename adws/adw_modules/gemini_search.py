@@ -19,16 +19,41 @@ Environment:
     - GEMINI_API_KEY: Required for Gemini File Search
 """
 
+import functools
+import hashlib
+import heapq
 import json
 import logging
 import os
 import re
+import shutil
 import subprocess
-from dataclasses import dataclass, field
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
+try:
+    import hyperscan
+except ImportError:
+    # hyperscan is optional; classification falls back to the compiled regexes
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; ripgrep records fall back to the stdlib decoder
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+# the stdlib exception either way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Lazy imports for optional dependencies
 _gemini_available: Optional[bool] = None
 
@@ -54,6 +79,22 @@ def _check_gemini_available() -> bool:
         return False
 
 
+# Characters that make a ripgrep query a regex rather than a plain literal
+_REGEX_METACHARS = frozenset(".*+?[](){}|^$\\")
+
+# Seconds before a ripgrep search is killed
+RIPGREP_TIMEOUT = 30
+
+# Matches per file kept for hybrid ranking; merging only keeps 3 per file
+RIPGREP_MATCHES_PER_FILE = 3
+
+
+def _kill_on_timeout(proc: subprocess.Popen, timed_out: threading.Event) -> None:
+    """Kill a still-running search process and record that it timed out."""
+    timed_out.set()
+    proc.kill()
+
+
 class QueryType(Enum):
     """Classification of query types for routing."""
     CONCEPTUAL = "conceptual"  # Semantic understanding needed
@@ -61,7 +102,7 @@ class QueryType(Enum):
     HYBRID = "hybrid"          # Both approaches useful
 
 
-@dataclass
+@dataclass(slots=True)
 class Snippet:
     """A code snippet result from search."""
     file_path: str
@@ -71,12 +112,22 @@ class Snippet:
     score: float = 1.0
     source: str = "unknown"  # "gemini", "ripgrep", or "merged"
     metadata: dict = field(default_factory=dict)
+    # Hash of the identity fields, computed once; treat those fields as
+    # read-only after construction
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._hash = hash((self.file_path, self.line_start, self.line_end))
 
     def __hash__(self):
-        return hash((self.file_path, self.line_start, self.line_end))
+        return self._hash
+
 
+# Constructor fields of Snippet, used to serialize cached results
+_SNIPPET_INIT_FIELDS = tuple(f.name for f in fields(Snippet) if f.init)
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchResult:
     """Result of a hybrid search operation."""
     query: str
@@ -87,6 +138,25 @@ class SearchResult:
     sources_used: list[str] = field(default_factory=list)
     gemini_response_text: str = ""
 
+    # Column views of snippets; each access builds a fresh list over all
+    # snippets, so slice ``snippets`` first in hot paths
+
+    @property
+    def paths(self) -> list[str]:
+        return [s.file_path for s in self.snippets]
+
+    @property
+    def lines(self) -> list[int]:
+        return [s.line_start for s in self.snippets]
+
+    @property
+    def sources(self) -> list[str]:
+        return [s.source for s in self.snippets]
+
+    @property
+    def contents(self) -> list[str]:
+        return [s.content for s in self.snippets]
+
 
 # Query classification patterns
 CONCEPTUAL_PATTERNS = [
@@ -117,7 +187,121 @@ LITERAL_PATTERNS = [
     r'^def\s+\w+$',                # Just "def foo"
 ]
 
+# Each list compiled once into a single alternation, so classification is one
+# regex pass per tier instead of one search per pattern
+_CONCEPTUAL_RE = re.compile(
+    "|".join(f"(?:{p})" for p in CONCEPTUAL_PATTERNS), re.IGNORECASE
+)
+_LITERAL_RE = re.compile(
+    "|".join(f"(?:{p})" for p in LITERAL_PATTERNS), re.IGNORECASE
+)
+
+
+
+# Every CONCEPTUAL_PATTERNS entry needs one of these substrings to match an
+# ASCII query; keep in sync when adding patterns
+_CONCEPTUAL_KEYWORDS = (
+    "how", "what", "why", "where", "explain", "understand", "similar",
+    "pattern", "convention", "affect", "work", "architecture", "design",
+    "implemented", "related",
+)
+
+# Plain-string equivalents of some LITERAL_PATTERNS entries
+_GLOB_CHARS = "*?[]"
+_CLI_PREFIXES = ("grep ", "rg ", "find ")
 
+
+def _is_quoted(query: str) -> bool:
+    """Cheap check for a query that is entirely quoted (single line)."""
+    return (len(query) >= 2 and query[0] in "\"'" and query[-1] in "\"'" and
+            "\n" not in query)
+
+
+def _compile_classifier_db():
+    """Compile both pattern tiers into one hyperscan database.
+
+    Pattern ids below len(CONCEPTUAL_PATTERNS) are conceptual, the rest are
+    literal. Returns None when hyperscan is unavailable or rejects a pattern.
+    """
+    if hyperscan is None:
+        return None
+
+    patterns = CONCEPTUAL_PATTERNS + LITERAL_PATTERNS
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags,
+        )
+        return db
+    except hyperscan.error as e:
+        logging.debug(f"hyperscan classifier unavailable: {e}")
+        return None
+
+
+_CLASSIFIER_DB = _compile_classifier_db()
+
+# hyperscan scratch space must not be shared between concurrent scans
+_scratch = threading.local()
+
+
+def _classify_with_hyperscan(query: str) -> Optional[QueryType]:
+    """Classify with the hyperscan database, or None if it cannot be used."""
+    # \b and \w are ASCII-only in hyperscan (UCP mode rejects \b), so leave
+    # non-ASCII queries to the Unicode-aware re module
+    if not query.isascii():
+        return None
+    data = query.encode("ascii")
+
+    scratch = getattr(_scratch, "value", None)
+    if scratch is None:
+        scratch = _scratch.value = hyperscan.Scratch(_CLASSIFIER_DB)
+
+    matched = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        matched.append(pattern_id)
+        # A conceptual match decides the result; stop scanning
+        return pattern_id < len(CONCEPTUAL_PATTERNS)
+
+    try:
+        _CLASSIFIER_DB.scan(data, match_event_handler=on_match, scratch=scratch)
+    except hyperscan.ScanTerminated:
+        pass
+
+    if any(i < len(CONCEPTUAL_PATTERNS) for i in matched):
+        return QueryType.CONCEPTUAL
+    if matched:
+        return QueryType.LITERAL
+    return QueryType.HYBRID
+
+
+# Literal-pattern extraction in one search. Each branch is anchored at the
+# start and scans forward lazily, so branches are tried in priority order
+# (quoted text first) rather than by leftmost match position.
+_EXTRACT_RE = re.compile(
+    r'^(?:'
+    r'.*?["\'](?P<quoted>[^"\']+)["\']'     # "'API_KEY'"
+    r'|.*?function\s+(?P<fn>\w+)'           # "function foo"
+    r'|.*?class\s+(?P<cls>\w+)'             # "class Foo"
+    r'|.*?def\s+(?P<df>\w+)'                # "def foo"
+    r'|.*?usages?\s+of\s+(?P<us>\w+)'       # "usages of foo"
+    r'|.*?find\s+(?P<fd>\w+)'               # "find foo"
+    r')',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Words dropped when falling back to keyword search
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'where', 'what', 'how',
+    'find', 'search', 'for', 'in', 'of', 'to', 'and', 'or',
+})
+
+
+@functools.lru_cache(maxsize=2048)
 def classify_query(query: str) -> QueryType:
     """Classify a query to determine routing strategy.
 
@@ -127,43 +311,182 @@ def classify_query(query: str) -> QueryType:
     Returns:
         QueryType indicating how to route the query
     """
-    query_lower = query.lower().strip()
+    # Cheap pre-checks: if no conceptual keyword occurs, settle obvious
+    # literal syntax with plain string tests and skip the conceptual scan
+    if query.isascii():
+        lowered = query.lower()
+        if not any(keyword in lowered for keyword in _CONCEPTUAL_KEYWORDS):
+            if (any(ch in query for ch in _GLOB_CHARS) or
+                    lowered.startswith(_CLI_PREFIXES) or
+                    _is_quoted(query)):
+                return QueryType.LITERAL
+            if _LITERAL_RE.search(query):
+                return QueryType.LITERAL
+            return QueryType.HYBRID
+
+    if _CLASSIFIER_DB is not None:
+        query_type = _classify_with_hyperscan(query)
+        if query_type is not None:
+            return query_type
 
     # Check for conceptual indicators FIRST (questions, understanding)
-    for pattern in CONCEPTUAL_PATTERNS:
-        if re.search(pattern, query_lower):
-            return QueryType.CONCEPTUAL
+    if _CONCEPTUAL_RE.search(query):
+        return QueryType.CONCEPTUAL
 
     # Check for literal indicators (explicit patterns, quotes)
-    for pattern in LITERAL_PATTERNS:
-        if re.search(pattern, query, re.IGNORECASE):
-            return QueryType.LITERAL
+    if _LITERAL_RE.search(query):
+        return QueryType.LITERAL
 
     # Default to hybrid for ambiguous queries
     return QueryType.HYBRID
 
 
+# Language names accepted by hybrid_search mapped to ripgrep file types
+_LANGUAGE_TO_RG_TYPE = {
+    "python": "py",
+    "javascript": "js",
+    "typescript": "ts",
+    "java": "java",
+    "go": "go",
+    "rust": "rust",
+    "c": "c",
+    "cpp": "cpp",
+    "markdown": "md",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _build_metadata_filter(
+    path_filter: Optional[str],
+    language_filter: Optional[str]
+) -> Optional[str]:
+    """Build the AIP-160 metadata filter for a Gemini search.
+
+    Args:
+        path_filter: Optional path prefix filter
+        language_filter: Optional language filter (e.g., "python")
+
+    Returns:
+        Filter string, or None when no filters apply
+    """
+    metadata_parts = []
+    if path_filter:
+        metadata_parts.append(f'path_prefix = "{path_filter}"')
+    if language_filter:
+        metadata_parts.append(f'language = "{language_filter}"')
+    return " AND ".join(metadata_parts) if metadata_parts else None
+
+
+def _grounding_snippets(chunks: list, limit: int) -> list[Snippet]:
+    """Convert Gemini grounding chunks into snippets, best first.
+
+    Args:
+        chunks: ``grounding_metadata.grounding_chunks`` from a response
+        limit: Maximum number of chunks to convert
+
+    Returns:
+        Snippets scored by position (1.0, 0.9, ...)
+    """
+    chunks = chunks[:limit]
+    scores = [1.0 - (i * 0.1) for i in range(len(chunks))]  # Decay by position
+
+    snippets = []
+    for chunk, score in zip(chunks, scores):
+        try:
+            ctx = chunk.retrieved_context
+        except AttributeError:
+            continue
+
+        # SDK contexts always carry all three fields; only fall back to
+        # per-field defaults for unexpected objects
+        try:
+            title, uri, text = ctx.title, ctx.uri, ctx.text
+        except AttributeError:
+            title = getattr(ctx, 'title', 'Unknown')
+            uri = getattr(ctx, 'uri', '')
+            text = getattr(ctx, 'text', '')
+
+        snippets.append(Snippet(
+            file_path=title,
+            content=text[:500] if text else "",
+            score=score,
+            source="gemini",
+            metadata={"uri": uri}
+        ))
+    return snippets
+
+
+# Simple heuristic for file paths mentioned in Gemini response text. The
+# trailing \b keeps "x.json" from matching as "x.js" and rejects "x.pyc".
+_FILE_PATTERN = re.compile(
+    r'[a-zA-Z_][a-zA-Z0-9_/.-]*\.(?:py|js|ts|md|yaml|json)\b'
+)
+
+
+def _add_file_mentions(snippets: list[Snippet], text: str, limit: int) -> None:
+    """Append files mentioned in text to snippets until limit is reached.
+
+    Args:
+        snippets: Results so far; extended in place
+        text: Free-form response text to scan
+        limit: Maximum total number of snippets
+    """
+    # Every path needs an extension dot; skip the regex scan without one
+    if len(snippets) >= limit or '.' not in text:
+        return
+
+    seen = {s.file_path for s in snippets}
+    for match in _FILE_PATTERN.finditer(text):
+        file_path = match.group()
+        if file_path in seen:
+            continue
+        seen.add(file_path)
+        snippets.append(Snippet(
+            file_path=file_path,
+            content="(mentioned in response)",
+            score=0.5,
+            source="gemini",
+        ))
+        if len(snippets) >= limit:
+            break
+
+
 class HybridSearchClient:
     """Client for hybrid semantic + literal code search."""
 
     # Default state file location
     DEFAULT_STATE_FILE = "scout_outputs/.gemini_index_state.json"
 
+    # Default Gemini response cache location, lifetime and size bounds
+    DEFAULT_CACHE_DIR = "scout_outputs/.gemini_cache"
+    CACHE_TTL_SECONDS = 3600
+    CACHE_MAX_ENTRIES = 256
+    CACHE_MAX_BYTES = 8 * 1024 * 1024
+
     def __init__(
         self,
         state_file: Optional[str] = None,
-        project_root: Optional[str] = None
+        project_root: Optional[str] = None,
+        cache_dir: Optional[str] = None
     ):
         """Initialize the hybrid search client.
 
         Args:
             state_file: Path to the Gemini index state file
             project_root: Root directory for ripgrep searches
+            cache_dir: Directory for cached Gemini search results
         """
         self.project_root = project_root or os.getcwd()
         self.state_file = state_file or os.path.join(
             self.project_root, self.DEFAULT_STATE_FILE
         )
+        self.cache_dir = cache_dir or os.path.join(
+            self.project_root, self.DEFAULT_CACHE_DIR
+        )
+
+        # Resolve ripgrep once; per-match paths are made relative by prefix
+        self._rg_path = shutil.which("rg")
+        self._project_root_prefix = self.project_root.rstrip('/') + '/'
 
         self._gemini_client = None
         self._store_name = None
@@ -222,6 +545,12 @@ class HybridSearchClient:
             logging.debug("Gemini not available, skipping semantic search")
             return []
 
+        cache_key = self._gemini_cache_key(query, metadata_filter, limit)
+        cached = self._read_gemini_cache(cache_key)
+        if cached is not None:
+            logging.debug(f"Gemini search served {len(cached)} results from cache")
+            return cached
+
         try:
             from google.genai import types
 
@@ -252,51 +581,114 @@ class HybridSearchClient:
                 response.candidates[0].grounding_metadata):
 
                 grounding = response.candidates[0].grounding_metadata
+                chunks = getattr(grounding, 'grounding_chunks', None)
+                if chunks:
+                    snippets.extend(_grounding_snippets(chunks, limit))
 
-                if hasattr(grounding, 'grounding_chunks') and grounding.grounding_chunks:
-                    for i, chunk in enumerate(grounding.grounding_chunks[:limit]):
-                        if hasattr(chunk, 'retrieved_context'):
-                            ctx = chunk.retrieved_context
-                            title = getattr(ctx, 'title', 'Unknown')
-                            uri = getattr(ctx, 'uri', '')
-                            text = getattr(ctx, 'text', '')
-
-                            snippets.append(Snippet(
-                                file_path=title,
-                                content=text[:500] if text else "",
-                                score=1.0 - (i * 0.1),  # Decay by position
-                                source="gemini",
-                                metadata={"uri": uri}
-                            ))
-
-            # Also extract any file mentions from the response text
-            if response.text:
-                # Simple heuristic: look for file paths in response
-                file_pattern = r'[`"]?([a-zA-Z_][a-zA-Z0-9_/.-]+\.(py|js|ts|md|yaml|json))[`"]?'
-                matches = re.findall(file_pattern, response.text)
-                for match in matches[:limit - len(snippets)]:
-                    file_path = match[0]
-                    if not any(s.file_path == file_path for s in snippets):
-                        snippets.append(Snippet(
-                            file_path=file_path,
-                            content="(mentioned in response)",
-                            score=0.5,
-                            source="gemini",
-                        ))
+            # Also extract any file mentions from the response text, unless
+            # grounding chunks already filled the limit (skips building and
+            # scanning response.text entirely)
+            if len(snippets) < limit and response.text:
+                _add_file_mentions(snippets, response.text, limit)
 
             logging.debug(f"Gemini search returned {len(snippets)} results")
+            if snippets:
+                self._write_gemini_cache(cache_key, snippets)
             return snippets
 
         except Exception as e:
             logging.warning(f"Gemini search failed: {e}")
             return []
 
+    def _gemini_cache_key(
+        self,
+        query: str,
+        metadata_filter: Optional[str],
+        limit: int
+    ) -> str:
+        """Build the cache key for a Gemini search."""
+        raw = f"{self._store_name}|{query}|{metadata_filter}|{limit}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _read_gemini_cache(self, key: str) -> Optional[list[Snippet]]:
+        """Load unexpired cached Gemini results, or None on a miss.
+
+        Expired entries are deleted as they are found.
+        """
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            if entry["expires"] < time.time():
+                os.unlink(path)
+                return None
+            return [Snippet(**data) for data in entry["snippets"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_gemini_cache(self, key: str, snippets: list[Snippet]) -> None:
+        """Store Gemini results; failures only cost a future cache miss."""
+        entry = {
+            "expires": time.time() + self.CACHE_TTL_SECONDS,
+            "snippets": [
+                {name: getattr(s, name) for name in _SNIPPET_INIT_FIELDS}
+                for s in snippets
+            ],
+        }
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+            tmp_path = None
+            self._prune_gemini_cache()
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug(f"Could not cache Gemini results: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _prune_gemini_cache(self) -> None:
+        """Delete expired entries, then the oldest beyond the count/size bounds."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+
+        entries.sort(reverse=True)
+        stale_before = time.time() - self.CACHE_TTL_SECONDS
+        kept = total = 0
+        for mtime, size, path in entries:
+            if (
+                mtime >= stale_before
+                and kept < self.CACHE_MAX_ENTRIES
+                and total + size <= self.CACHE_MAX_BYTES
+            ):
+                kept += 1
+                total += size
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
     def search_ripgrep(
         self,
         query: str,
         path: Optional[str] = None,
         file_type: Optional[str] = None,
-        limit: int = 10
+        limit: int = 10,
+        max_per_file: Optional[int] = None
     ) -> list[Snippet]:
         """Search using ripgrep for literal matches.
 
@@ -305,20 +697,38 @@ class HybridSearchClient:
             path: Optional subdirectory to search in
             file_type: Optional file type filter (e.g., "py", "js")
             limit: Maximum number of results
+            max_per_file: Optional cap on matches kept from any one file
 
         Returns:
             List of Snippet results
         """
+        if not self._rg_path:
+            logging.warning("ripgrep not installed, skipping literal search")
+            return []
+
         try:
+            # Plain-text output is much smaller than --json; only regex
+            # queries need the structured submatch records
+            use_json = any(c in _REGEX_METACHARS for c in query)
+
             # Build ripgrep command
-            cmd = ["rg", "--json", "-m", str(limit)]
+            # rg's -m is a per-file count, so it also enforces max_per_file
+            per_file = min(limit, max_per_file) if max_per_file else limit
+            cmd = [self._rg_path, "--no-config", "--no-messages", "-m", str(per_file)]
+            if use_json:
+                cmd.append("--json")
+                parse_line = self._parse_ripgrep_json
+            else:
+                cmd.extend(["-n", "-H", "--no-heading", "--null", "--color=never"])
+                parse_line = self._parse_ripgrep_text
 
             # Add file type filter
             if file_type:
                 cmd.extend(["-t", file_type])
 
-            # Add case insensitivity for convenience
-            cmd.append("-i")
+            # Smart case: lowercase queries match any case, while symbols like
+            # "UserService" match exactly and keep rg on its fast literal path
+            cmd.append("-S")
 
             # Add the pattern
             cmd.append(query)
@@ -327,52 +737,54 @@ class HybridSearchClient:
             search_path = path or self.project_root
             cmd.append(search_path)
 
-            # Execute
-            result = subprocess.run(
+            # Stream matches so we can stop reading once limit is reached
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=30
+                bufsize=1
+            )
+            timed_out = threading.Event()
+            timer = threading.Timer(
+                RIPGREP_TIMEOUT, _kill_on_timeout, args=(proc, timed_out)
             )
+            timer.start()
 
             snippets = []
-
-            # Parse JSON output
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                try:
-                    data = json.loads(line)
-                    if data.get("type") == "match":
-                        match_data = data.get("data", {})
-                        path_data = match_data.get("path", {})
-                        lines_data = match_data.get("lines", {})
-                        submatches = match_data.get("submatches", [])
-
-                        file_path = path_data.get("text", "")
-                        line_num = match_data.get("line_number", 0)
-                        text = lines_data.get("text", "").strip()
-
-                        # Make path relative to project root
-                        if file_path.startswith(self.project_root):
-                            file_path = file_path[len(self.project_root):].lstrip('/')
-
-                        snippets.append(Snippet(
-                            file_path=file_path,
-                            content=text,
-                            line_start=line_num,
-                            line_end=line_num,
-                            score=1.0 if submatches else 0.8,
-                            source="ripgrep",
-                            metadata={"submatches": len(submatches)}
-                        ))
-
-                        if len(snippets) >= limit:
-                            break
-
-                except json.JSONDecodeError:
-                    continue
+            seen: set[tuple[str, int]] = set()
+            per_file_counts: dict[str, int] = {}
+
+            try:
+                for line in proc.stdout:
+                    if not line.strip():
+                        continue
+
+                    snippet = parse_line(line)
+                    if snippet is None:
+                        continue
+
+                    # Drop repeated lines and files already at their cap
+                    key = (snippet.file_path, snippet.line_start)
+                    if key in seen:
+                        continue
+                    count = per_file_counts.get(snippet.file_path, 0)
+                    if max_per_file and count >= max_per_file:
+                        continue
+                    seen.add(key)
+                    per_file_counts[snippet.file_path] = count + 1
+
+                    snippets.append(snippet)
+                    if len(snippets) >= limit:
+                        proc.terminate()
+                        break
+            finally:
+                proc.stdout.close()
+                proc.wait()
+                timer.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, RIPGREP_TIMEOUT)
 
             logging.debug(f"ripgrep search returned {len(snippets)} results")
             return snippets
@@ -387,6 +799,55 @@ class HybridSearchClient:
             logging.warning(f"ripgrep search failed: {e}")
             return []
 
+    def _relative_path(self, file_path: str) -> str:
+        """Make a ripgrep result path relative to the project root."""
+        return file_path.removeprefix(self._project_root_prefix)
+
+    def _parse_ripgrep_json(self, line: str) -> Optional[Snippet]:
+        """Parse one ``rg --json`` record, returning None for non-matches."""
+        try:
+            data = _json_loads(line)
+        except json.JSONDecodeError:
+            return None
+
+        if data.get("type") != "match":
+            return None
+
+        match_data = data.get("data", {})
+        path_data = match_data.get("path", {})
+        lines_data = match_data.get("lines", {})
+        submatches = match_data.get("submatches", [])
+
+        line_num = match_data.get("line_number", 0)
+        return Snippet(
+            file_path=self._relative_path(path_data.get("text", "")),
+            content=lines_data.get("text", "").strip(),
+            line_start=line_num,
+            line_end=line_num,
+            score=1.0 if submatches else 0.8,
+            source="ripgrep",
+            metadata={"submatches": len(submatches)}
+        )
+
+    def _parse_ripgrep_text(self, line: str) -> Optional[Snippet]:
+        """Parse one ``rg -n --null`` line (``path\\0line:text``)."""
+        file_path, sep, rest = line.partition("\0")
+        line_num, _, text = rest.partition(":")
+        if not sep or not line_num.isdigit():
+            return None
+
+        # Every printed line matched at least once; exact counts need --json
+        line_num = int(line_num)
+        return Snippet(
+            file_path=self._relative_path(file_path),
+            content=text.strip(),
+            line_start=line_num,
+            line_end=line_num,
+            score=1.0,
+            source="ripgrep",
+            metadata={"submatches": 1}
+        )
+
     def hybrid_search(
         self,
         query: str,
@@ -410,38 +871,53 @@ class HybridSearchClient:
         sources_used: list[str] = []
         gemini_response = ""
 
-        # Build metadata filter for Gemini
-        metadata_parts = []
-        if path_filter:
-            metadata_parts.append(f'path_prefix = "{path_filter}"')
-        if language_filter:
-            metadata_parts.append(f'language = "{language_filter}"')
-        metadata_filter = " AND ".join(metadata_parts) if metadata_parts else None
+        metadata_filter = _build_metadata_filter(path_filter, language_filter)
+
+        use_gemini = query_type in (QueryType.CONCEPTUAL, QueryType.HYBRID)
+        use_ripgrep = query_type in (QueryType.LITERAL, QueryType.HYBRID)
 
-        # Route based on query type
-        if query_type in (QueryType.CONCEPTUAL, QueryType.HYBRID):
+        if use_ripgrep:
+            # Extract literal pattern from query
+            literal_pattern = self._extract_literal_pattern(query)
+            file_type = self._language_to_type(language_filter)
+
+        gemini_results: list[Snippet] = []
+        ripgrep_results: list[Snippet] = []
+
+        # Route based on query type. The two backends are independent I/O
+        # (network vs subprocess), so hybrid queries run them concurrently.
+        if use_gemini and use_ripgrep:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                gemini_future = executor.submit(
+                    self.search_gemini, query, metadata_filter, limit
+                )
+                ripgrep_future = executor.submit(
+                    self.search_ripgrep, literal_pattern, path_filter, file_type,
+                    limit, RIPGREP_MATCHES_PER_FILE
+                )
+                gemini_results = gemini_future.result()
+                ripgrep_results = ripgrep_future.result()
+        elif use_gemini:
             gemini_results = self.search_gemini(
                 query,
                 metadata_filter=metadata_filter,
                 limit=limit
             )
-            if gemini_results:
-                all_snippets.extend(gemini_results)
-                sources_used.append("gemini")
-
-        if query_type in (QueryType.LITERAL, QueryType.HYBRID):
-            # Extract literal pattern from query
-            literal_pattern = self._extract_literal_pattern(query)
-
+        elif use_ripgrep:
             ripgrep_results = self.search_ripgrep(
                 literal_pattern,
                 path=path_filter,
-                file_type=self._language_to_type(language_filter),
-                limit=limit
+                file_type=file_type,
+                limit=limit,
+                max_per_file=RIPGREP_MATCHES_PER_FILE
             )
-            if ripgrep_results:
-                all_snippets.extend(ripgrep_results)
-                sources_used.append("ripgrep")
+
+        if gemini_results:
+            all_snippets.extend(gemini_results)
+            sources_used.append("gemini")
+        if ripgrep_results:
+            all_snippets.extend(ripgrep_results)
+            sources_used.append("ripgrep")
 
         # Merge and rank results
         merged = self._merge_and_rank(all_snippets, limit)
@@ -455,7 +931,9 @@ class HybridSearchClient:
             gemini_response_text=gemini_response,
         )
 
-    def _extract_literal_pattern(self, query: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_literal_pattern(query: str) -> str:
         """Extract a literal search pattern from a natural language query.
 
         Args:
@@ -464,35 +942,20 @@ class HybridSearchClient:
         Returns:
             A pattern suitable for ripgrep
         """
-        # If already quoted, extract the quoted content
-        quoted = re.search(r'["\']([^"\']+)["\']', query)
-        if quoted:
-            return quoted.group(1)
-
-        # Look for common patterns
-        patterns = [
-            r'function\s+(\w+)',     # "function foo"
-            r'class\s+(\w+)',        # "class Foo"
-            r'def\s+(\w+)',          # "def foo"
-            r'usages?\s+of\s+(\w+)', # "usages of foo"
-            r'find\s+(\w+)',         # "find foo"
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        # Quoted content first, then common "function foo" style patterns
+        match = _EXTRACT_RE.match(query)
+        if match:
+            return next(g for g in match.groups() if g is not None)
 
         # Fall back to using key words from the query
-        # Remove common words
-        stop_words = {'the', 'a', 'an', 'is', 'are', 'where', 'what', 'how',
-                      'find', 'search', 'for', 'in', 'of', 'to', 'and', 'or'}
         words = query.lower().split()
-        keywords = [w for w in words if w not in stop_words and len(w) > 2]
+        keywords = [w for w in words if w not in _STOP_WORDS and len(w) > 2]
 
         return '|'.join(keywords) if keywords else query
 
-    def _language_to_type(self, language: Optional[str]) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _language_to_type(language: Optional[str]) -> Optional[str]:
         """Convert language name to ripgrep type.
 
         Args:
@@ -504,18 +967,7 @@ class HybridSearchClient:
         if not language:
             return None
 
-        mapping = {
-            "python": "py",
-            "javascript": "js",
-            "typescript": "ts",
-            "java": "java",
-            "go": "go",
-            "rust": "rust",
-            "c": "c",
-            "cpp": "cpp",
-            "markdown": "md",
-        }
-        return mapping.get(language.lower(), language)
+        return _LANGUAGE_TO_RG_TYPE.get(language.lower(), language)
 
     def _merge_and_rank(
         self,
@@ -533,43 +985,57 @@ class HybridSearchClient:
         Returns:
             Ranked list of unique snippets
         """
-        # Group by file path
-        by_file: dict[str, list[Snippet]] = {}
+        # Aggregate per file in a single pass
+        by_file: dict[str, dict] = {}
         for snippet in snippets:
-            if snippet.file_path not in by_file:
-                by_file[snippet.file_path] = []
-            by_file[snippet.file_path].append(snippet)
+            agg = by_file.get(snippet.file_path)
+            if agg is None:
+                by_file[snippet.file_path] = agg = {
+                    "score": snippet.score,
+                    "line_start": snippet.line_start,
+                    "line_end": snippet.line_end,
+                    "sources": {snippet.source},
+                    "contents": [],
+                    "seen_content": set(),
+                }
+            else:
+                if snippet.score > agg["score"]:
+                    agg["score"] = snippet.score
+                if snippet.line_start < agg["line_start"]:
+                    agg["line_start"] = snippet.line_start
+                if snippet.line_end > agg["line_end"]:
+                    agg["line_end"] = snippet.line_end
+                agg["sources"].add(snippet.source)
+
+            # Keep up to 3 distinct snippets of content per file
+            content = snippet.content
+            if (content and len(agg["contents"]) < 3 and
+                    content not in agg["seen_content"]):
+                agg["seen_content"].add(content)
+                agg["contents"].append(content)
 
         # Merge scores - files found by both sources rank higher
         merged: list[Snippet] = []
-        for file_path, file_snippets in by_file.items():
-            sources = set(s.source for s in file_snippets)
+        for file_path, agg in by_file.items():
+            sources = agg["sources"]
 
             # Boost score if found by multiple sources
-            base_score = max(s.score for s in file_snippets)
+            base_score = agg["score"]
             if len(sources) > 1:
                 base_score += 0.3  # Boost for appearing in both
 
-            # Combine content from multiple snippets
-            contents = []
-            for s in file_snippets:
-                if s.content and s.content not in contents:
-                    contents.append(s.content)
-
             merged.append(Snippet(
                 file_path=file_path,
-                content="\n---\n".join(contents[:3]),  # Max 3 snippets
-                line_start=min(s.line_start for s in file_snippets) or 0,
-                line_end=max(s.line_end for s in file_snippets) or 0,
+                content="\n---\n".join(agg["contents"]),
+                line_start=agg["line_start"] or 0,
+                line_end=agg["line_end"] or 0,
                 score=min(base_score, 1.5),  # Cap at 1.5
-                source="merged" if len(sources) > 1 else list(sources)[0],
+                source="merged" if len(sources) > 1 else next(iter(sources)),
                 metadata={"sources": list(sources)}
             ))
 
-        # Sort by score descending
-        merged.sort(key=lambda s: s.score, reverse=True)
-
-        return merged[:limit]
+        # Top results by score; stable for ties like a full descending sort
+        return heapq.nlargest(limit, merged, key=attrgetter("score"))
 
 
 # Convenience functions for quick searches
@@ -367,8 +367,8 @@ def finalize_git_operations(state: 'ADWState', logger: logging.Logger) -> None:
             try:
                 repo_url = get_repo_url()
                 repo_path = extract_repo_path(repo_url)
-                from adw_modules.github import fetch_issue
-                issue = fetch_issue(issue_number, repo_path)
+                from adw_modules.github import fetch_issue_meta
+                issue = fetch_issue_meta(issue_number, repo_path)
 
                 from adw_modules.workflow_ops import create_pull_request
                 pr_url, error = create_pull_request(branch_name, issue, state, logger)
@@ -11,19 +11,112 @@ This module contains all GitHub-related operations including:
 - Comment posting
 - Repository path extraction
 - Issue status management
+
+When GITHUB_PAT is set (and requests is installed) operations go straight
+to the REST API over a shared keep-alive session; otherwise they use the
+gh CLI.
 """
 
+import configparser
+import functools
 import subprocess
 import sys
 import os
 import json
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from pydantic import TypeAdapter
 from adw_modules.data_types import GitHubIssue, GitHubIssueListItem, GitHubComment
 from adw_modules.exceptions import GitHubAPIError, EnvironmentError
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; gh responses fall back to the stdlib decoder
+    orjson = None
+
+# Both accept str or bytes. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers catch the stdlib exception either way.
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import requests
+except ImportError:
+    # requests is optional; without it every operation goes through gh
+    requests = None
+
 # Bot identifier to prevent webhook loops and filter bot comments
 ADW_BOT_IDENTIFIER = "[ADW-BOT]"
 
+# gh --json projections. The meta projection leaves out the comment thread,
+# which dominates the payload on long issues, but keeps every field the
+# GitHubIssue model requires.
+ISSUE_FIELDS = "number,title,body,state,author,assignees,labels,milestone,comments,createdAt,updatedAt,closedAt,url"
+ISSUE_META_FIELDS = "number,title,body,state,author,labels,createdAt,updatedAt,url"
+
+# Validates a whole issue listing in one pydantic-core call instead of
+# constructing each model from Python
+_ISSUE_LIST = TypeAdapter(List[GitHubIssueListItem])
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_TIMEOUT = 30
+
+# How long a fetched issue is reused without asking GitHub again. After
+# that, REST fetches revalidate with the stored ETag.
+ISSUE_CACHE_TTL_SECONDS = 30
+
+
+class _IssueCache:
+    """Issues fetched by _fetch_issue, with their fetch time and ETag.
+
+    Comments and label changes made through this module invalidate the
+    issue, so callers never see their own writes missing. Comments may be
+    posted from a background thread (see exceptions.handle_error), so every
+    access holds a lock.
+    """
+
+    def __init__(self):
+        # (repo_path, issue_number, fields) -> (fetched_at, etag, issue)
+        self._entries: Dict[Tuple[str, str, str], Tuple[float, Optional[str], GitHubIssue]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[Tuple[float, Optional[str], GitHubIssue]]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Tuple[str, str, str], fetched_at: float,
+            etag: Optional[str], issue: GitHubIssue) -> None:
+        with self._lock:
+            self._entries[key] = (fetched_at, etag, issue)
+
+    def invalidate(self, repo_path: str, issue_number: str) -> None:
+        """Forget every projection of one issue."""
+        issue = (repo_path, str(issue_number))
+        with self._lock:
+            for key in [key for key in self._entries if key[:2] == issue]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Forget all cached issues so the next fetch goes to GitHub."""
+        with self._lock:
+            self._entries.clear()
+
+
+_issue_cache = _IssueCache()
+
+# Keep-alive REST session, shared by every call made with the same token
+_session = None
+_session_token: Optional[str] = None
+
+
+def _decode(output: Optional[bytes]) -> str:
+    """Decode captured subprocess output for error messages."""
+    return output.decode("utf-8", "replace") if output else ""
+
 
 def get_github_env() -> Optional[dict]:
     """Get environment with GitHub token set up. Returns None if no GITHUB_PAT.
@@ -44,22 +137,147 @@ def get_github_env() -> Optional[dict]:
     github_pat = os.getenv("GITHUB_PAT")
     if not github_pat:
         return None
-    
+
+    # The dict is shared between calls; subprocess only reads it
+    return _github_env(github_pat, os.environ.get("PATH", ""))
+
+
+@functools.lru_cache(maxsize=1)
+def _github_env(github_pat: str, path: str) -> dict:
     # Only create minimal env with GitHub token
-    env = {
+    return {
         "GH_TOKEN": github_pat,
-        "PATH": os.environ.get("PATH", ""),
+        "PATH": path,
+    }
+
+
+def get_github_session():
+    """Get the shared REST API session, or None to fall back to the gh CLI.
+
+    The session reuses one TLS connection across calls instead of starting
+    a gh process per operation. It is only available when GITHUB_PAT is set
+    and requests is installed.
+    """
+    global _session, _session_token
+
+    github_pat = os.getenv("GITHUB_PAT")
+    if not github_pat or requests is None:
+        return None
+
+    if _session is None or _session_token != github_pat:
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {github_pat}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        })
+        _session, _session_token = session, github_pat
+    return _session
+
+
+def _rest_request(session, method: str, path: str, **kwargs):
+    """Make a REST API call, raising requests.HTTPError on error statuses."""
+    response = session.request(
+        method, f"{GITHUB_API_URL}{path}", timeout=GITHUB_API_TIMEOUT, **kwargs
+    )
+    response.raise_for_status()
+    return response
+
+
+def _rest_iter_pages(session, path: str, params: Optional[dict] = None) -> Iterator[list]:
+    """GET the pages of a list endpoint lazily by following Link headers."""
+    url = f"{GITHUB_API_URL}{path}"
+    params = dict(params or {}, per_page=100)
+    while url:
+        response = session.get(url, params=params, timeout=GITHUB_API_TIMEOUT)
+        response.raise_for_status()
+        yield _loads(response.content)
+        url = response.links.get("next", {}).get("url")
+        params = None  # The next-page URL already carries the query
+
+
+def _rest_get_all(session, path: str, params: Optional[dict] = None,
+                  limit: Optional[int] = None) -> list:
+    """GET every page of a list endpoint by following Link headers."""
+    items: list = []
+    for page in _rest_iter_pages(session, path, params):
+        items.extend(page)
+        if limit is not None and len(items) >= limit:
+            break
+    return items[:limit] if limit is not None else items
+
+
+# REST payloads use different field names than `gh --json`; these convert
+# them to the gh shape so the data_types models accept either source.
+def _rest_user(user: Optional[dict]) -> dict:
+    user = user or {}
+    return {
+        "id": user.get("node_id"),
+        "login": user.get("login", ""),
+        "is_bot": user.get("type") == "Bot",
     }
-    return env
 
 
+def _rest_label(label: dict) -> dict:
+    return {
+        "id": label.get("node_id", ""),
+        "name": label["name"],
+        "color": label.get("color", ""),
+        "description": label.get("description"),
+    }
+
+
+def _rest_comment(comment: dict) -> dict:
+    return {
+        "id": comment.get("node_id", str(comment.get("id", ""))),
+        "author": _rest_user(comment.get("user")),
+        "body": comment.get("body") or "",
+        "createdAt": comment["created_at"],
+        "updatedAt": comment.get("updated_at"),
+    }
+
+
+def _rest_issue(issue: dict, comments: Optional[list] = None) -> dict:
+    milestone = issue.get("milestone")
+    return {
+        "number": issue["number"],
+        "title": issue["title"],
+        "body": issue.get("body") or "",
+        "state": issue["state"].upper(),
+        "author": _rest_user(issue.get("user")),
+        "assignees": [_rest_user(u) for u in issue.get("assignees") or []],
+        "labels": [_rest_label(l) for l in issue.get("labels") or []],
+        "milestone": {
+            "id": milestone.get("node_id", ""),
+            "number": milestone["number"],
+            "title": milestone["title"],
+            "description": milestone.get("description"),
+            "state": milestone["state"].upper(),
+        } if milestone else None,
+        "comments": [_rest_comment(c) for c in comments or []],
+        "createdAt": issue["created_at"],
+        "updatedAt": issue["updated_at"],
+        "closedAt": issue.get("closed_at"),
+        "url": issue.get("html_url", ""),
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def get_repo_url() -> str:
     """Get GitHub repository URL from git remote.
 
+    The remote does not change while a workflow runs, so the result is
+    cached; failures are not cached and are retried on the next call.
+    The URL is read from .git/config when possible and from git otherwise.
+
     Raises:
         GitHubAPIError: If git remote cannot be retrieved
         EnvironmentError: If git is not installed
     """
+    url = _read_origin_url()
+    if url:
+        return url
+
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
@@ -83,12 +301,59 @@ def get_repo_url() -> str:
         ) from e
 
 
+def _read_origin_url() -> Optional[str]:
+    """Read remote.origin.url from .git/config without starting git.
+
+    Returns None whenever git itself should be asked: no .git directory
+    (worktrees and submodules use a .git file), an unparsable config, or
+    url.*.insteadOf rewrites in the repo or user config, which git remote
+    get-url would apply.
+    """
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        git_dir = directory / ".git"
+        if git_dir.exists():
+            break
+    else:
+        return None
+    if not git_dir.is_dir():
+        return None
+
+    config_path = git_dir / "config"
+    user_configs = [
+        Path.home() / ".gitconfig",
+        Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "git" / "config",
+    ]
+    try:
+        text = config_path.read_text(encoding="utf-8")
+        for path in user_configs:
+            if path.is_file() and "insteadof" in path.read_text(encoding="utf-8").lower():
+                return None
+    except (OSError, UnicodeDecodeError):
+        return None
+    if "insteadof" in text.lower() or "[include" in text.lower():
+        return None
+
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        parser.read_string(text)
+        return parser.get('remote "origin"', "url").strip('"') or None
+    except configparser.Error:
+        return None
+
+
 def extract_repo_path(github_url: str) -> str:
     """Extract owner/repo from GitHub URL."""
     # Handle both https://github.com/owner/repo and https://github.com/owner/repo.git
     return github_url.replace("https://github.com/", "").replace(".git", "")
 
 
+@functools.lru_cache(maxsize=1)
+def get_repo_path() -> str:
+    """Get owner/repo for the git remote 'origin'."""
+    return extract_repo_path(get_repo_url())
+
+
 def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
     """Fetch GitHub issue using gh CLI and return typed model.
 
@@ -96,7 +361,51 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
         EnvironmentError: If gh CLI is not installed
         GitHubAPIError: If issue fetch fails
     """
+    return _fetch_issue(issue_number, repo_path, ISSUE_FIELDS)
+
+
+def fetch_issue_meta(issue_number: str, repo_path: str) -> GitHubIssue:
+    """Fetch a GitHub issue without its comments, assignees or milestone.
+
+    Enough for workflows that only send number, title and body to an agent.
+
+    Raises:
+        EnvironmentError: If gh CLI is not installed
+        GitHubAPIError: If issue fetch fails
+    """
+    return _fetch_issue(issue_number, repo_path, ISSUE_META_FIELDS)
 
+
+def _fetch_issue(issue_number: str, repo_path: str, fields: str) -> GitHubIssue:
+    """Fetch an issue with the given gh --json field projection.
+
+    Results are reused for ISSUE_CACHE_TTL_SECONDS. Past that, the REST
+    path sends If-None-Match and keeps the cached issue on a 304.
+    """
+    key = (repo_path, str(issue_number), fields)
+    cached = _issue_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < ISSUE_CACHE_TTL_SECONDS:
+        return cached[2]
+
+    session = get_github_session()
+    if session is not None:
+        issue, etag = _fetch_issue_rest(
+            session, issue_number, repo_path,
+            with_comments="comments" in fields,
+            etag=cached[1] if cached is not None else None,
+        )
+        if issue is None:  # Not modified
+            issue = cached[2]
+    else:
+        issue, etag = _fetch_issue_gh(issue_number, repo_path, fields), None
+
+    _issue_cache.put(key, now, etag, issue)
+    return issue
+
+
+def _fetch_issue_gh(issue_number: str, repo_path: str, fields: str) -> GitHubIssue:
+    """gh CLI version of _fetch_issue."""
     # Use JSON output for structured data
     cmd = [
         "gh",
@@ -106,23 +415,23 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
         "-R",
         repo_path,
         "--json",
-        "number,title,body,state,author,assignees,labels,milestone,comments,createdAt,updatedAt,closedAt,url",
+        fields,
     ]
 
     # Set up environment with GitHub token if available
     env = get_github_env()
 
     try:
+        # Raw bytes go straight to the JSON decoder; only stderr is decoded
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             env=env,
             check=True
         )
 
         # Parse JSON response into Pydantic model
-        issue_data = json.loads(result.stdout)
+        issue_data = _loads(result.stdout)
         issue = GitHubIssue(**issue_data)
         return issue
 
@@ -142,7 +451,7 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
         raise GitHubAPIError(
             f"Failed to fetch issue #{issue_number}",
             api_endpoint=f"gh issue view {issue_number}",
-            stderr=e.stderr,
+            stderr=_decode(e.stderr),
             issue_number=issue_number,
             repo_path=repo_path
         ) from e
@@ -162,6 +471,61 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
         ) from e
 
 
+def _status_code(error) -> Optional[int]:
+    """HTTP status of a failed REST call, if a response was received."""
+    response = getattr(error, "response", None)
+    return response.status_code if response is not None else None
+
+
+def _fetch_issue_rest(session, issue_number: str, repo_path: str,
+                      with_comments: bool = True,
+                      etag: Optional[str] = None) -> Tuple[Optional[GitHubIssue], Optional[str]]:
+    """Fetch an issue, and optionally its comments, through the REST API.
+
+    Returns:
+        (issue, etag); issue is None when GitHub answers 304 to etag
+    """
+    endpoint = f"/repos/{repo_path}/issues/{issue_number}"
+    try:
+        headers = {"If-None-Match": etag} if etag else {}
+        response = _rest_request(session, "GET", endpoint, headers=headers)
+        if response.status_code == 304:
+            return None, etag
+
+        issue_data = _loads(response.content)
+        # The issue payload only carries a comment count
+        comments = (
+            _rest_get_all(session, f"{endpoint}/comments")
+            if with_comments and issue_data.get("comments") else []
+        )
+        issue = GitHubIssue(**_rest_issue(issue_data, comments))
+        return issue, response.headers.get("ETag")
+
+    except requests.RequestException as e:
+        raise GitHubAPIError(
+            f"Failed to fetch issue #{issue_number}",
+            status_code=_status_code(e),
+            api_endpoint=f"GET {endpoint}",
+            stderr=str(e),
+            issue_number=issue_number,
+            repo_path=repo_path
+        ) from e
+
+    except json.JSONDecodeError as e:
+        raise GitHubAPIError(
+            "Failed to parse issue response",
+            api_endpoint=f"GET {endpoint}",
+            parse_error=str(e)
+        ) from e
+
+    except Exception as e:
+        raise GitHubAPIError(
+            f"Unexpected error fetching issue #{issue_number}",
+            api_endpoint=f"GET {endpoint}",
+            error=str(e)
+        ) from e
+
+
 def make_issue_comment(issue_id: str, comment: str) -> None:
     """Post a comment to a GitHub issue using gh CLI.
 
@@ -169,10 +533,27 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
         GitHubAPIError: If comment posting fails
     """
 
+    repo_path = None
     try:
         # Get repo information from git remote
-        github_repo_url = get_repo_url()
-        repo_path = extract_repo_path(github_repo_url)
+        repo_path = get_repo_path()
+
+        session = get_github_session()
+        if session is not None:
+            endpoint = f"/repos/{repo_path}/issues/{issue_id}/comments"
+            try:
+                _rest_request(session, "POST", endpoint, json={"body": comment})
+            except requests.RequestException as e:
+                raise GitHubAPIError(
+                    f"Failed to post comment to issue #{issue_id}",
+                    status_code=_status_code(e),
+                    api_endpoint=f"POST {endpoint}",
+                    stderr=str(e),
+                    issue_id=issue_id,
+                    comment_preview=comment[:100]
+                ) from e
+            print(f"Successfully posted comment to issue #{issue_id}")
+            return
 
         # Build command
         cmd = [
@@ -182,8 +563,9 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
             issue_id,
             "-R",
             repo_path,
-            "--body",
-            comment,
+            # Read the body from stdin: long comments can exceed ARG_MAX
+            "--body-file",
+            "-",
         ]
 
         # Set up environment with GitHub token if available
@@ -191,6 +573,7 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
 
         result = subprocess.run(
             cmd,
+            input=comment,
             capture_output=True,
             text=True,
             env=env,
@@ -199,6 +582,9 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
 
         print(f"Successfully posted comment to issue #{issue_id}")
 
+    except GitHubAPIError:
+        raise
+
     except subprocess.CalledProcessError as e:
         raise GitHubAPIError(
             f"Failed to post comment to issue #{issue_id}",
@@ -215,14 +601,30 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
             error=str(e)
         ) from e
 
+    finally:
+        # A failed post may still have landed
+        if repo_path is not None:
+            _issue_cache.invalidate(repo_path, issue_id)
+
 
 def mark_issue_in_progress(issue_id: str) -> None:
     """Mark issue as in progress by adding label and comment."""
     # Get repo information from git remote
-    github_repo_url = get_repo_url()
-    repo_path = extract_repo_path(github_repo_url)
+    repo_path = get_repo_path()
+    try:
+        _mark_issue_in_progress(issue_id, repo_path)
+    finally:
+        _issue_cache.invalidate(repo_path, issue_id)
 
-    # Add "in_progress" label
+
+def _mark_issue_in_progress(issue_id: str, repo_path: str) -> None:
+    """Label and assign the issue through REST or the gh CLI."""
+    session = get_github_session()
+    if session is not None:
+        _mark_issue_in_progress_rest(session, issue_id, repo_path)
+        return
+
+    # Add "in_progress" label and assign to self in one gh call
     cmd = [
         "gh",
         "issue",
@@ -232,37 +634,169 @@ def mark_issue_in_progress(issue_id: str) -> None:
         repo_path,
         "--add-label",
         "in_progress",
+        "--add-assignee",
+        "@me",
     ]
 
     # Set up environment with GitHub token if available
     env = get_github_env()
 
-    # Try to add label (may fail if label doesn't exist)
-    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-    if result.returncode != 0:
-        print(f"Note: Could not add 'in_progress' label: {result.stderr}")
-
     # Post comment indicating work has started
     # make_issue_comment(issue_id, "🚧 ADW is working on this issue...")
 
-    # Assign to self (optional)
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    if result.returncode == 0:
+        print(f"Assigned issue #{issue_id} to self")
+        return
+
+    # gh applies all edits or none, so a missing label also blocks the
+    # assignment; retry the (optional) assignment on its own
+    print(f"Note: Could not add 'in_progress' label: {result.stderr}")
+    result = subprocess.run(cmd[:6] + ["--add-assignee", "@me"],
+                            capture_output=True, text=True, env=env)
+    if result.returncode == 0:
+        print(f"Assigned issue #{issue_id} to self")
+
+
+def _mark_issue_in_progress_rest(session, issue_id: str, repo_path: str) -> None:
+    """REST version of mark_issue_in_progress; failures are only reported."""
+    endpoint = f"/repos/{repo_path}/issues/{issue_id}"
+
+    # Add "in_progress" label
+    try:
+        _rest_request(session, "POST", f"{endpoint}/labels",
+                      json={"labels": ["in_progress"]})
+    except requests.RequestException as e:
+        print(f"Note: Could not add 'in_progress' label: {e}")
+
+    # Assign to self (optional); REST needs the login that gh resolves for @me
+    try:
+        login = _loads(_rest_request(session, "GET", "/user").content)["login"]
+        _rest_request(session, "POST", f"{endpoint}/assignees",
+                      json={"assignees": [login]})
+        print(f"Assigned issue #{issue_id} to self")
+    except (requests.RequestException, ValueError, KeyError):
+        pass
+
+
+def fetch_open_issues(
+    repo_path: str,
+    *,
+    labels: Optional[List[str]] = None,
+    search: Optional[str] = None,
+    limit: int = 1000,
+) -> List[GitHubIssueListItem]:
+    """Fetch open issues from the GitHub repository.
+
+    Args:
+        repo_path: owner/repo
+        labels: Only issues carrying all of these labels
+        search: GitHub search qualifiers, e.g. "no:assignee"
+        limit: Maximum number of issues to return
+
+    Filters are applied by GitHub, so unwanted issues are never transferred
+    or decoded.
+    """
+    session = get_github_session()
+    if session is not None:
+        items = _list_open_issues_rest(session, repo_path, labels, search, limit)
+        items = [_rest_issue(item) for item in items]
+    else:
+        items = _list_open_issues(
+            repo_path, "number,title,body,labels,createdAt,updatedAt", labels, search, limit
+        )
+    issues = _ISSUE_LIST.validate_python(items)
+    print(f"Fetched {len(issues)} open issues")
+    return issues
+
+
+def iter_open_issues(repo_path: str) -> Iterator[GitHubIssueListItem]:
+    """Yield open issues as they are decoded instead of after the whole list.
+
+    gh emits one issue per line (--jq '.[]') and each line is parsed as it
+    is read; the REST path requests the next page only once the previous
+    one is consumed. Callers that stop early skip the remaining work, and
+    the raw listing is never held in memory all at once. Failures are
+    reported like fetch_open_issues and end the iteration.
+    """
+    session = get_github_session()
+    if session is not None:
+        try:
+            for page in _rest_iter_pages(session, f"/repos/{repo_path}/issues", {"state": "open"}):
+                for item in page:
+                    if "pull_request" not in item:
+                        yield GitHubIssueListItem(**_rest_issue(item))
+        except requests.RequestException as e:
+            print(f"ERROR: Failed to fetch issues: {e}", file=sys.stderr)
+        except json.JSONDecodeError as e:
+            print(f"ERROR: Failed to parse issues JSON: {e}", file=sys.stderr)
+        return
+
     cmd = [
         "gh",
         "issue",
-        "edit",
-        issue_id,
-        "-R",
+        "list",
+        "--repo",
         repo_path,
-        "--add-assignee",
-        "@me",
+        "--state",
+        "open",
+        "--json",
+        "number,title,body,labels,createdAt,updatedAt",
+        "--jq",
+        ".[]",
+        "--limit",
+        "1000",
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-    if result.returncode == 0:
-        print(f"Assigned issue #{issue_id} to self")
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=get_github_env()
+    )
+    try:
+        for line in proc.stdout:
+            yield GitHubIssueListItem(**_loads(line))
+        if proc.wait() != 0:
+            print(f"ERROR: Failed to fetch issues: {_decode(proc.stderr.read())}", file=sys.stderr)
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Failed to parse issues JSON: {e}", file=sys.stderr)
+    finally:
+        # The caller may stop iterating before gh has finished
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+
+def fetch_open_issue_numbers(
+    repo_path: str,
+    *,
+    labels: Optional[List[str]] = None,
+    search: Optional[str] = None,
+    limit: int = 1000,
+) -> List[int]:
+    """Fetch the numbers of open issues, filtered as in fetch_open_issues.
+
+    Requests only the number field from gh, so callers that just need to
+    know which issues exist skip transferring and decoding every issue
+    body, and no models are built.
+    """
+    session = get_github_session()
+    if session is not None:
+        items = _list_open_issues_rest(session, repo_path, labels, search, limit)
+    else:
+        items = _list_open_issues(repo_path, "number", labels, search, limit)
+    numbers = [item["number"] for item in items]
+    print(f"Fetched {len(numbers)} open issues")
+    return numbers
 
 
-def fetch_open_issues(repo_path: str) -> List[GitHubIssueListItem]:
-    """Fetch all open issues from the GitHub repository."""
+def _list_open_issues(
+    repo_path: str,
+    fields: str,
+    labels: Optional[List[str]] = None,
+    search: Optional[str] = None,
+    limit: int = 1000,
+) -> List[Dict]:
+    """Raw gh issue list output for the given --json fields; [] on failure."""
     try:
         cmd = [
             "gh",
@@ -273,34 +807,81 @@ def fetch_open_issues(repo_path: str) -> List[GitHubIssueListItem]:
             "--state",
             "open",
             "--json",
-            "number,title,body,labels,createdAt,updatedAt",
+            fields,
             "--limit",
-            "1000",
+            str(limit),
         ]
+        for label in labels or []:
+            cmd += ["--label", label]
+        if search:
+            cmd += ["--search", search]
 
         # Set up environment with GitHub token if available
         env = get_github_env()
 
         # DEBUG level - not printing command
+        # Raw bytes go straight to the JSON decoder; only stderr is decoded
         result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True, env=env
+            cmd, capture_output=True, check=True, env=env
         )
 
-        issues_data = json.loads(result.stdout)
-        issues = [GitHubIssueListItem(**issue_data) for issue_data in issues_data]
-        print(f"Fetched {len(issues)} open issues")
-        return issues
+        return _loads(result.stdout)
 
     except subprocess.CalledProcessError as e:
-        print(f"ERROR: Failed to fetch issues: {e.stderr}", file=sys.stderr)
+        print(f"ERROR: Failed to fetch issues: {_decode(e.stderr)}", file=sys.stderr)
         return []
     except json.JSONDecodeError as e:
         print(f"ERROR: Failed to parse issues JSON: {e}", file=sys.stderr)
         return []
 
 
+def _list_open_issues_rest(
+    session,
+    repo_path: str,
+    labels: Optional[List[str]] = None,
+    search: Optional[str] = None,
+    limit: int = 1000,
+) -> List[Dict]:
+    """REST version of _list_open_issues, in REST shape; [] on failure."""
+    if search:
+        # Only the search endpoint understands search qualifiers
+        query = " ".join(
+            [f"repo:{repo_path} is:issue is:open", search]
+            + [f'label:"{label}"' for label in labels or []]
+        )
+        pages = (
+            page["items"]
+            for page in _rest_iter_pages(session, "/search/issues", {"q": query})
+        )
+    else:
+        params = {"state": "open"}
+        if labels:
+            params["labels"] = ",".join(labels)
+        pages = _rest_iter_pages(session, f"/repos/{repo_path}/issues", params)
+
+    items = []
+    try:
+        for page in pages:
+            # The issues endpoint also lists pull requests; gh issue list
+            # does not, so they are dropped before counting towards limit
+            items.extend(item for item in page if "pull_request" not in item)
+            if len(items) >= limit or not page:
+                break
+    except requests.RequestException as e:
+        print(f"ERROR: Failed to fetch issues: {e}", file=sys.stderr)
+        return []
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Failed to parse issues JSON: {e}", file=sys.stderr)
+        return []
+    return items[:limit]
+
+
 def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
     """Fetch all comments for a specific issue."""
+    session = get_github_session()
+    if session is not None:
+        return _fetch_issue_comments_rest(session, repo_path, issue_number)
+
     try:
         cmd = [
             "gh",
@@ -317,9 +898,9 @@ def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
         env = get_github_env()
 
         result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True, env=env
+            cmd, capture_output=True, check=True, env=env
         )
-        data = json.loads(result.stdout)
+        data = _loads(result.stdout)
         comments = data.get("comments", [])
 
         # Sort comments by creation time
@@ -330,7 +911,51 @@ def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
 
     except subprocess.CalledProcessError as e:
         print(
-            f"ERROR: Failed to fetch comments for issue #{issue_number}: {e.stderr}",
+            f"ERROR: Failed to fetch comments for issue #{issue_number}: {_decode(e.stderr)}",
+            file=sys.stderr,
+        )
+        return []
+    except json.JSONDecodeError as e:
+        print(
+            f"ERROR: Failed to parse comments JSON for issue #{issue_number}: {e}",
+            file=sys.stderr,
+        )
+        return []
+
+
+def fetch_issue_comments_bulk(
+    repo_path: str,
+    issue_numbers: List[int],
+    max_workers: int = 10,
+) -> Dict[int, List[Dict]]:
+    """Fetch comments for many issues concurrently.
+
+    Each fetch is network- or subprocess-bound, so a small thread pool turns
+    N sequential round trips into roughly N / max_workers. Uses the same
+    REST-or-gh routing as fetch_issue_comments.
+
+    Returns:
+        Mapping of issue number to its comments, oldest first
+    """
+    if not issue_numbers:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(issue_numbers))) as executor:
+        results = executor.map(
+            lambda number: fetch_issue_comments(repo_path, number), issue_numbers
+        )
+        return dict(zip(issue_numbers, results))
+
+
+def _fetch_issue_comments_rest(session, repo_path: str, issue_number: int) -> List[Dict]:
+    """REST version of fetch_issue_comments, in the gh comment shape."""
+    try:
+        comments = _rest_get_all(
+            session, f"/repos/{repo_path}/issues/{issue_number}/comments"
+        )
+    except requests.RequestException as e:
+        print(
+            f"ERROR: Failed to fetch comments for issue #{issue_number}: {e}",
             file=sys.stderr,
         )
         return []
@@ -341,6 +966,146 @@ def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
         )
         return []
 
+    comments = [_rest_comment(c) for c in comments]
+    comments.sort(key=lambda c: c.get("createdAt", ""))
+    return comments
+
+
+GRAPHQL_PAGE_SIZE = 50
+
+# Open issues with their latest comments, one page per request. Selects the
+# fields of the gh --json shape so results validate as GitHubIssue.
+_ISSUES_WITH_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $first, after: $after, states: OPEN,
+           orderBy: {field: CREATED_AT, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title body state url createdAt updatedAt closedAt
+        author { login __typename }
+        labels(first: 50) { nodes { id name color description } }
+        comments(last: 100) {
+          nodes { id body createdAt updatedAt author { login __typename } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def fetch_issues_with_comments_graphql(repo_path: str, limit: int = 50) -> List[GitHubIssue]:
+    """Fetch open issues together with their latest 100 comments.
+
+    One GraphQL request per GRAPHQL_PAGE_SIZE issues replaces an issue
+    listing plus one comments call per issue.
+
+    Raises:
+        EnvironmentError: If gh CLI is needed but not installed
+        GitHubAPIError: If the query fails
+    """
+    owner, name = repo_path.split("/", 1)
+    session = get_github_session()
+    issues: List[GitHubIssue] = []
+    cursor: Optional[str] = None
+
+    while len(issues) < limit:
+        variables = {
+            "owner": owner,
+            "name": name,
+            "first": min(GRAPHQL_PAGE_SIZE, limit - len(issues)),
+            "after": cursor,
+        }
+        data = _graphql(session, _ISSUES_WITH_COMMENTS_QUERY, variables)
+        page = data["repository"]["issues"]
+        issues.extend(GitHubIssue(**_graphql_issue(node)) for node in page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+
+    return issues
+
+
+def _graphql(session, query: str, variables: dict) -> dict:
+    """Run a GraphQL query over the REST session or gh api graphql."""
+    try:
+        if session is not None:
+            try:
+                response = _rest_request(
+                    session, "POST", "/graphql",
+                    json={"query": query, "variables": variables},
+                )
+            except requests.RequestException as e:
+                raise GitHubAPIError(
+                    "GraphQL query failed",
+                    status_code=_status_code(e),
+                    api_endpoint="POST /graphql",
+                    stderr=str(e),
+                ) from e
+            payload = _loads(response.content)
+        else:
+            cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+            for key, value in variables.items():
+                if value is not None:
+                    # -F sends numbers as numbers; -f keeps strings as strings
+                    flag = "-F" if isinstance(value, int) else "-f"
+                    cmd += [flag, f"{key}={value}"]
+            result = subprocess.run(
+                cmd, capture_output=True, check=True, env=get_github_env()
+            )
+            payload = _loads(result.stdout)
+
+    except FileNotFoundError as e:
+        raise EnvironmentError(
+            "GitHub CLI (gh) is not installed",
+            required_tools=["gh"],
+            instruction="Install gh: https://github.com/cli/cli#installation"
+        ) from e
+
+    except subprocess.CalledProcessError as e:
+        raise GitHubAPIError(
+            "GraphQL query failed",
+            api_endpoint="gh api graphql",
+            stderr=_decode(e.stderr),
+        ) from e
+
+    except json.JSONDecodeError as e:
+        raise GitHubAPIError(
+            "Failed to parse GraphQL response",
+            api_endpoint="graphql",
+            parse_error=str(e)
+        ) from e
+
+    if payload.get("errors"):
+        raise GitHubAPIError(
+            "GraphQL query returned errors",
+            api_endpoint="graphql",
+            errors=[error.get("message") for error in payload["errors"]],
+        )
+    return payload["data"]
+
+
+def _graphql_user(user: Optional[dict]) -> dict:
+    user = user or {}
+    return {
+        "login": user.get("login", ""),
+        "is_bot": user.get("__typename") == "Bot",
+    }
+
+
+def _graphql_issue(node: dict) -> dict:
+    """Convert a GraphQL issue node to the gh --json shape."""
+    return dict(
+        node,
+        author=_graphql_user(node.get("author")),
+        labels=node["labels"]["nodes"],
+        comments=[
+            dict(comment, author=_graphql_user(comment.get("author")))
+            for comment in node["comments"]["nodes"]
+        ],
+    )
+
 
 def find_keyword_from_comment(keyword: str, issue: GitHubIssue) -> Optional[GitHubComment]:
     """Find the latest comment containing a specific keyword.
@@ -352,16 +1117,14 @@ def find_keyword_from_comment(keyword: str, issue: GitHubIssue) -> Optional[GitH
     Returns:
         The latest GitHubComment containing the keyword, or None if not found
     """
-    # Sort comments by created_at date (newest first)
-    sorted_comments = sorted(issue.comments, key=lambda c: c.created_at, reverse=True)
-    
-    # Search through sorted comments (newest first)
-    for comment in sorted_comments:
-        # Skip ADW bot comments to prevent loops
-        if ADW_BOT_IDENTIFIER in comment.body:
-            continue
-            
-        if keyword in comment.body:
-            return comment
-    
-    return None
+    # Comments are usually but not always in creation order, so pick the
+    # newest match in one pass instead of sorting. Bot comments are skipped
+    # to prevent loops.
+    return max(
+        (
+            comment for comment in issue.comments
+            if keyword in comment.body and ADW_BOT_IDENTIFIER not in comment.body
+        ),
+        key=attrgetter("created_at"),
+        default=None,
+    )
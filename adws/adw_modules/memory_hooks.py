@@ -20,10 +20,14 @@ Usage:
     post_scout_learn(task_description="add auth", scout_results={...}, ...)
 """
 
+import functools
 import logging
+import os
 import re
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from statistics import fmean
+from typing import Dict, Any, Optional, List, Tuple
 from adw_modules.memory_manager import MemoryManager
 
 logger = logging.getLogger(__name__)
@@ -33,6 +37,42 @@ logger = logging.getLogger(__name__)
 # Content Sanitization
 # ============================================================================
 
+def _max_memory_chars(default: int = 4096) -> int:
+    """Content cap selected by MAX_MEMORY_CHARS, or ``default`` if unset or invalid."""
+    value = os.getenv("MAX_MEMORY_CHARS")
+    if value is None:
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        logger.warning(f"Invalid MAX_MEMORY_CHARS '{value}', using {default}")
+        return default
+    return limit
+
+
+# Longer content is cut before redaction: it bounds the regex work and the
+# payload sent to mem0, which would truncate it anyway
+MAX_MEMORY_CHARS = _max_memory_chars()
+TRUNCATION_MARKER = "…[truncated]"
+_LAST_WORD = re.compile(r"\s\S*\Z")
+
+# (trigger, pattern, replacement) applied in order by sanitize_memory_content
+_REDACTIONS = (
+    # API keys
+    ("api_key", re.compile(r'api_key["\']?\s*[:=]\s*["\']?[\w-]+', re.IGNORECASE), "api_key=REDACTED"),
+    # Tokens
+    ("token", re.compile(r'token["\']?\s*[:=]\s*["\']?[\w-]+', re.IGNORECASE), "token=REDACTED"),
+    # Passwords
+    ("password", re.compile(r'password["\']?\s*[:=]\s*["\']?\S+', re.IGNORECASE), "password=REDACTED"),
+    # Email addresses
+    ("@", re.compile(r'\b[\w.-]+@[\w.-]+\.\w+\b'), "EMAIL_REDACTED"),
+    # Bearer tokens
+    ("bearer", re.compile(r'Bearer\s+[\w-]+', re.IGNORECASE), "Bearer REDACTED"),
+)
+
+
 def sanitize_memory_content(content: str) -> str:
     """Remove sensitive patterns before storing in memory.
 
@@ -40,7 +80,8 @@ def sanitize_memory_content(content: str) -> str:
         content: Raw content that may contain secrets
 
     Returns:
-        Sanitized content with sensitive data redacted
+        Sanitized content with sensitive data redacted, cut to about
+        MAX_MEMORY_CHARS characters
 
     Examples:
         >>> sanitize_memory_content("api_key='sk-1234'")
@@ -49,44 +90,30 @@ def sanitize_memory_content(content: str) -> str:
     if not content:
         return content
 
-    # Redact API keys
-    content = re.sub(
-        r'api_key["\']?\s*[:=]\s*["\']?[\w-]+',
-        'api_key=REDACTED',
-        content,
-        flags=re.IGNORECASE
-    )
-
-    # Redact tokens
-    content = re.sub(
-        r'token["\']?\s*[:=]\s*["\']?[\w-]+',
-        'token=REDACTED',
-        content,
-        flags=re.IGNORECASE
-    )
-
-    # Redact passwords
-    content = re.sub(
-        r'password["\']?\s*[:=]\s*["\']?\S+',
-        'password=REDACTED',
-        content,
-        flags=re.IGNORECASE
-    )
-
-    # Redact email addresses
-    content = re.sub(
-        r'\b[\w.-]+@[\w.-]+\.\w+\b',
-        'EMAIL_REDACTED',
-        content
-    )
-
-    # Redact bearer tokens
-    content = re.sub(
-        r'Bearer\s+[\w-]+',
-        'Bearer REDACTED',
-        content,
-        flags=re.IGNORECASE
-    )
+    if len(content) > MAX_MEMORY_CHARS:
+        # Cut at whitespace so a secret straddling the limit is dropped
+        # whole rather than left as an unrecognizable fragment
+        cut = _LAST_WORD.search(content, 0, MAX_MEMORY_CHARS + 1)
+        if not cut or not cut.start():
+            # No word boundary to cut at: redact the full text, then cut hard
+            return _redact(content)[:MAX_MEMORY_CHARS] + TRUNCATION_MARKER
+        content = content[:cut.start()] + TRUNCATION_MARKER
+
+    return _redact(content)
+
+
+def _redact(content: str) -> str:
+    """Apply _REDACTIONS to content."""
+    # Patterns run in order, each on the previous one's output (e.g.
+    # "Bearer token: x" needs both the token and bearer rules). For ASCII
+    # text a rule is skipped when its trigger is absent; no replacement
+    # introduces the trigger of a later rule, so checking the original text
+    # is enough. Non-ASCII text runs every rule, since IGNORECASE also
+    # matches look-alikes such as "ı" and "ſ".
+    lowered = content.lower() if content.isascii() else None
+    for trigger, pattern, replacement in _REDACTIONS:
+        if lowered is None or trigger in lowered:
+            content = pattern.sub(replacement, content)
 
     return content
 
@@ -105,17 +132,26 @@ def get_project_id() -> str:
         "project_scout_mvp" for scout_plan_build_mvp repo
     """
     try:
-        from adw_modules.github import get_repo_url
-
-        repo_url = get_repo_url()
-        # Extract repo name: "github.com/owner/repo" -> "project_repo"
-        repo_name = repo_url.split("/")[-1].replace(".git", "")
-        return f"project_{repo_name}"
+        return _cached_project_id()
     except Exception as e:
         logger.warning(f"Failed to get project ID from git: {e}")
         return "project_default"
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_project_id() -> str:
+    """Project ID for the current repo; failures are not cached."""
+    from adw_modules.github import get_repo_url
+
+    repo_url = get_repo_url()
+    # Extract repo name: "github.com/owner/repo" -> "project_repo"
+    repo_name = repo_url.split("/")[-1].replace(".git", "")
+    return f"project_{repo_name}"
+
+
+get_project_id.cache_clear = _cached_project_id.cache_clear
+
+
 # ============================================================================
 # Scout Phase Hooks
 # ============================================================================
@@ -177,41 +213,25 @@ def pre_scout_recall(
                 "memories": []
             }
 
-        # Extract files from metadata
-        suggested_files = []
-        for mem in results["results"]:
-            metadata = mem.get("metadata", {})
-            if "files" in metadata:
-                suggested_files.extend(metadata["files"])
-            elif "file" in metadata:
-                suggested_files.append(metadata["file"])
-
-        # Deduplicate and sort by frequency
-        file_counts = {}
-        for f in suggested_files:
-            file_counts[f] = file_counts.get(f, 0) + 1
-
-        sorted_files = sorted(
-            file_counts.keys(),
-            key=lambda x: file_counts[x],
-            reverse=True
-        )
+        # Deduplicate files from metadata and rank by frequency; ties keep
+        # first-seen order
+        file_counts = Counter(_iter_memory_files(results["results"]))
+        sorted_files = [f for f, _ in file_counts.most_common(limit)]
 
         # Generate insights summary
         top_memory = results["results"][0]
         key_insights = top_memory.get("memory", "")[:200]  # Truncate
-        avg_confidence = sum(
-            m.get("score", 0) for m in results["results"]
-        ) / len(results["results"])
+        avg_confidence = fmean(m.get("score", 0.0) for m in results["results"])
 
-        logger.info(
-            f"Memory recall: task='{task_description[:50]}...', "
-            f"confidence={avg_confidence:.2f}, "
-            f"results={len(results['results'])}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Memory recall: task='{task_description[:50]}...', "
+                f"confidence={avg_confidence:.2f}, "
+                f"results={len(results['results'])}"
+            )
 
         return {
-            "suggested_files": sorted_files[:limit],
+            "suggested_files": sorted_files,
             "key_insights": key_insights,
             "confidence": avg_confidence,
             "memories": results["results"]
@@ -227,6 +247,16 @@ def pre_scout_recall(
         }
 
 
+def _iter_memory_files(memories: List[Dict[str, Any]]):
+    """Yield the file paths recorded in each memory's metadata."""
+    for mem in memories:
+        metadata = mem.get("metadata", {})
+        if "files" in metadata:
+            yield from metadata["files"]
+        elif "file" in metadata:
+            yield metadata["file"]
+
+
 def post_scout_learn(
     task_description: str,
     scout_results: Dict[str, Any],
@@ -366,15 +396,14 @@ def pre_plan_recall(
             f"- {pattern[:150]}" for pattern in patterns[:3]
         ])
 
-        avg_confidence = sum(
-            m.get("score", 0) for m in results["results"]
-        ) / len(results["results"])
+        avg_confidence = fmean(m.get("score", 0.0) for m in results["results"])
 
-        logger.info(
-            f"Memory recall: task='{task_description[:50]}...', "
-            f"type={issue_type}, "
-            f"confidence={avg_confidence:.2f}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Memory recall: task='{task_description[:50]}...', "
+                f"type={issue_type}, "
+                f"confidence={avg_confidence:.2f}"
+            )
 
         return {
             "design_patterns": patterns,
@@ -428,11 +457,7 @@ def post_plan_learn(
             plan_content = f.read()
 
         # Extract sections (simplified - could use markdown parser)
-        sections = {
-            "architecture": _extract_section(plan_content, "Architecture"),
-            "risks": _extract_section(plan_content, "Risks"),
-            "implementation": _extract_section(plan_content, "Implementation")
-        }
+        sections = _extract_sections(plan_content, _PLAN_SECTIONS)
 
         # Store architecture decisions
         if sections["architecture"]:
@@ -484,6 +509,21 @@ def post_plan_learn(
         logger.error(f"Memory learning failed (non-blocking): {e}", exc_info=True)
 
 
+# Compiled _extract_section patterns, by section name
+_SECTION_PATTERNS: Dict[str, re.Pattern[str]] = {}
+
+
+def _get_section_pattern(section_name: str) -> re.Pattern[str]:
+    """Compiled pattern matching a markdown section and capturing its body."""
+    pattern = _SECTION_PATTERNS.get(section_name)
+    if pattern is None:
+        pattern = _SECTION_PATTERNS[section_name] = re.compile(
+            rf"#{{1,3}}\s+{re.escape(section_name)}[^\n]*\n(.*?)(?=\n#{{1,3}}\s+|\Z)",
+            re.IGNORECASE | re.DOTALL,
+        )
+    return pattern
+
+
 def _extract_section(content: str, section_name: str) -> str:
     """Extract content from markdown section.
 
@@ -494,15 +534,57 @@ def _extract_section(content: str, section_name: str) -> str:
     Returns:
         Section content or empty string if not found
     """
-    # Look for section header (# or ##)
-    pattern = rf"#{1,3}\s+{section_name}[^\n]*\n(.*?)(?=\n#{1,3}\s+|\Z)"
-    match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+    # Look for section header (# to ###)
+    match = _get_section_pattern(section_name).search(content)
 
     if match:
         return match.group(1).strip()
     return ""
 
 
+# Sections post_plan_learn reads from a plan
+_PLAN_SECTIONS = ("architecture", "risks", "implementation")
+
+# Where _extract_section can match a header: "#" to "###" plus whitespace,
+# anywhere in a line, so the tail of a "####" header counts too
+_HEADER_START_RE = re.compile(r"#{1,3}\s+")
+
+# Where _extract_section ends a section body
+_SECTION_END_RE = re.compile(r"\n#{1,3}\s+")
+
+
+def _extract_sections(content: str, names: Tuple[str, ...]) -> Dict[str, str]:
+    """Extract several markdown sections in one pass over the headers.
+
+    Gives the same result as calling _extract_section for each name, quirks
+    included: headers are found anywhere in a line (so "####" headers
+    match), the first header starting with the name wins, and the body runs
+    to the next "#" to "###" header even when that header directly follows.
+
+    Args:
+        content: Full markdown content
+        names: Section names to find
+
+    Returns:
+        Section content by name, empty string for sections not found
+    """
+    sections = dict.fromkeys(names, "")
+    wanted = {name: name.lower() for name in names}
+    for header in _HEADER_START_RE.finditer(content):
+        title_start = header.end()
+        line_end = content.find("\n", title_start)
+        if line_end < 0:
+            break
+        for name, prefix in list(wanted.items()):
+            if content[title_start:title_start + len(prefix)].lower() == prefix:
+                end = _SECTION_END_RE.search(content, line_end + 1)
+                sections[name] = content[line_end + 1:end.start() if end else len(content)].strip()
+                del wanted[name]
+        if not wanted:
+            break
+    return sections
+
+
 # ============================================================================
 # Build Phase Hooks
 # ============================================================================
@@ -573,6 +655,11 @@ def post_build_learn(
         logger.error(f"Memory learning failed (non-blocking): {e}", exc_info=True)
 
 
+_FILES_CHANGED_RE = re.compile(
+    r"(?:Modified|Created|Updated):\s*([^\s]+\.(?:py|js|ts|md))", re.MULTILINE
+)
+
+
 def _extract_files_changed(report_content: str) -> List[str]:
     """Extract list of files changed from build report.
 
@@ -582,12 +669,21 @@ def _extract_files_changed(report_content: str) -> List[str]:
     Returns:
         List of file paths
     """
-    files = []
     # Look for common patterns: "Modified: path/to/file.py"
-    pattern = r"(?:Modified|Created|Updated):\s*([^\s]+\.(?:py|js|ts|md))"
-    matches = re.findall(pattern, report_content, re.MULTILINE)
-    files.extend(matches)
-    return list(set(files))  # Deduplicate
+    matches = _FILES_CHANGED_RE.findall(report_content)
+    return list(dict.fromkeys(matches))  # Deduplicate, keeping report order
+
+
+# import/from/require statements in one scan. Module names are captured in
+# lookaheads so they stay scannable: "from x import y" yields x and then y.
+_LIBRARY_RE = re.compile(
+    r"import\s+(?=(?P<i>\w+))"
+    r"|from\s+(?=(?P<f>\w+)\s+import)"
+    r"|require\(['\"](?P<r>\w+)['\"]\)"
+)
+
+# Standard library modules not worth remembering as dependencies
+_BUILTIN_MODULES = frozenset({"os", "sys", "re", "json", "time", "datetime"})
 
 
 def _extract_libraries(report_content: str) -> List[str]:
@@ -599,23 +695,16 @@ def _extract_libraries(report_content: str) -> List[str]:
     Returns:
         List of library names
     """
+    # Look for import/require statements mentioned in report, skipping
+    # common builtins and repeats (first mention order is kept)
     libraries = []
-    # Look for import/require statements mentioned in report
-    patterns = [
-        r"import\s+(\w+)",
-        r"from\s+(\w+)\s+import",
-        r"require\(['\"](\w+)['\"]\)"
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, report_content)
-        libraries.extend(matches)
-
-    # Filter out common builtins
-    builtins = {"os", "sys", "re", "json", "time", "datetime"}
-    libraries = [lib for lib in libraries if lib not in builtins]
-
-    return list(set(libraries))  # Deduplicate
+    seen = set(_BUILTIN_MODULES)
+    for match in _LIBRARY_RE.finditer(report_content):
+        lib = match.group("i") or match.group("f") or match.group("r")
+        if lib not in seen:
+            seen.add(lib)
+            libraries.append(lib)
+    return libraries
 
 
 # ============================================================================
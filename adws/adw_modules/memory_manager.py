@@ -24,6 +24,8 @@ import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+from .memory import tune_vector_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,6 +104,7 @@ class MemoryManager:
             else:
                 self._memory = Memory()
                 self.logger.info("Mem0 initialized with default config")
+            self._tune_vector_store()
 
             self._initialized = True
 
@@ -119,6 +122,26 @@ class MemoryManager:
         try:
             from mem0.configs.base import MemoryConfig
 
+            # In-process FAISS index instead of Qdrant
+            backend = os.getenv("ADW_MEMORY_BACKEND", "").strip().lower()
+            if backend == "faiss":
+                store_config = {
+                    "collection_name": "adw_memories",
+                    "distance_strategy": "cosine",
+                }
+                faiss_path = os.getenv("ADW_MEMORY_FAISS_PATH")
+                if faiss_path:
+                    store_config["path"] = faiss_path
+                self.logger.info("Using FAISS vector store")
+                return MemoryConfig(
+                    vector_store={"provider": "faiss", "config": store_config}
+                )
+            if backend and backend != "qdrant":
+                self.logger.warning(
+                    f"Unsupported ADW_MEMORY_BACKEND '{backend}' "
+                    "(expected qdrant or faiss), using Qdrant"
+                )
+
             # Check for custom Qdrant path
             qdrant_path = os.getenv("ADW_MEMORY_QDRANT_PATH")
             if qdrant_path:
@@ -140,6 +163,14 @@ class MemoryManager:
             self.logger.error(f"Failed to load custom config: {e}")
             return None
 
+    def _tune_vector_store(self):
+        """Apply the MEM0_HNSW_PROFILE / MEM0_QUANTIZATION collection settings.
+
+        Uses the same helper as PersistentLearningsLayer, so both memory
+        paths tune Qdrant from one set of environment variables.
+        """
+        tune_vector_store(self._memory)
+
     def is_available(self) -> bool:
         """Check if mem0 is available and working.
 
@@ -28,7 +28,7 @@ from dotenv import load_dotenv
 from adw_modules.state import ADWState
 from adw_modules.git_ops import create_branch, commit_changes, finalize_git_operations
 from adw_modules.github import (
-    fetch_issue,
+    fetch_issue_meta,
     make_issue_comment,
     get_repo_url,
     extract_repo_path,
@@ -107,7 +107,7 @@ def main():
         sys.exit(1)
 
     # Fetch issue details
-    issue: GitHubIssue = fetch_issue(issue_number, repo_path)
+    issue: GitHubIssue = fetch_issue_meta(issue_number, repo_path)
 
     logger.debug(f"Fetched issue: {issue.model_dump_json(indent=2, by_alias=True)}")
     make_issue_comment(
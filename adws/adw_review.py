@@ -32,7 +32,7 @@ from dotenv import load_dotenv
 from adw_modules.state import ADWState
 from adw_modules.git_ops import commit_changes, finalize_git_operations
 from adw_modules.github import (
-    fetch_issue,
+    fetch_issue_meta,
     make_issue_comment,
     get_repo_url,
     extract_repo_path,
@@ -609,7 +609,7 @@ def main():
 
                 # Commit the resolution changes
                 logger.info("Committing resolution changes")
-                review_issue = fetch_issue(issue_number, repo_path)
+                review_issue = fetch_issue_meta(issue_number, repo_path)
                 issue_command = state.get("issue_class", "/chore")
 
                 # Use a generic review patch implementor name for the commit
@@ -684,7 +684,7 @@ def main():
             )
 
     logger.info("Fetching issue data for commit message")
-    review_issue = fetch_issue(issue_number, repo_path)
+    review_issue = fetch_issue_meta(issue_number, repo_path)
 
     # Get issue classification from state
     issue_command = state.get("issue_class", "/chore")
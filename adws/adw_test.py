@@ -40,7 +40,7 @@ from adw_modules.data_types import (
 from adw_modules.agent import execute_template
 from adw_modules.github import (
     extract_repo_path,
-    fetch_issue,
+    fetch_issue_meta,
     make_issue_comment,
     get_repo_url,
 )
@@ -1031,7 +1031,7 @@ def main():
 
         # Fetch issue details if we haven't already
         if not issue:
-            issue = fetch_issue(issue_number, repo_path)
+            issue = fetch_issue_meta(issue_number, repo_path)
 
         # Get issue classification if we need it for commit
         if not issue_class:
@@ -0,0 +1,231 @@
+"""Tests for prompt assembly in the context augmentation layer."""
+
+import logging
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from adw_modules import context_augmentation
+from adw_modules.context_augmentation import AugmentedContext, ContextAugmenter
+from adw_modules.gemini_search import QueryType, SearchResult, Snippet
+
+
+class FakeMemory:
+    """Returns fixed hints per phase and records discoveries."""
+
+    enabled = True
+
+    def __init__(self):
+        self.discoveries = []
+
+    def get_scout_hints(self, task):
+        return "1. [discovery_pattern] auth lives in middleware"
+
+    def get_planning_lessons(self, task):
+        return "1. [decision] use typer for the CLI"
+
+    def get_build_patterns(self):
+        return ""
+
+    def record_discovery(self, task, files, source):
+        self.discoveries.append((task, files, source))
+
+
+class FakeSearch:
+    """Returns fixed snippets and records search queries."""
+
+    gemini_enabled = False
+
+    def __init__(self, snippets):
+        self.snippets = snippets
+        self.queries = []
+
+    def hybrid_search(self, query, path_filter=None, language_filter=None, limit=10):
+        self.queries.append(query)
+        return SearchResult(
+            query=query,
+            query_type=QueryType.HYBRID,
+            snippets=self.snippets,
+            sources_used=["ripgrep"],
+        )
+
+
+@pytest.fixture
+def augmenter():
+    """Augmenter over fake memory and search with two snippets."""
+    snippets = [
+        Snippet("src/auth.py", "def login(): ...", line_start=12, source="gemini"),
+        Snippet("README.md", "x" * 600),
+    ]
+    return ContextAugmenter("proj", memory=FakeMemory(), search_client=FakeSearch(snippets))
+
+
+CONTEXT_BLOCK = (
+    "### 1. `src/auth.py:12` [gemini]\n\n```\ndef login(): ...\n```\n\n"
+    "### 2. `README.md` \n\n```\n" + "x" * 500 + "\n... (truncated)\n```"
+)
+
+SCOUT_PROMPT = (
+    "You are a scout.\n"
+    "\n## LEARNED PATTERNS (from past similar tasks)\n\n"
+    "1. [discovery_pattern] auth lives in middleware\n"
+    "\n"
+    "\n## DISCOVERED CONTEXT (from codebase search)\n\n"
+    "The following code snippets may be relevant to this task:\n\n"
+    + CONTEXT_BLOCK + "\n\n---\n"
+)
+
+PLAN_PROMPT = (
+    "You are a planner.\n"
+    "\n## LEARNED PATTERNS (from past similar tasks)\n\n"
+    "1. [decision] use typer for the CLI\n"
+    "\n"
+    "\n## PLANNING CONTEXT (from codebase search)\n\n"
+    "The following code snippets may be relevant to this task:\n\n"
+    + CONTEXT_BLOCK + "\n\n---\n"
+)
+
+BUILD_PROMPT = (
+    "You are a builder.\n"
+    "\n## IMPLEMENTATION CONTEXT (from codebase search)\n\n"
+    "The following code snippets may be relevant to this task:\n\n"
+    + CONTEXT_BLOCK + "\n\n---\n"
+)
+
+
+class TestPhaseAugmenters:
+    """Test augment_scout/plan/build build the same prompts as before."""
+
+    @pytest.mark.parametrize("phase, base_prompt, expected", [
+        ("scout", "You are a scout.", SCOUT_PROMPT),
+        ("plan", "You are a planner.", PLAN_PROMPT),
+        ("build", "You are a builder.", BUILD_PROMPT),
+    ])
+    def test_prompt(self, augmenter, phase, base_prompt, expected):
+        """Test each phase method assembles the expected prompt."""
+        result = getattr(augmenter, f"augment_{phase}")("add login", base_prompt)
+        assert result.augmented_prompt == expected
+        assert result.context_block == CONTEXT_BLOCK
+        assert result.total_snippets == 2
+
+    @pytest.mark.parametrize("phase", ["scout", "plan", "build"])
+    def test_matches_generic_entry_point(self, augmenter, phase):
+        """Test phase methods agree with augment_prompt_with_context."""
+        fixed = getattr(augmenter, f"augment_{phase}")("add login", "base")
+        generic = augmenter.augment_prompt_with_context("add login", "base", phase=phase)
+        assert fixed.augmented_prompt == generic.augmented_prompt
+        assert fixed.sources_used == generic.sources_used
+
+    def test_unknown_phase_uses_generic_header(self, augmenter):
+        """Test an unknown phase gets no hints and the plain CONTEXT header."""
+        result = augmenter.augment_prompt_with_context("add login", "base", phase="review")
+        assert result.memory_hints == ""
+        assert "\n## CONTEXT (from codebase search)\n" in result.augmented_prompt
+
+    def test_hints_steer_search_and_discovery_recorded(self, augmenter):
+        """Test memory hints extend the search query and files are recorded."""
+        result = augmenter.augment_scout("add login", "base")
+        assert augmenter.search.queries == [
+            "add login\n\nPast patterns that may help: "
+            "1. [discovery_pattern] auth lives in middleware"
+        ]
+        assert result.sources_used == ["memory", "ripgrep"]
+        assert augmenter.memory.discoveries == [
+            ("add login", ["src/auth.py", "README.md"], "hybrid_search")
+        ]
+
+
+class TestContextBlock:
+    """Test formatting of the snippet context block."""
+
+    def test_formats_only_first_snippets(self, augmenter):
+        """Test snippets past max_snippets are not formatted."""
+        snippets = [Snippet(f"src/m{i}.py", f"body {i}") for i in range(50)]
+        block = augmenter._format_context_block(
+            SearchResult("q", QueryType.HYBRID, snippets), max_snippets=2
+        )
+        assert block == (
+            "### 1. `src/m0.py` \n\n```\nbody 0\n```\n\n"
+            "### 2. `src/m1.py` \n\n```\nbody 1\n```"
+        )
+
+    def test_empty(self, augmenter):
+        """Test an empty result has a placeholder."""
+        block = augmenter._format_context_block(SearchResult("q", QueryType.HYBRID, []), 5)
+        assert block == "No relevant code snippets found."
+
+
+class TestAugmentedPrompt:
+    """Test the augmented prompt text."""
+
+    def test_prompt_is_text(self, augmenter):
+        """Test the augmented prompt is returned as text."""
+        result = augmenter.augment_scout("add login", "Prüfe den Login.")
+        assert isinstance(result.augmented_prompt, str)
+        assert result.augmented_prompt.startswith("Prüfe den Login.\n")
+
+    def test_constructed_with_prompt_text(self):
+        """Test AugmentedContext still takes augmented_prompt as a field."""
+        result = AugmentedContext(
+            original_prompt="base",
+            augmented_prompt="base + context",
+            memory_hints="",
+            search_results=SearchResult("q", QueryType.HYBRID, []),
+            context_block="",
+            total_snippets=0,
+        )
+        assert result.augmented_prompt == "base + context"
+
+    @pytest.mark.parametrize("function, base_prompt, expected", [
+        ("augment_for_scout", "You are a scout.", SCOUT_PROMPT),
+        ("augment_for_plan", "You are a planner.", PLAN_PROMPT),
+        ("augment_for_build", "You are a builder.", BUILD_PROMPT),
+    ])
+    def test_convenience_functions(self, augmenter, monkeypatch, function, base_prompt, expected):
+        """Test augment_for_* return the prompt text from the default augmenter."""
+        monkeypatch.setattr(context_augmentation, "_default_augmenter", augmenter)
+        assert getattr(context_augmentation, function)("add login", base_prompt) == expected
+
+
+class TestFileList:
+    """Test the file list used by quick_context."""
+
+    def test_lines_match_previous_format(self, augmenter):
+        """Test source and line suffixes appear only when known."""
+        assert augmenter._format_file_list(augmenter.search.snippets) == (
+            "- `src/auth.py` (gemini) line 12\n"
+            "- `README.md`"
+        )
+
+    def test_empty(self, augmenter):
+        """Test an empty snippet list has a placeholder."""
+        assert augmenter._format_file_list([]) == "No files found."
+
+    def test_quick_context(self, augmenter):
+        """Test quick_context combines hints and the file list."""
+        assert augmenter.quick_context("add login") == (
+            "## Past Patterns\n1. [discovery_pattern] auth lives in middleware\n\n"
+            "## Relevant Files\n- `src/auth.py` (gemini) line 12\n- `README.md`"
+        )
+
+
+class TestDebugLogging:
+    """Test the lazily formatted debug messages."""
+
+    def test_messages_rendered(self, augmenter, caplog):
+        """Test hint and discovery messages read as they did with f-strings."""
+        with caplog.at_level(logging.DEBUG):
+            augmenter.augment_scout("add login", "base")
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Got memory hints: 47 chars" in messages
+        assert "Recorded discovery: 2 files" in messages
+
+    def test_prompt_unchanged_with_debug_enabled(self, augmenter, caplog):
+        """Test enabling debug logging does not change the prompt."""
+        with caplog.at_level(logging.DEBUG):
+            result = augmenter.augment_scout("add login", "You are a scout.")
+        assert result.augmented_prompt == SCOUT_PROMPT
@@ -0,0 +1,214 @@
+"""Tests for the structured ADW exception hierarchy."""
+
+import copy
+import json
+import logging
+import pickle
+import subprocess
+import sys
+import os
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from adw_modules import exceptions
+from adw_modules.exceptions import (
+    ADWError,
+    GitOperationError,
+    RateLimitError,
+    EnvironmentError,
+    StateError,
+    ValidationError,
+    get_recovery_strategy,
+    handle_error,
+)
+
+
+class TestADWError:
+    """Test base exception behaviour."""
+
+    def test_timestamp_is_datetime(self):
+        """Test timestamp property returns a datetime."""
+        error = ADWError("boom")
+        assert isinstance(error.timestamp, datetime)
+
+    def test_timestamp_matches_epoch(self):
+        """Test lazy timestamp is derived from the stored epoch and cached."""
+        error = ADWError("boom")
+        assert error.timestamp == datetime.fromtimestamp(error.timestamp_epoch)
+        assert error.timestamp is error.timestamp
+
+    def test_to_dict(self):
+        """Test dictionary serialization."""
+        error = ADWError("boom", {"key": "value"}, correlation_id="abc")
+        data = error.to_dict()
+        assert data["error_type"] == "ADWError"
+        assert data["message"] == "boom"
+        assert data["context"] == {"key": "value"}
+        assert data["correlation_id"] == "abc"
+        datetime.fromisoformat(data["timestamp"])
+
+    def test_to_json_bytes_matches_to_dict(self):
+        """Test JSON bytes carry the same fields as to_dict."""
+        error = ADWError("boom", {"path": object()})
+        data = json.loads(error.to_json_bytes())
+        assert data["error_type"] == "ADWError"
+        assert data["timestamp"] == error.to_dict()["timestamp"]
+        assert isinstance(data["context"]["path"], str)
+
+    @pytest.mark.parametrize("clone", [
+        lambda error: pickle.loads(pickle.dumps(error)),
+        copy.copy,
+        copy.deepcopy,
+    ], ids=["pickle", "copy", "deepcopy"])
+    def test_round_trip_keeps_fields(self, clone):
+        """Test pickling and copying keep message, context and raise time."""
+        error = GitOperationError("x", command="git x", returncode=1)
+        error.correlation_id = "abc"
+        restored = clone(error)
+        assert type(restored) is GitOperationError
+        assert restored.message == "x"
+        assert restored.context == {"command": "git x", "returncode": 1}
+        assert restored.correlation_id == "abc"
+        assert restored.timestamp_epoch == error.timestamp_epoch
+
+
+class TestContextMerging:
+    """Test keyword arguments are merged into context."""
+
+    def test_git_operation_error(self):
+        """Test git error context fields."""
+        error = GitOperationError("failed", command="git push", returncode=1, branch="main")
+        assert error.context == {"command": "git push", "returncode": 1, "branch": "main"}
+
+    def test_validation_error_without_field(self):
+        """Test omitted field is not added to context."""
+        error = ValidationError("bad input")
+        assert error.context == {}
+
+
+class TestHandleError:
+    """Test centralized error handling."""
+
+    def test_logs_and_summarizes(self, caplog):
+        """Test handler logs the error and reports recoverability."""
+        logger = logging.getLogger("test_exceptions")
+        with caplog.at_level(logging.WARNING, logger="test_exceptions"):
+            result = handle_error(RateLimitError("slow down", retry_after=5), logger)
+        assert result["recoverable"] is True
+        assert result["context"] == {"retry_after": 5}
+        assert "RateLimitError: slow down" in caplog.text
+        payload = json.loads(caplog.records[0].adw_error)
+        assert payload["context"] == {"retry_after": 5}
+
+    def test_skips_serialization_when_disabled(self, monkeypatch):
+        """Test the JSON payload is not built for a disabled level."""
+        logger = logging.getLogger("test_exceptions.disabled")
+        logger.setLevel(logging.CRITICAL)
+        calls = []
+        monkeypatch.setattr(ADWError, "to_json_bytes", lambda self: calls.append(self))
+        result = handle_error(ValidationError("bad", field="name"), logger)
+        assert result["recoverable"] is False
+        assert calls == []
+
+
+class TestRecoveryStrategy:
+    """Test recovery strategy lookup."""
+
+    def test_parameterized_strategies(self):
+        """Test strategies that read error context."""
+        assert "Wait 30 seconds" in get_recovery_strategy(RateLimitError("x", retry_after=30))
+        assert "field 'name'" in get_recovery_strategy(ValidationError("x", field="name"))
+        assert "GITHUB_PAT" in get_recovery_strategy(
+            EnvironmentError("x", missing_vars=["GITHUB_PAT"])
+        )
+
+    def test_subclass_uses_parent_strategy(self):
+        """Test lookup falls back through the class hierarchy."""
+        class CorruptStateError(StateError):
+            pass
+
+        assert get_recovery_strategy(CorruptStateError("x")) == get_recovery_strategy(StateError("x"))
+
+    def test_unknown_error(self):
+        """Test base errors get the generic strategy."""
+        assert "contact support" in get_recovery_strategy(ADWError("x"))
+
+
+@pytest.fixture
+def comment_executor(monkeypatch):
+    """Fresh comment executor with recording GitHub helpers patched in."""
+    posted = []
+
+    def make_issue_comment(issue_number, comment):
+        time.sleep(0.05)
+        if "fail" in comment:
+            raise RuntimeError("gh unavailable")
+        posted.append((issue_number, comment))
+
+    def format_issue_message(adw_id, agent, message):
+        return f"{adw_id}_{agent}: {message}"
+
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gh-comment-test")
+    monkeypatch.setattr(exceptions, "_comment_executor", executor)
+    monkeypatch.setattr(exceptions, "_make_issue_comment", make_issue_comment)
+    monkeypatch.setattr(exceptions, "_format_issue_message", format_issue_message)
+    yield executor, posted
+    executor.shutdown(wait=True)
+
+
+class TestBackgroundComment:
+    """Test GitHub comments posted off the error path."""
+
+    def test_comment_posted(self, comment_executor):
+        """Test handle_error queues the formatted comment for the issue."""
+        executor, posted = comment_executor
+        handle_error(RateLimitError("slow down"), logging.getLogger("test_exceptions"), "7", "abc123")
+        executor.shutdown(wait=True)
+        assert posted == [("7", "abc123_error_handler: ⚠️ RateLimitError: slow down")]
+
+    def test_no_comment_without_issue(self, comment_executor):
+        """Test nothing is posted without both issue number and ADW ID."""
+        executor, posted = comment_executor
+        handle_error(StateError("lost"), logging.getLogger("test_exceptions"), "7")
+        executor.shutdown(wait=True)
+        assert posted == []
+
+    def test_failure_swallowed_and_logged(self, comment_executor, caplog):
+        """Test a failing comment is logged, not raised, from the worker."""
+        executor, posted = comment_executor
+        logger = logging.getLogger("test_exceptions")
+        with caplog.at_level(logging.WARNING, logger="test_exceptions"):
+            result = handle_error(ValidationError("fail here"), logger, "7", "abc123")
+            assert result["recoverable"] is False
+            executor.shutdown(wait=True)
+        assert posted == []
+        assert "Failed to post error to GitHub: gh unavailable" in caplog.text
+
+    def test_queued_comments_drained_at_exit(self, tmp_path):
+        """Test comments still queued when the interpreter exits are posted."""
+        out = tmp_path / "posted.txt"
+        script = textwrap.dedent(f"""
+            import logging, sys, time
+            sys.path.insert(0, {os.path.dirname(os.path.dirname(os.path.abspath(__file__)))!r})
+            from adw_modules import exceptions
+
+            def make_issue_comment(issue_number, comment):
+                time.sleep(0.2)
+                with open({str(out)!r}, "a") as f:
+                    f.write(issue_number + "\\n")
+
+            exceptions._make_issue_comment = make_issue_comment
+            exceptions._format_issue_message = lambda adw_id, agent, message: message
+            logger = logging.getLogger("exit")
+            for issue in ("1", "2", "3"):
+                exceptions.handle_error(exceptions.StateError("lost"), logger, issue, "abc123")
+        """)
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+        assert sorted(out.read_text().split()) == ["1", "2", "3"]
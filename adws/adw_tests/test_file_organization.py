@@ -0,0 +1,240 @@
+"""Tests for standardized ADW output file organization."""
+
+import json
+import shutil
+import sys
+import threading
+import types
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adw_modules import file_organization
+from adw_modules.file_organization import FileOrganizer, get_file_organizer
+
+
+@pytest.fixture
+def organizer(tmp_path, monkeypatch):
+    """FileOrganizer rooted in a temporary working directory."""
+    monkeypatch.chdir(tmp_path)
+    return FileOrganizer()
+
+
+class TestTaskDirectory:
+    """Test task directory creation."""
+
+    def test_creates_metadata(self, organizer):
+        """Test metadata.json is written with task details."""
+        task_dir = organizer.create_task_directory("Add Auth!", adw_id="ABC123")
+        metadata = json.loads((task_dir / "metadata.json").read_text())
+        assert metadata["task"] == "Add Auth!"
+        assert metadata["adw_id"] == "ABC123"
+        assert task_dir.name.endswith("-ABC123-add_auth_")
+
+    def test_created_orders_within_one_second(self, organizer, monkeypatch):
+        """Test directories made in the same second keep their creation order."""
+        clock = iter([1_700_000_000.25, 1_700_000_000.5])
+        monkeypatch.setattr(file_organization, "time", types.SimpleNamespace(time=lambda: next(clock)))
+        first = organizer.create_task_directory("first")
+        second = organizer.create_task_directory("second")
+        created = [json.loads((d / "metadata.json").read_text())["created"] for d in (first, second)]
+        assert created[0] < created[1]
+        assert created[0].endswith(".250000")
+
+    def test_updates_latest(self, organizer):
+        """Test latest link follows the newest task directory."""
+        organizer.create_task_directory("first")
+        second = organizer.create_task_directory("second")
+        assert organizer.get_latest_directory() == second.resolve()
+
+    def test_replaces_dangling_latest(self, organizer):
+        """Test a latest link to a removed directory is replaced."""
+        (organizer.base_dir / "latest").symlink_to("missing-dir")
+        task_dir = organizer.create_task_directory("fresh")
+        assert organizer.get_latest_directory() == task_dir.resolve()
+
+    def test_removed_dirs_recreated(self, organizer):
+        """Test a new organizer recreates directories removed since the last one."""
+        shutil.rmtree("scout_outputs")
+        shutil.rmtree(organizer.base_dir)
+        fresh = FileOrganizer()
+        fresh.save_scout_output({"files": []})
+        assert (fresh.legacy_dirs["scout"] / "relevant_files.json").exists()
+
+
+class TestSharedOrganizer:
+    """Test the process-wide organizer accessor."""
+
+    def test_reuses_instance_per_base_dir(self, tmp_path, monkeypatch):
+        """Test repeat calls return the same organizer."""
+        monkeypatch.chdir(tmp_path)
+        assert get_file_organizer() is get_file_organizer()
+        assert get_file_organizer("other") is not get_file_organizer()
+
+
+class TestSaveOutputs:
+    """Test scout/plan/build output writers."""
+
+    def test_scout_output_written_twice(self, organizer):
+        """Test scout output lands in task dir and legacy location."""
+        task_dir = organizer.create_task_directory("scout")
+        data = {"files": ["a.py", "b.py"], "note": "naïve"}
+        output_file = organizer.save_scout_output(data, task_dir)
+        legacy_file = organizer.legacy_dirs["scout"] / "relevant_files.json"
+        assert json.loads(output_file.read_text(encoding="utf-8")) == data
+        assert json.loads(legacy_file.read_text(encoding="utf-8")) == data
+
+    def test_legacy_scout_copy_is_independent(self, organizer):
+        """Test rewriting the legacy file leaves the task-dir copy intact."""
+        task_dir = organizer.create_task_directory("scout")
+        output_file = organizer.save_scout_output({"files": ["a.py"]}, task_dir)
+        legacy_file = organizer.legacy_dirs["scout"] / "relevant_files.json"
+        with open(legacy_file, "w") as f:
+            f.write("{}")
+        assert json.loads(output_file.read_text()) == {"files": ["a.py"]}
+
+    def test_unchanged_legacy_scout_not_rewritten(self, organizer):
+        """Test identical payloads skip the legacy write."""
+        data = {"files": ["a.py"]}
+        organizer.save_scout_output(data, organizer.create_task_directory("one"))
+        legacy_file = organizer.legacy_dirs["scout"] / "relevant_files.json"
+        inode = legacy_file.stat().st_ino
+        mtime = legacy_file.stat().st_mtime_ns
+        organizer.save_scout_output(data, organizer.create_task_directory("two"))
+        assert legacy_file.stat().st_ino == inode
+        assert legacy_file.stat().st_mtime_ns == mtime
+        assert sorted(p.name for p in legacy_file.parent.iterdir()) == ["relevant_files.json"]
+
+    def test_externally_rewritten_legacy_scout_is_restored(self, organizer):
+        """Test a legacy file changed by another writer is refreshed."""
+        data = {"files": ["a.py"]}
+        organizer.save_scout_output(data, organizer.create_task_directory("one"))
+        legacy_file = organizer.legacy_dirs["scout"] / "relevant_files.json"
+        legacy_file.write_text('{"files": []}')
+        organizer.save_scout_output(data, organizer.create_task_directory("two"))
+        assert json.loads(legacy_file.read_text()) == data
+
+    def test_plan_output(self, organizer):
+        """Test plan is saved to specs and task directory."""
+        task_dir = organizer.create_task_directory("plan")
+        spec_file = organizer.save_plan_output("# Plan", "7", "ABC123", "slug", task_dir)
+        assert spec_file.name == "issue-7-adw-ABC123-slug.md"
+        assert spec_file.read_text() == "# Plan"
+        assert (task_dir / "plan.md").read_text() == "# Plan"
+
+    def test_build_output(self, organizer):
+        """Test build report is saved to legacy and task directory."""
+        task_dir = organizer.create_task_directory("build")
+        report = organizer.save_build_output("# Report", "slug", task_dir)
+        assert report.read_text() == "# Report"
+        assert (task_dir / "build-report.md").read_text() == "# Report"
+
+
+class TestCleanup:
+    """Test removal of old task directories."""
+
+    def test_removes_only_old_directories(self, organizer):
+        """Test directories past the cutoff are removed, latest is kept."""
+        old_dir = organizer.create_task_directory("old")
+        new_dir = organizer.create_task_directory("new")
+        os.utime(old_dir, (0, 0))
+        organizer.cleanup_old_outputs(days=7, dry_run=False)
+        assert not old_dir.exists()
+        assert new_dir.exists()
+        assert (organizer.base_dir / "latest").is_symlink()
+
+    def test_removes_nested_content_without_following_links(self, organizer, tmp_path):
+        """Test nested files are removed and symlink targets survive."""
+        old_dir = organizer.create_task_directory("old")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        (old_dir / "nested" / "deeper").mkdir(parents=True)
+        (old_dir / "nested" / "deeper" / "file.txt").write_text("x")
+        (old_dir / "link").symlink_to(outside)
+        os.utime(old_dir, (0, 0))
+        organizer.cleanup_old_outputs(days=7, dry_run=False)
+        assert not old_dir.exists()
+        assert (outside / "keep.txt").exists()
+
+    def test_removes_many_directories(self, organizer):
+        """Test every stale directory is removed by the worker pool."""
+        stale = [organizer.base_dir / f"old-{i}" for i in range(20)]
+        for path in stale:
+            (path / "sub").mkdir(parents=True)
+            (path / "sub" / "f.txt").write_text("x")
+            os.utime(path, (0, 0))
+        organizer.cleanup_old_outputs(days=7, dry_run=False)
+        assert not any(path.exists() for path in stale)
+
+    def test_dry_run_keeps_directories(self, organizer):
+        """Test dry run reports without deleting."""
+        old_dir = organizer.create_task_directory("old")
+        os.utime(old_dir, (0, 0))
+        organizer.cleanup_old_outputs(days=7, dry_run=True)
+        assert old_dir.exists()
+
+
+class TestConsolidate:
+    """Test consolidation of scattered root files."""
+
+    def test_moves_matching_files_once(self, organizer, tmp_path):
+        """Test matching files are moved and expected files are kept."""
+        for name in ("README.md", "MEOW_loader.md", "x_relevant_files.json", "notes.txt"):
+            (tmp_path / name).write_text(name)
+        organizer.consolidate_scattered_files(dry_run=False)
+        consolidated = organizer.base_dir / "consolidated"
+        assert sorted(p.name for p in consolidated.iterdir()) == [
+            "MEOW_loader.md", "x_relevant_files.json"
+        ]
+        assert (tmp_path / "README.md").exists()
+        assert (tmp_path / "notes.txt").exists()
+
+
+class TestStreamingOutputs:
+    """Test chunked plan/build writers."""
+
+    def test_plan_stream(self, organizer):
+        """Test chunks are concatenated into both destinations."""
+        task_dir = organizer.create_task_directory("plan")
+        chunks = (part for part in ["# Plan\n", "## Steps\n", "- one\n"])
+        spec_file = organizer.save_plan_output_stream(chunks, "7", "ABC123", "slug", task_dir)
+        expected = "# Plan\n## Steps\n- one\n"
+        assert spec_file.read_text() == expected
+        assert (task_dir / "plan.md").read_text() == expected
+
+    def test_build_stream_without_task_dir(self, organizer):
+        """Test build report stream with only the legacy destination."""
+        report = organizer.save_build_output_stream(["a", "b"], "slug")
+        assert report.read_text() == "ab"
+
+    def test_failed_stream_leaves_previous_file(self, organizer):
+        """Test an interrupted write keeps the old content and no temp file."""
+        report = organizer.save_build_output("# Old", "slug")
+
+        def chunks():
+            yield "# New"
+            raise RuntimeError("generator failed")
+
+        with pytest.raises(RuntimeError):
+            organizer.save_build_output_stream(chunks(), "slug")
+        assert report.read_text() == "# Old"
+        assert [p.name for p in report.parent.iterdir()] == [report.name]
+
+    def test_concurrent_writers_do_not_tear(self, organizer):
+        """Test threads writing one target each leave a complete payload."""
+        payloads = [f"# Report {i}\n" + str(i) * 200_000 for i in range(8)]
+        barrier = threading.Barrier(len(payloads))
+
+        def write(content):
+            barrier.wait()
+            return organizer.save_build_output(content, "slug")
+
+        with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+            reports = list(executor.map(write, payloads))
+        assert reports[0].read_text() in payloads
+        assert [p.name for p in reports[0].parent.iterdir()] == [reports[0].name]
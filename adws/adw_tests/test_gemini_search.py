@@ -0,0 +1,456 @@
+"""Tests for hybrid search query routing and result handling."""
+
+import shutil
+import sys
+import os
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from adw_modules import gemini_search
+from adw_modules.gemini_search import (
+    HybridSearchClient,
+    QueryType,
+    Snippet,
+    _add_file_mentions,
+    _grounding_snippets,
+    classify_query,
+)
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Search client rooted in an empty temporary project."""
+    return HybridSearchClient(project_root=str(tmp_path))
+
+
+class TestSnippet:
+    """Test Snippet identity."""
+
+    def test_hash_uses_location(self):
+        """Test the hash covers path and line range only."""
+        a = Snippet("a.py", "one", 1, 2, score=0.5)
+        b = Snippet("a.py", "two", 1, 2, score=0.9)
+        assert hash(a) == hash(b) == hash(("a.py", 1, 2))
+        assert a != b
+        assert "_hash" not in repr(a)
+
+
+class TestClassifyQuery:
+    """Test query tier classification."""
+
+    @pytest.mark.parametrize("query", [
+        "How does billing work?",
+        "WHY does it fail",
+        "explain caching",
+        "Where  is main",
+        "similar  to x",
+    ])
+    def test_conceptual(self, query):
+        """Test questions and understanding queries route to Gemini."""
+        assert classify_query(query) == QueryType.CONCEPTUAL
+
+    @pytest.mark.parametrize("query", [
+        "'API_KEY'",
+        "grep foo",
+        "usages of parse_args",
+        "FUNCTION Foo",
+        "class Foo",
+        "foo*bar",
+    ])
+    def test_literal(self, query):
+        """Test explicit literal syntax routes to ripgrep."""
+        assert classify_query(query) == QueryType.LITERAL
+
+    @pytest.mark.parametrize("query", [
+        "parse_args",
+        "JWT token refresh",
+        "def foo bar",
+        "",
+    ])
+    def test_hybrid(self, query):
+        """Test ambiguous queries route to both backends."""
+        assert classify_query(query) == QueryType.HYBRID
+
+    def test_conceptual_wins_over_literal(self):
+        """Test conceptual indicators are checked before literal ones."""
+        assert classify_query("what?") == QueryType.LITERAL
+        assert classify_query("what is foo*") == QueryType.CONCEPTUAL
+
+    @pytest.mark.skipif(gemini_search._CLASSIFIER_DB is None, reason="hyperscan not installed")
+    @pytest.mark.parametrize("query", [
+        "How does billing work?", "'API_KEY'", "what is foo*", "  def baz  ",
+        "def foo bar", "class Foo\n", "usages of\tx", "parse_args", "",
+    ])
+    def test_hyperscan_matches_regex(self, query):
+        """Test the hyperscan classifier agrees with the regex fallback."""
+        if gemini_search._CONCEPTUAL_RE.search(query):
+            expected = QueryType.CONCEPTUAL
+        elif gemini_search._LITERAL_RE.search(query):
+            expected = QueryType.LITERAL
+        else:
+            expected = QueryType.HYBRID
+        assert gemini_search._classify_with_hyperscan(query) == expected
+
+    def test_keyword_prefilter_covers_patterns(self):
+        """Test every conceptual pattern requires one of the prefilter keywords."""
+        for pattern in gemini_search.CONCEPTUAL_PATTERNS:
+            assert any(k in pattern for k in gemini_search._CONCEPTUAL_KEYWORDS), pattern
+
+    @pytest.mark.parametrize("query,expected", [
+        ('"how does it work"', QueryType.CONCEPTUAL),
+        ("grep pattern", QueryType.CONCEPTUAL),
+        ('"quoted"\n', QueryType.LITERAL),
+        ('"multi\nline"', QueryType.HYBRID),
+    ])
+    def test_short_circuits_keep_precedence(self, query, expected):
+        """Test literal fast paths never override a conceptual match."""
+        assert classify_query(query) == expected
+
+    def test_non_ascii_uses_regex(self):
+        """Test non-ASCII queries bypass hyperscan and still classify."""
+        assert gemini_search._classify_with_hyperscan("où est café") is None
+        assert classify_query("explain café") == QueryType.CONCEPTUAL
+
+
+class TestExtractLiteralPattern:
+    """Test literal pattern extraction for ripgrep."""
+
+    @pytest.mark.parametrize("query,expected", [
+        ("Find string 'API_KEY'", "API_KEY"),
+        ('"foo bar"', "foo bar"),
+        ("function foo", "foo"),
+        ("Class  Bar", "Bar"),
+        ("usage of X", "X"),
+        ("find UserService", "UserService"),
+        ("Find the function parse in utils", "parse"),
+    ])
+    def test_explicit_patterns(self, client, query, expected):
+        """Test quoted text and keyword forms yield the named symbol."""
+        assert client._extract_literal_pattern(query) == expected
+
+    def test_pattern_priority_beats_position(self, client):
+        """Test earlier pattern kinds win even when they match later in the query."""
+        assert client._extract_literal_pattern("find foo in class Bar") == "Bar"
+        assert client._extract_literal_pattern("class Foo with 'key'") == "key"
+
+    def test_keyword_fallback(self, client):
+        """Test remaining words are joined as an alternation."""
+        assert client._extract_literal_pattern("JWT token refresh") == "jwt|token|refresh"
+
+    def test_stop_words_only(self, client):
+        """Test a query made only of stop words is returned unchanged."""
+        assert client._extract_literal_pattern("the") == "the"
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small project tree for ripgrep searches."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "app.py").write_text("def foo():\n    return Foo\n\nfoo = 2\n")
+    (tmp_path / "notes.md").write_text("foo bar\n")
+    return tmp_path
+
+
+@pytest.mark.skipif(shutil.which("rg") is None, reason="ripgrep not installed")
+class TestSearchRipgrep:
+    """Test literal search through ripgrep."""
+
+    def test_paths_relative_to_project(self, project):
+        """Test matches are reported relative to the project root."""
+        client = HybridSearchClient(project_root=str(project))
+        snippets = client.search_ripgrep("foo")
+        assert {s.file_path for s in snippets} == {"src/app.py", "notes.md"}
+        assert all(s.source == "ripgrep" for s in snippets)
+
+    def test_limit_stops_stream(self, project):
+        """Test no more than limit snippets are returned."""
+        client = HybridSearchClient(project_root=str(project))
+        assert len(client.search_ripgrep("foo", limit=2)) == 2
+
+    def test_smart_case(self, project):
+        """Test lowercase queries ignore case and mixed-case queries do not."""
+        client = HybridSearchClient(project_root=str(project))
+        assert len(client.search_ripgrep("foo", file_type="py")) == 3
+        snippets = client.search_ripgrep("Foo", file_type="py")
+        assert [s.line_start for s in snippets] == [2]
+
+    def test_max_per_file(self, project):
+        """Test per-file cap lets other files into the results."""
+        client = HybridSearchClient(project_root=str(project))
+        snippets = client.search_ripgrep("foo", file_type=None, limit=10, max_per_file=1)
+        assert sorted(s.file_path for s in snippets) == ["notes.md", "src/app.py"]
+
+    def test_file_type_filter(self, project):
+        """Test ripgrep type filter restricts matched files."""
+        client = HybridSearchClient(project_root=str(project))
+        snippets = client.search_ripgrep("foo", file_type="py")
+        assert snippets
+        assert all(s.file_path.endswith(".py") for s in snippets)
+
+    def test_regex_and_literal_agree(self, project):
+        """Test JSON (regex) and plain-text (literal) parsing give the same lines."""
+        client = HybridSearchClient(project_root=str(project))
+        literal = client.search_ripgrep("foo", file_type="py")
+        regex = client.search_ripgrep("fo+", file_type="py")
+        assert [(s.file_path, s.line_start) for s in literal] == \
+            [(s.file_path, s.line_start) for s in regex]
+
+
+class TestParseRipgrepOutput:
+    """Test parsing of individual ripgrep output lines."""
+
+    def test_text_line(self, client, tmp_path):
+        """Test a NUL-separated -n line becomes a relative snippet."""
+        snippet = client._parse_ripgrep_text(f"{tmp_path}/src/a.py\x0012:    x = 1: y\n")
+        assert snippet.file_path == "src/a.py"
+        assert snippet.line_start == snippet.line_end == 12
+        assert snippet.content == "x = 1: y"
+
+    def test_text_line_without_separator(self, client):
+        """Test malformed lines are skipped."""
+        assert client._parse_ripgrep_text("no separator here\n") is None
+
+    def test_json_non_match(self, client):
+        """Test non-match JSON records and invalid JSON are skipped."""
+        assert client._parse_ripgrep_json('{"type": "begin", "data": {}}') is None
+        assert client._parse_ripgrep_json("not json") is None
+
+
+class TestGroundingSnippets:
+    """Test conversion of Gemini grounding chunks."""
+
+    @staticmethod
+    def _chunk(title, text="body", uri="uri"):
+        return SimpleNamespace(
+            retrieved_context=SimpleNamespace(title=title, uri=uri, text=text)
+        )
+
+    def test_scores_decay_by_position(self):
+        """Test scores fall by 0.1 per position and limit is applied."""
+        chunks = [self._chunk(f"f{i}.py") for i in range(5)]
+        snippets = _grounding_snippets(chunks, limit=3)
+        assert [s.file_path for s in snippets] == ["f0.py", "f1.py", "f2.py"]
+        assert [s.score for s in snippets] == pytest.approx([1.0, 0.9, 0.8])
+        assert snippets[0].metadata == {"uri": "uri"}
+
+    def test_content_truncated(self):
+        """Test chunk text is cut to 500 characters and None becomes empty."""
+        snippets = _grounding_snippets(
+            [self._chunk("a.py", "x" * 600), self._chunk("b.py", None)], limit=10
+        )
+        assert len(snippets[0].content) == 500
+        assert snippets[1].content == ""
+
+    def test_partial_context_uses_defaults(self):
+        """Test chunks without context are skipped and missing fields defaulted."""
+        chunks = [SimpleNamespace(), SimpleNamespace(retrieved_context=SimpleNamespace())]
+        snippets = _grounding_snippets(chunks, limit=10)
+        assert len(snippets) == 1
+        assert snippets[0].file_path == "Unknown"
+        assert snippets[0].score == pytest.approx(0.9)
+
+
+class TestFileMentions:
+    """Test extraction of file paths from Gemini response text."""
+
+    def test_dedupes_against_existing(self):
+        """Test files already present or repeated are added once."""
+        snippets = [Snippet("src/a.py", "chunk", source="gemini")]
+        text = "See `src/a.py`, then src/b.ts and \"src/b.ts\" again."
+        _add_file_mentions(snippets, text, limit=10)
+        assert [s.file_path for s in snippets] == ["src/a.py", "src/b.ts"]
+        assert snippets[1].score == 0.5
+
+    def test_stops_at_limit(self):
+        """Test scanning stops once the limit is reached."""
+        snippets = []
+        _add_file_mentions(snippets, "app.py app.py notes.md ci.yaml setup.py", limit=3)
+        assert [s.file_path for s in snippets] == ["app.py", "notes.md", "ci.yaml"]
+
+    def test_extension_boundaries(self):
+        """Test extensions must end at a word boundary."""
+        snippets = []
+        _add_file_mentions(snippets, "Edit cfg.json, not cache.pyc; see a.py.", limit=10)
+        assert [s.file_path for s in snippets] == ["cfg.json", "a.py"]
+
+    def test_no_dot_no_matches(self):
+        """Test text without any dot yields nothing."""
+        snippets = []
+        _add_file_mentions(snippets, "no paths mentioned here", limit=10)
+        assert snippets == []
+
+    def test_already_full(self):
+        """Test nothing is added when snippets already fill the limit."""
+        snippets = [Snippet("app.py", "chunk")]
+        _add_file_mentions(snippets, "other.py", limit=1)
+        assert len(snippets) == 1
+
+
+class TestMergeAndRank:
+    """Test merging of snippets from multiple sources."""
+
+    def test_boosts_files_found_by_both(self, client):
+        """Test a file found by both backends is merged and boosted."""
+        merged = client._merge_and_rank([
+            Snippet("a.py", "semantic", 0, 0, 0.9, "gemini"),
+            Snippet("a.py", "literal", 5, 7, 1.0, "ripgrep"),
+            Snippet("b.py", "other", 2, 2, 0.95, "ripgrep"),
+        ], limit=10)
+        assert [s.file_path for s in merged] == ["a.py", "b.py"]
+        top = merged[0]
+        assert top.score == pytest.approx(1.3)
+        assert top.source == "merged"
+        assert (top.line_start, top.line_end) == (0, 7)
+        assert top.content == "semantic\n---\nliteral"
+        assert sorted(top.metadata["sources"]) == ["gemini", "ripgrep"]
+
+    def test_content_deduped_and_capped(self, client):
+        """Test repeated content is dropped and at most 3 pieces are kept."""
+        merged = client._merge_and_rank(
+            [Snippet("a.py", c, source="ripgrep") for c in ["x", "x", "", "y", "z", "w"]],
+            limit=10,
+        )
+        assert merged[0].content == "x\n---\ny\n---\nz"
+        assert merged[0].source == "ripgrep"
+
+    def test_limit(self, client):
+        """Test only the top-scoring files are returned."""
+        merged = client._merge_and_rank(
+            [Snippet(f"f{i}.py", "c", score=i / 10) for i in range(10)],
+            limit=3,
+        )
+        assert [s.file_path for s in merged] == ["f9.py", "f8.py", "f7.py"]
+
+
+class TestSearchResultColumns:
+    """Test the per-field column views of SearchResult."""
+
+    def test_columns_follow_snippets(self):
+        """Test columns reflect snippets appended or replaced after construction."""
+        result = gemini_search.SearchResult("q", QueryType.HYBRID, [Snippet("a.py", "x", 3)])
+        result.snippets.append(Snippet("b.py", "y", source="ripgrep"))
+        assert result.paths == ["a.py", "b.py"]
+        assert result.lines == [3, 0]
+        assert result.sources == ["unknown", "ripgrep"]
+        assert result.contents == ["x", "y"]
+        result.snippets = []
+        assert result.paths == []
+
+
+class TestGeminiCache:
+    """Test the on-disk Gemini result cache."""
+
+    def test_round_trip(self, client):
+        """Test cached snippets are restored with all fields."""
+        snippet = Snippet("src/a.py", "text", 1, 3, 0.9, "gemini", {"uri": "x"})
+        key = client._gemini_cache_key("query", None, 10)
+        client._write_gemini_cache(key, [snippet])
+        assert client._read_gemini_cache(key) == [snippet]
+
+    def test_key_covers_filter_and_limit(self, client):
+        """Test different filters and limits do not share entries."""
+        keys = {
+            client._gemini_cache_key("query", None, 10),
+            client._gemini_cache_key("query", 'language = "python"', 10),
+            client._gemini_cache_key("query", None, 5),
+        }
+        assert len(keys) == 3
+
+    def test_expired_entry_is_miss(self, client, monkeypatch):
+        """Test entries older than the TTL are ignored."""
+        monkeypatch.setattr(HybridSearchClient, "CACHE_TTL_SECONDS", -1)
+        key = client._gemini_cache_key("query", None, 10)
+        client._write_gemini_cache(key, [Snippet("a.py", "text")])
+        assert client._read_gemini_cache(key) is None
+
+    def test_missing_entry_is_miss(self, client):
+        """Test an unknown key is a miss rather than an error."""
+        assert client._read_gemini_cache("0" * 32) is None
+
+    def test_expired_entry_deleted(self, client, monkeypatch):
+        """Test reading an expired entry removes its file."""
+        monkeypatch.setattr(HybridSearchClient, "CACHE_TTL_SECONDS", -1)
+        key = client._gemini_cache_key("query", None, 10)
+        client._write_gemini_cache(key, [Snippet("a.py", "text")])
+        client._read_gemini_cache(key)
+        assert os.listdir(client.cache_dir) == []
+
+    def test_oldest_entries_evicted(self, client, monkeypatch):
+        """Test writes beyond the entry bound evict the oldest entries."""
+        monkeypatch.setattr(HybridSearchClient, "CACHE_MAX_ENTRIES", 2)
+        keys = [client._gemini_cache_key(f"query {i}", None, 10) for i in range(3)]
+        for age, key in zip((30, 20, 10), keys):
+            client._write_gemini_cache(key, [Snippet("a.py", "text")])
+            path = os.path.join(client.cache_dir, f"{key}.json")
+            stamp = gemini_search.time.time() - age
+            os.utime(path, (stamp, stamp))
+        assert sorted(os.listdir(client.cache_dir)) == sorted(f"{k}.json" for k in keys[1:])
+
+    def test_no_temp_files_left(self, client):
+        """Test writes leave only the cache entry behind."""
+        key = client._gemini_cache_key("query", None, 10)
+        client._write_gemini_cache(key, [Snippet("a.py", "text")])
+        assert os.listdir(client.cache_dir) == [f"{key}.json"]
+
+
+class TestHybridSearch:
+    """Test routing and merging in hybrid_search."""
+
+    @pytest.fixture
+    def stubbed(self, client, monkeypatch):
+        """Client whose backends return canned results and record calls."""
+        calls = []
+
+        def fake_gemini(query, metadata_filter=None, limit=10):
+            calls.append(("gemini", query, metadata_filter))
+            return [Snippet("src/a.py", "semantic", score=0.9, source="gemini")]
+
+        def fake_ripgrep(query, path=None, file_type=None, limit=10, max_per_file=None):
+            calls.append(("ripgrep", query, file_type))
+            return [Snippet("src/b.py", "literal", 4, 4, source="ripgrep")]
+
+        monkeypatch.setattr(client, "search_gemini", fake_gemini)
+        monkeypatch.setattr(client, "search_ripgrep", fake_ripgrep)
+        return client, calls
+
+    def test_hybrid_uses_both_backends(self, stubbed):
+        """Test hybrid queries combine results from both backends in order."""
+        client, calls = stubbed
+        result = client.hybrid_search("UserService cache", language_filter="python")
+        assert result.query_type == QueryType.HYBRID
+        assert result.sources_used == ["gemini", "ripgrep"]
+        assert {s.file_path for s in result.snippets} == {"src/a.py", "src/b.py"}
+        assert ("gemini", "UserService cache", 'language = "python"') in calls
+        assert ("ripgrep", "userservice|cache", "py") in calls
+
+    def test_metadata_filter_combines_filters(self, stubbed):
+        """Test path and language filters are joined into one AIP-160 filter."""
+        client, calls = stubbed
+        client.hybrid_search("how does auth work", path_filter="src/", language_filter="python")
+        assert calls == [("gemini", "how does auth work", 'path_prefix = "src/" AND language = "python"')]
+
+    def test_literal_skips_gemini(self, stubbed):
+        """Test literal queries only run ripgrep."""
+        client, calls = stubbed
+        result = client.hybrid_search("class Foo")
+        assert result.sources_used == ["ripgrep"]
+        assert [c[0] for c in calls] == ["ripgrep"]
+
+    def test_conceptual_skips_ripgrep(self, stubbed):
+        """Test conceptual queries only run Gemini."""
+        client, calls = stubbed
+        result = client.hybrid_search("how does auth work")
+        assert result.sources_used == ["gemini"]
+        assert [c[0] for c in calls] == ["gemini"]
+
+
+def test_search_ripgrep_missing_binary(project, monkeypatch):
+    """Test a missing ripgrep binary yields no results instead of raising."""
+    monkeypatch.setenv("PATH", str(project))
+    client = HybridSearchClient(project_root=str(project))
+    assert client.search_ripgrep("foo") == []
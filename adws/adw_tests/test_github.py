@@ -0,0 +1,661 @@
+"""Tests for GitHub operations via the gh CLI and the REST API."""
+
+import json
+import subprocess
+import sys
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from adw_modules import github
+from adw_modules.exceptions import GitHubAPIError
+
+ISSUE = {
+    "number": 7,
+    "title": "Fix bug",
+    "body": "Details",
+    "state": "OPEN",
+    "author": {"login": "octocat"},
+    "assignees": [],
+    "labels": [{"id": "L1", "name": "bug", "color": "red"}],
+    "milestone": None,
+    "comments": [
+        {"id": "C1", "author": {"login": "a"}, "body": "adw_plan please",
+         "createdAt": "2024-01-01T00:00:00Z"},
+        {"id": "C2", "author": {"login": "b"}, "body": "[ADW-BOT] adw_plan done",
+         "createdAt": "2024-01-03T00:00:00Z"},
+        {"id": "C3", "author": {"login": "c"}, "body": "adw_plan again",
+         "createdAt": "2024-01-02T00:00:00Z"},
+    ],
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-02T00:00:00Z",
+    "closedAt": None,
+    "url": "https://github.com/owner/repo/issues/7",
+}
+
+
+REST_ISSUE = {
+    "number": 7,
+    "title": "Fix bug",
+    "body": None,
+    "state": "open",
+    "user": {"login": "octocat", "node_id": "U1", "type": "User"},
+    "assignees": [],
+    "labels": [{"node_id": "L1", "name": "bug", "color": "red"}],
+    "milestone": None,
+    "comments": 1,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-02T00:00:00Z",
+    "closed_at": None,
+    "html_url": "https://github.com/owner/repo/issues/7",
+}
+
+REST_COMMENT = {
+    "id": 11,
+    "node_id": "C1",
+    "user": {"login": "a", "node_id": "U2", "type": "User"},
+    "body": "adw",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in."""
+
+    def __init__(self, payload, links=None, status_code=200, headers=None):
+        self.content = json.dumps(payload).encode()
+        self.links = links or {}
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Records REST calls and answers from a URL -> pages mapping."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url, kwargs.get("json")))
+        return FakeResponse(self.routes.get((method, url), {}))
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(("GET", url, params))
+        pages = self.routes[("GET", url)]
+        return FakeResponse(pages, links={})
+
+
+@pytest.fixture(autouse=True)
+def no_token(monkeypatch):
+    """Use the gh CLI path unless a test installs a REST session."""
+    monkeypatch.delenv("GITHUB_PAT", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def fresh_issue_cache():
+    """Start every test without cached issues."""
+    github._issue_cache.clear()
+
+
+def rest(monkeypatch, routes):
+    """Route github operations through a fake REST session."""
+    session = FakeSession(routes)
+    monkeypatch.setattr(github, "get_github_session", lambda: session)
+    monkeypatch.setattr(github, "get_repo_path", lambda: "owner/repo")
+    return session
+
+
+def completed(stdout):
+    """Fake CompletedProcess carrying JSON bytes on stdout."""
+    return MagicMock(stdout=json.dumps(stdout).encode(), returncode=0)
+
+
+class TestGithubEnv:
+    """Test the gh subprocess environment."""
+
+    def test_reused_until_token_changes(self, monkeypatch):
+        """Test the env dict is shared and rebuilt when GITHUB_PAT changes."""
+        assert github.get_github_env() is None
+        monkeypatch.setenv("GITHUB_PAT", "one")
+        env = github.get_github_env()
+        assert env["GH_TOKEN"] == "one"
+        assert github.get_github_env() is env
+        monkeypatch.setenv("GITHUB_PAT", "two")
+        assert github.get_github_env()["GH_TOKEN"] == "two"
+
+
+class TestRepoPath:
+    """Test git remote lookup."""
+
+    @pytest.fixture
+    def repo_dir(self, tmp_path, monkeypatch):
+        """Empty repo and home directories, with the remote cache cleared."""
+        (tmp_path / "repo" / ".git").mkdir(parents=True)
+        (tmp_path / "repo" / "src").mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        monkeypatch.chdir(tmp_path / "repo" / "src")
+        github.get_repo_url.cache_clear()
+        yield tmp_path / "repo"
+        github.get_repo_url.cache_clear()
+
+    @patch("subprocess.run")
+    def test_reads_git_config(self, mock_run, repo_dir):
+        """Test the origin URL is parsed from .git/config without running git."""
+        (repo_dir / ".git" / "config").write_text(
+            '[core]\n\tbare = false\n'
+            '[remote "origin"]\n\turl = https://github.com/owner/repo.git\n'
+            '\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+        )
+        assert github.get_repo_url() == "https://github.com/owner/repo.git"
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_url_rewrites_use_git(self, mock_run, repo_dir):
+        """Test insteadOf rules defer to git, which applies them."""
+        (repo_dir / ".git" / "config").write_text('[remote "origin"]\n\turl = gh:owner/repo\n')
+        (repo_dir.parent / ".gitconfig").write_text(
+            '[url "https://github.com/"]\n\tinsteadOf = gh:\n'
+        )
+        mock_run.return_value = MagicMock(stdout="https://github.com/owner/repo\n")
+        assert github.get_repo_url() == "https://github.com/owner/repo"
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_remote_is_cached(self, mock_run, repo_dir):
+        """Test the git remote is read once per process."""
+        github.get_repo_url.cache_clear()
+        github.get_repo_path.cache_clear()
+        mock_run.return_value = MagicMock(stdout="https://github.com/owner/repo.git\n")
+        try:
+            assert github.get_repo_path() == "owner/repo"
+            assert github.get_repo_url() == "https://github.com/owner/repo.git"
+            assert mock_run.call_count == 1
+        finally:
+            github.get_repo_url.cache_clear()
+            github.get_repo_path.cache_clear()
+
+
+class TestFetchIssue:
+    """Test single-issue fetching."""
+
+    @patch("subprocess.run")
+    def test_parses_issue(self, mock_run):
+        """Test gh JSON output is parsed into a GitHubIssue."""
+        mock_run.return_value = completed(ISSUE)
+        issue = github.fetch_issue("7", "owner/repo")
+        assert issue.number == 7
+        assert issue.labels[0].name == "bug"
+        assert len(issue.comments) == 3
+
+    @patch("subprocess.run")
+    def test_meta_skips_comments(self, mock_run):
+        """Test the meta projection does not request the comment thread."""
+        meta = {k: v for k, v in ISSUE.items() if k in github.ISSUE_META_FIELDS.split(",")}
+        mock_run.return_value = completed(meta)
+        issue = github.fetch_issue_meta("7", "owner/repo")
+        assert "comments" not in mock_run.call_args[0][0][-1]
+        assert issue.title == "Fix bug"
+        assert issue.comments == []
+
+    @patch("subprocess.run")
+    def test_cached_within_ttl(self, mock_run):
+        """Test a repeat fetch is served from the cache until cleared."""
+        mock_run.return_value = completed(ISSUE)
+        first = github.fetch_issue("7", "owner/repo")
+        assert github.fetch_issue("7", "owner/repo") is first
+        assert mock_run.call_count == 1
+        github._issue_cache.clear()
+        github.fetch_issue("7", "owner/repo")
+        assert mock_run.call_count == 2
+
+    @patch("subprocess.run")
+    def test_comment_invalidates_issue(self, mock_run, monkeypatch):
+        """Test posting a comment makes the next fetch go back to GitHub."""
+        monkeypatch.setattr(github, "get_repo_path", lambda: "owner/repo")
+        mock_run.return_value = completed(ISSUE)
+        github.fetch_issue("7", "owner/repo")
+        github.fetch_issue_meta("7", "owner/repo")
+        github.make_issue_comment("7", "started")
+        github.fetch_issue("7", "owner/repo")
+        github.fetch_issue_meta("7", "owner/repo")
+        assert mock_run.call_count == 5
+
+    @patch("subprocess.run")
+    def test_label_change_invalidates_only_that_issue(self, mock_run, monkeypatch):
+        """Test marking an issue in progress drops it but keeps other issues."""
+        monkeypatch.setattr(github, "get_repo_path", lambda: "owner/repo")
+        mock_run.return_value = completed(ISSUE)
+        github.fetch_issue("7", "owner/repo")
+        github.fetch_issue("8", "owner/repo")
+        github.mark_issue_in_progress("7")
+        calls = mock_run.call_count
+        github.fetch_issue("8", "owner/repo")
+        assert mock_run.call_count == calls
+        github.fetch_issue("7", "owner/repo")
+        assert mock_run.call_count == calls + 1
+
+    def test_invalidate_from_another_thread(self):
+        """Test background invalidation is safe while the cache is written."""
+        issue = github.GitHubIssue.model_validate(ISSUE)
+        errors = []
+        done = threading.Event()
+
+        def invalidate():
+            try:
+                while not done.is_set():
+                    github._issue_cache.invalidate("owner/repo", "7")
+            except Exception as e:
+                errors.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        worker = threading.Thread(target=invalidate)
+        worker.start()
+        try:
+            for i in range(20_000):
+                github._issue_cache.put(("owner/repo", str(i), "f"), 0.0, None, issue)
+        finally:
+            done.set()
+            worker.join()
+            sys.setswitchinterval(interval)
+        assert errors == []
+
+    @patch("subprocess.run")
+    def test_stdout_kept_as_bytes(self, mock_run):
+        """Test gh output is not decoded before JSON parsing."""
+        mock_run.return_value = completed(ISSUE)
+        github.fetch_issue("7", "owner/repo")
+        assert "text" not in mock_run.call_args[1]
+
+    @patch("subprocess.run")
+    def test_failure_decodes_stderr(self, mock_run):
+        """Test gh stderr bytes are decoded into the error context."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "gh", stderr=b"not found")
+        with pytest.raises(GitHubAPIError) as exc_info:
+            github.fetch_issue("7", "owner/repo")
+        assert exc_info.value.context["stderr"] == "not found"
+
+    @patch("subprocess.run")
+    def test_invalid_json(self, mock_run):
+        """Test unparseable output raises GitHubAPIError."""
+        mock_run.return_value = MagicMock(stdout=b"not json", returncode=0)
+        with pytest.raises(GitHubAPIError):
+            github.fetch_issue("7", "owner/repo")
+
+
+class TestFetchOpenIssues:
+    """Test open issue listing."""
+
+    @patch("subprocess.run")
+    def test_parses_list(self, mock_run):
+        """Test list output becomes GitHubIssueListItem models."""
+        item = {k: ISSUE[k] for k in ("number", "title", "body", "labels", "createdAt", "updatedAt")}
+        mock_run.return_value = completed([item, dict(item, number=8)])
+        issues = github.fetch_open_issues("owner/repo")
+        assert [i.number for i in issues] == [7, 8]
+        assert issues[0].labels[0].name == "bug"
+
+    @patch("subprocess.run")
+    def test_filters_passed_to_gh(self, mock_run):
+        """Test labels, search and limit become gh issue list flags."""
+        mock_run.return_value = completed([])
+        github.fetch_open_issues(
+            "owner/repo", labels=["bug", "in_progress"], search="no:assignee", limit=50
+        )
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--limit") + 1] == "50"
+        assert cmd[-6:] == ["--label", "bug", "--label", "in_progress", "--search", "no:assignee"]
+
+    @patch("subprocess.run")
+    def test_command_failure_returns_empty(self, mock_run, capsys):
+        """Test a gh failure is reported and yields no issues."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "gh", stderr=b"boom")
+        assert github.fetch_open_issues("owner/repo") == []
+        assert "boom" in capsys.readouterr().err
+
+
+class TestMarkIssueInProgress:
+    """Test labelling and assigning an issue via gh."""
+
+    @pytest.fixture(autouse=True)
+    def repo(self, monkeypatch):
+        """Skip the git remote lookup."""
+        monkeypatch.setattr(github, "get_repo_path", lambda: "owner/repo")
+
+    @patch("subprocess.run")
+    def test_single_edit_call(self, mock_run):
+        """Test label and assignee are added in one gh invocation."""
+        mock_run.return_value = MagicMock(returncode=0, stderr="")
+        github.mark_issue_in_progress("7")
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert cmd[-4:] == ["--add-label", "in_progress", "--add-assignee", "@me"]
+
+    @patch("subprocess.run")
+    def test_assigns_when_label_missing(self, mock_run, capsys):
+        """Test a failed label edit still assigns the issue."""
+        mock_run.side_effect = [
+            MagicMock(returncode=1, stderr="label not found"),
+            MagicMock(returncode=0, stderr=""),
+        ]
+        github.mark_issue_in_progress("7")
+        assert mock_run.call_args[0][0][-2:] == ["--add-assignee", "@me"]
+        assert "--add-label" not in mock_run.call_args[0][0]
+        out = capsys.readouterr().out
+        assert "label not found" in out and "Assigned issue #7" in out
+
+
+class TestIterOpenIssues:
+    """Test streaming open issues."""
+
+    ITEM = {k: ISSUE[k] for k in ("number", "title", "body", "labels", "createdAt", "updatedAt")}
+
+    def fake_gh(self, lines, returncode=0, stderr=b""):
+        """Popen stand-in streaming the given stdout lines."""
+        proc = MagicMock()
+        proc.stdout = MagicMock(__iter__=lambda _: iter(lines))
+        proc.stderr.read.return_value = stderr
+        proc.wait.return_value = returncode
+        proc.poll.return_value = returncode
+        return proc
+
+    @patch("subprocess.Popen")
+    def test_yields_each_line(self, mock_popen):
+        """Test one model is yielded per line of gh output."""
+        lines = [json.dumps(dict(self.ITEM, number=n)).encode() + b"\n" for n in (7, 8)]
+        mock_popen.return_value = self.fake_gh(lines)
+        assert [i.number for i in github.iter_open_issues("owner/repo")] == [7, 8]
+        assert mock_popen.call_args[0][0][-4:-2] == ["--jq", ".[]"]
+
+    @patch("subprocess.Popen")
+    def test_failure_reported(self, mock_popen, capsys):
+        """Test a failing gh ends iteration with an error message."""
+        mock_popen.return_value = self.fake_gh([], returncode=1, stderr=b"boom")
+        assert list(github.iter_open_issues("owner/repo")) == []
+        assert "boom" in capsys.readouterr().err
+
+    @patch("subprocess.Popen")
+    def test_early_stop_kills_gh(self, mock_popen):
+        """Test gh is killed when the caller stops early."""
+        lines = [json.dumps(self.ITEM).encode()] * 3
+        proc = self.fake_gh(lines)
+        proc.poll.return_value = None
+        mock_popen.return_value = proc
+        issues = github.iter_open_issues("owner/repo")
+        next(issues)
+        issues.close()
+        proc.kill.assert_called_once()
+
+    def test_rest_pages(self, monkeypatch):
+        """Test REST pages are streamed with pull requests dropped."""
+        pr = dict(REST_ISSUE, number=8, pull_request={"url": "x"})
+        rest(monkeypatch, {("GET", TestRestApi.API): [REST_ISSUE, pr]})
+        assert [i.number for i in github.iter_open_issues("owner/repo")] == [7]
+
+
+class TestFetchOpenIssueNumbers:
+    """Test the numbers-only open issue listing."""
+
+    @patch("subprocess.run")
+    def test_requests_only_numbers(self, mock_run):
+        """Test gh is asked for the number field alone."""
+        mock_run.return_value = completed([{"number": 7}, {"number": 8}])
+        assert github.fetch_open_issue_numbers("owner/repo") == [7, 8]
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--json") + 1] == "number"
+
+    def test_rest_skips_pull_requests(self, monkeypatch):
+        """Test pull requests are dropped on the REST path too."""
+        pr = dict(REST_ISSUE, number=8, pull_request={"url": "x"})
+        rest(monkeypatch, {("GET", TestRestApi.API): [REST_ISSUE, pr]})
+        assert github.fetch_open_issue_numbers("owner/repo") == [7]
+
+
+class TestMakeIssueComment:
+    """Test posting comments via gh."""
+
+    @patch("subprocess.run")
+    def test_body_sent_on_stdin(self, mock_run, monkeypatch):
+        """Test the comment body is piped to gh rather than passed in argv."""
+        monkeypatch.setattr(github, "get_repo_path", lambda: "owner/repo")
+        body = "x" * 200_000
+        github.make_issue_comment("7", body)
+        args, kwargs = mock_run.call_args
+        assert args[0][-2:] == ["--body-file", "-"]
+        assert body not in args[0]
+        assert kwargs["input"] == body
+
+
+class TestFetchIssueComments:
+    """Test comment fetching."""
+
+    @patch("subprocess.run")
+    def test_sorted_by_creation(self, mock_run):
+        """Test comments are returned oldest first."""
+        mock_run.return_value = completed({"comments": ISSUE["comments"]})
+        comments = github.fetch_issue_comments("owner/repo", 7)
+        assert [c["id"] for c in comments] == ["C1", "C3", "C2"]
+
+    @patch("subprocess.run")
+    def test_invalid_json_returns_empty(self, mock_run):
+        """Test unparseable output yields no comments."""
+        mock_run.return_value = MagicMock(stdout=b"{", returncode=0)
+        assert github.fetch_issue_comments("owner/repo", 7) == []
+
+
+class TestFetchIssueCommentsBulk:
+    """Test concurrent comment fetching across issues."""
+
+    def test_maps_issue_to_comments(self, monkeypatch):
+        """Test each issue number maps to its own comments."""
+        monkeypatch.setattr(
+            github, "fetch_issue_comments", lambda repo, number: [{"id": f"C{number}"}]
+        )
+        result = github.fetch_issue_comments_bulk("owner/repo", [3, 1, 2])
+        assert result == {3: [{"id": "C3"}], 1: [{"id": "C1"}], 2: [{"id": "C2"}]}
+
+    def test_empty(self):
+        """Test no issues means no fetches."""
+        assert github.fetch_issue_comments_bulk("owner/repo", []) == {}
+
+
+GRAPHQL_NODE = {
+    "number": 7,
+    "title": "Fix bug",
+    "body": "Details",
+    "state": "OPEN",
+    "url": "https://github.com/owner/repo/issues/7",
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-02T00:00:00Z",
+    "closedAt": None,
+    "author": {"login": "octocat", "__typename": "User"},
+    "labels": {"nodes": [{"id": "L1", "name": "bug", "color": "red", "description": None}]},
+    "comments": {"nodes": [
+        {"id": "C1", "body": "adw_plan", "createdAt": "2024-01-01T00:00:00Z",
+         "updatedAt": None, "author": {"login": "bot", "__typename": "Bot"}},
+    ]},
+}
+
+
+def graphql_page(nodes, cursor=None):
+    """GraphQL issues response with one page of nodes."""
+    return {"data": {"repository": {"issues": {
+        "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+        "nodes": nodes,
+    }}}}
+
+
+class TestFetchIssuesGraphql:
+    """Test batched issue and comment fetching via GraphQL."""
+
+    @patch("subprocess.run")
+    def test_follows_cursor(self, mock_run):
+        """Test pages are requested until hasNextPage is false."""
+        mock_run.side_effect = [
+            completed(graphql_page([GRAPHQL_NODE], cursor="abc")),
+            completed(graphql_page([dict(GRAPHQL_NODE, number=8)])),
+        ]
+        issues = github.fetch_issues_with_comments_graphql("owner/repo", limit=100)
+        assert [i.number for i in issues] == [7, 8]
+        assert issues[0].labels[0].name == "bug"
+        assert issues[0].comments[0].author.is_bot
+        second = mock_run.call_args_list[1][0][0]
+        assert "after=abc" in second and "owner=owner" in second and "name=repo" in second
+
+    @patch("subprocess.run")
+    def test_errors_raise(self, mock_run):
+        """Test GraphQL errors surface as GitHubAPIError."""
+        mock_run.return_value = completed({"errors": [{"message": "bad"}]})
+        with pytest.raises(GitHubAPIError):
+            github.fetch_issues_with_comments_graphql("owner/repo")
+
+    def test_rest_session(self, monkeypatch):
+        """Test the query is POSTed when a REST session is available."""
+        session = rest(monkeypatch, {
+            ("POST", github.GITHUB_API_URL + "/graphql"): graphql_page([GRAPHQL_NODE]),
+        })
+        issues = github.fetch_issues_with_comments_graphql("owner/repo", limit=1)
+        assert [c.id for c in issues[0].comments] == ["C1"]
+        assert session.calls[0][2]["variables"]["first"] == 1
+
+
+class TestFindKeywordFromComment:
+    """Test keyword lookup in issue comments."""
+
+    def test_latest_non_bot_comment(self):
+        """Test the newest matching comment wins and bot comments are skipped."""
+        issue = github.GitHubIssue(**ISSUE)
+        comment = github.find_keyword_from_comment("adw_plan", issue)
+        assert comment.id == "C3"
+
+    def test_tie_keeps_first(self):
+        """Test comments created at the same time resolve to the earlier one."""
+        issue = github.GitHubIssue(**dict(ISSUE, comments=[
+            dict(ISSUE["comments"][0], id="A"),
+            dict(ISSUE["comments"][0], id="B"),
+        ]))
+        assert github.find_keyword_from_comment("adw_plan", issue).id == "A"
+
+    def test_no_match(self):
+        """Test None is returned when no comment contains the keyword."""
+        issue = github.GitHubIssue(**ISSUE)
+        assert github.find_keyword_from_comment("adw_build", issue) is None
+
+
+class TestRestApi:
+    """Test REST API calls used when GITHUB_PAT is set."""
+
+    API = github.GITHUB_API_URL + "/repos/owner/repo/issues"
+
+    def test_session_requires_token(self, monkeypatch):
+        """Test no session is created without GITHUB_PAT."""
+        assert github.get_github_session() is None
+        monkeypatch.setenv("GITHUB_PAT", "token")
+        session = github.get_github_session()
+        assert session is github.get_github_session()
+        assert session.headers["Authorization"] == "Bearer token"
+
+    def test_fetch_issue(self, monkeypatch):
+        """Test REST issue and comments are mapped to the gh model shape."""
+        rest(monkeypatch, {
+            ("GET", f"{self.API}/7"): REST_ISSUE,
+            ("GET", f"{self.API}/7/comments"): [REST_COMMENT],
+        })
+        issue = github.fetch_issue("7", "owner/repo")
+        assert issue.state == "OPEN"
+        assert issue.body == ""
+        assert issue.author.login == "octocat"
+        assert issue.labels[0].id == "L1"
+        assert [c.id for c in issue.comments] == ["C1"]
+
+    def test_fetch_issue_revalidates_with_etag(self, monkeypatch):
+        """Test an expired entry is revalidated and kept on 304."""
+        session = rest(monkeypatch, {})
+        responses = [
+            FakeResponse(dict(REST_ISSUE, comments=0), headers={"ETag": '"v1"'}),
+            FakeResponse({}, status_code=304),
+        ]
+        sent = []
+
+        def request(method, url, timeout=None, headers=None, **kwargs):
+            sent.append(headers)
+            return responses.pop(0)
+
+        session.request = request
+        first = github.fetch_issue_meta("7", "owner/repo")
+        monkeypatch.setattr(github, "ISSUE_CACHE_TTL_SECONDS", 0)
+        assert github.fetch_issue_meta("7", "owner/repo") is first
+        assert sent == [{}, {"If-None-Match": '"v1"'}]
+
+    def test_fetch_issue_meta_skips_comments(self, monkeypatch):
+        """Test the meta variant makes no comments request."""
+        session = rest(monkeypatch, {("GET", f"{self.API}/7"): REST_ISSUE})
+        issue = github.fetch_issue_meta("7", "owner/repo")
+        assert issue.comments == []
+        assert [call[1] for call in session.calls] == [f"{self.API}/7"]
+
+    def test_fetch_open_issues_skips_pull_requests(self, monkeypatch):
+        """Test pull requests in the issues listing are dropped."""
+        pr = dict(REST_ISSUE, number=8, pull_request={"url": "x"})
+        rest(monkeypatch, {("GET", self.API): [REST_ISSUE, pr]})
+        assert [i.number for i in github.fetch_open_issues("owner/repo")] == [7]
+
+    def test_limit_counts_issues_not_pull_requests(self, monkeypatch):
+        """Test pull requests ahead of issues do not use up the limit."""
+        session = rest(monkeypatch, {})
+        prs = [dict(REST_ISSUE, number=n, pull_request={"url": "x"}) for n in (1, 2)]
+        pages = [prs, [REST_ISSUE, dict(REST_ISSUE, number=9)]]
+
+        def get(url, params=None, timeout=None):
+            session.calls.append(("GET", url, params))
+            return FakeResponse(pages.pop(0), links={"next": {"url": url}} if pages else {})
+
+        session.get = get
+        issues = github.fetch_open_issues("owner/repo", limit=1)
+        assert [i.number for i in issues] == [7]
+        assert len(session.calls) == 2
+
+    def test_fetch_open_issues_labels(self, monkeypatch):
+        """Test labels are sent as the REST labels filter."""
+        session = rest(monkeypatch, {("GET", self.API): [REST_ISSUE]})
+        github.fetch_open_issues("owner/repo", labels=["bug", "ui"])
+        assert session.calls[0][2]["labels"] == "bug,ui"
+
+    def test_fetch_open_issues_search(self, monkeypatch):
+        """Test search filters go through the search endpoint."""
+        search_url = github.GITHUB_API_URL + "/search/issues"
+        session = rest(monkeypatch, {("GET", search_url): {"items": [REST_ISSUE]}})
+        issues = github.fetch_open_issues("owner/repo", labels=["bug"], search="no:assignee")
+        assert [i.number for i in issues] == [7]
+        assert session.calls[0][2]["q"] == 'repo:owner/repo is:issue is:open no:assignee label:"bug"'
+
+    def test_fetch_issue_comments(self, monkeypatch):
+        """Test comments come back as gh-shaped dicts."""
+        rest(monkeypatch, {("GET", f"{self.API}/7/comments"): [REST_COMMENT]})
+        comments = github.fetch_issue_comments("owner/repo", 7)
+        assert comments[0]["body"] == "adw"
+        assert comments[0]["createdAt"] == "2024-01-01T00:00:00Z"
+
+    def test_make_issue_comment(self, monkeypatch):
+        """Test comments are posted as JSON bodies."""
+        session = rest(monkeypatch, {})
+        github.make_issue_comment("7", "hello")
+        assert session.calls == [("POST", f"{self.API}/7/comments", {"body": "hello"})]
+
+    def test_mark_issue_in_progress(self, monkeypatch):
+        """Test label and self-assignment requests."""
+        session = rest(monkeypatch, {("GET", github.GITHUB_API_URL + "/user"): {"login": "me"}})
+        github.mark_issue_in_progress("7")
+        assert ("POST", f"{self.API}/7/labels", {"labels": ["in_progress"]}) in session.calls
+        assert ("POST", f"{self.API}/7/assignees", {"assignees": ["me"]}) in session.calls
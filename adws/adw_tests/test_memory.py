@@ -0,0 +1,775 @@
+"""Tests for the mem0-backed persistent learnings layer."""
+
+import sqlite3
+import sys
+import os
+import threading
+import types
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from adw_modules import memory
+from adw_modules.memory import PersistentLearningsLayer, QueryCache
+
+
+class FakeMem0:
+    """Records mem0 calls and returns canned search results."""
+
+    def __init__(self, results=None):
+        self.results = results if results is not None else [
+            {"memory": "auth lives in middleware", "metadata": {"type": "discovery_pattern", "confidence": 0.75}},
+        ]
+        self.searches = []
+        self.adds = []
+
+    def search(self, query, **kwargs):
+        self.searches.append((query, kwargs))
+        return self.results
+
+    def add(self, messages, **kwargs):
+        self.adds.append((messages, kwargs))
+
+
+@pytest.fixture
+def layer(monkeypatch, tmp_path):
+    """Enabled layer backed by FakeMem0."""
+    monkeypatch.setattr(memory, "_check_mem0_available", lambda: "")
+    layer = PersistentLearningsLayer("proj", storage_path=str(tmp_path / "qdrant"))
+    layer._memory = FakeMem0()
+    layer._enabled = True
+    return layer
+
+
+class TestLazyInit:
+    """Test that mem0 is only imported when memory is used."""
+
+    def test_client_created_on_first_use(self, monkeypatch):
+        """Test construction does not initialize the mem0 client."""
+        monkeypatch.setattr(memory, "_check_mem0_available", lambda: "cloud")
+        calls = []
+        monkeypatch.setattr(
+            PersistentLearningsLayer, "_init_memory",
+            lambda self: calls.append(1) or setattr(self, "_memory", FakeMem0()),
+        )
+        layer = PersistentLearningsLayer("proj")
+        assert calls == []
+        assert layer.enabled
+        assert layer.enabled
+        assert calls == [1]
+
+    def test_missing_package_disables(self, monkeypatch):
+        """Test an absent mem0 package is detected without importing it."""
+        monkeypatch.setattr(memory, "_mem0_mode", None)
+        monkeypatch.setenv("MEM0_API_KEY", "key")
+        monkeypatch.setattr(memory.importlib.util, "find_spec", lambda name: None)
+        assert memory._check_mem0_available() == ""
+
+    def test_client_class_resolved_once(self, monkeypatch):
+        """Test the mem0 client class is looked up once per mode."""
+        fake_mem0 = types.ModuleType("mem0")
+        fake_mem0.MemoryClient = type("MemoryClient", (), {"__init__": lambda self, api_key: None})
+        monkeypatch.setitem(sys.modules, "mem0", fake_mem0)
+        monkeypatch.setattr(memory, "_mem0_classes", {})
+        monkeypatch.setattr(memory, "_check_mem0_available", lambda: "cloud")
+        assert PersistentLearningsLayer("a").enabled
+        del fake_mem0.MemoryClient
+        assert PersistentLearningsLayer("b").enabled
+        assert memory._mem0_classes["cloud"].__name__ == "MemoryClient"
+
+
+class TestQuantizationConfig:
+    """Test MEM0_QUANTIZATION parsing."""
+
+    def test_scalar_by_default(self, monkeypatch):
+        """Test int8 scalar quantization is the default."""
+        monkeypatch.delenv("MEM0_QUANTIZATION", raising=False)
+        assert memory._quantization_config()["scalar"]["type"] == "int8"
+
+    @pytest.mark.parametrize("value,expected", [("binary", "binary"), ("SCALAR", "scalar")])
+    def test_modes(self, monkeypatch, value, expected):
+        """Test the selected quantization kind is returned."""
+        monkeypatch.setenv("MEM0_QUANTIZATION", value)
+        assert list(memory._quantization_config()) == [expected]
+
+    @pytest.mark.parametrize("value", ["none", "pq"])
+    def test_disabled(self, monkeypatch, value):
+        """Test none and unknown values leave vectors unquantized."""
+        monkeypatch.setenv("MEM0_QUANTIZATION", value)
+        assert memory._quantization_config() is None
+
+
+class TestHnswConfig:
+    """Test MEM0_HNSW_PROFILE parsing."""
+
+    def test_medium_by_default(self, monkeypatch):
+        """Test the default profile pins m=24, ef_construct=200."""
+        monkeypatch.delenv("MEM0_HNSW_PROFILE", raising=False)
+        config = memory._hnsw_config()
+        assert (config["m"], config["ef_construct"]) == (24, 200)
+
+    def test_profile_selected(self, monkeypatch):
+        """Test a named profile is used."""
+        monkeypatch.setenv("MEM0_HNSW_PROFILE", "Large")
+        assert memory._hnsw_config()["m"] == 32
+
+    def test_unknown_profile(self, monkeypatch):
+        """Test unknown profiles fall back to medium."""
+        monkeypatch.setenv("MEM0_HNSW_PROFILE", "huge")
+        assert memory._hnsw_config() == memory._HNSW_PROFILES["medium"]
+
+
+class FakeQdrantModel:
+    """Stands in for a qdrant_client pydantic model, compared by fields."""
+
+    def __init__(self, **fields):
+        self.fields = fields
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.fields == other.fields
+
+
+@pytest.fixture
+def qdrant_models(monkeypatch):
+    """Stub qdrant_client.models with field-comparing fakes."""
+    models = types.ModuleType("qdrant_client.models")
+    for name in ("HnswConfigDiff", "ScalarQuantization", "BinaryQuantization", "VectorParamsDiff"):
+        setattr(models, name, type(name, (FakeQdrantModel,), {}))
+    package = types.ModuleType("qdrant_client")
+    package.models = models
+    monkeypatch.setitem(sys.modules, "qdrant_client", package)
+    monkeypatch.setitem(sys.modules, "qdrant_client.models", models)
+    return models
+
+
+class FakeQdrantClient:
+    """Serves a live collection config and records collection updates."""
+
+    def __init__(self, hnsw, quantization=None):
+        self.config = types.SimpleNamespace(
+            hnsw_config=types.SimpleNamespace(**hnsw),
+            quantization_config=quantization,
+        )
+        self.updates = []
+
+    def get_collection(self, name):
+        return types.SimpleNamespace(config=self.config)
+
+    def update_collection(self, name, **kwargs):
+        self.updates.append((name, kwargs))
+
+
+def qdrant_memory(client):
+    """mem0 Memory stand-in whose vector store uses ``client``."""
+    return types.SimpleNamespace(
+        vector_store=types.SimpleNamespace(client=client, collection_name="spb_test")
+    )
+
+
+class TestTuneVectorStore:
+    """Test the shared Qdrant collection tuning helper."""
+
+    @pytest.fixture(autouse=True)
+    def env(self, monkeypatch):
+        """Use the default HNSW profile and quantization."""
+        monkeypatch.delenv("MEM0_HNSW_PROFILE", raising=False)
+        monkeypatch.delenv("MEM0_QUANTIZATION", raising=False)
+
+    def test_differing_settings_applied(self, qdrant_models):
+        """Test a collection with other settings is updated."""
+        client = FakeQdrantClient({"m": 16, "ef_construct": 100})
+        assert memory.tune_vector_store(qdrant_memory(client))
+        [(name, kwargs)] = client.updates
+        assert name == "spb_test"
+        assert kwargs["hnsw_config"].fields == memory._HNSW_PROFILES["medium"]
+        assert kwargs["quantization_config"].fields == memory._QUANTIZATION["scalar"]
+
+    def test_matching_settings_skipped(self, qdrant_models):
+        """Test a collection already tuned is not updated again."""
+        client = FakeQdrantClient(
+            memory._HNSW_PROFILES["medium"],
+            qdrant_models.ScalarQuantization(**memory._QUANTIZATION["scalar"]),
+        )
+        assert not memory.tune_vector_store(qdrant_memory(client))
+        assert client.updates == []
+
+    def test_only_differing_settings_sent(self, qdrant_models):
+        """Test settings already live are left out of the update."""
+        client = FakeQdrantClient(
+            memory._HNSW_PROFILES["medium"],
+            qdrant_models.BinaryQuantization(**memory._QUANTIZATION["binary"]),
+        )
+        assert memory.tune_vector_store(qdrant_memory(client))
+        assert list(client.updates[0][1]) == ["quantization_config"]
+
+    def test_disabled_quantization_not_applied(self, qdrant_models, monkeypatch):
+        """Test MEM0_QUANTIZATION=none never quantizes an existing collection."""
+        monkeypatch.setenv("MEM0_QUANTIZATION", "none")
+        client = FakeQdrantClient({"m": 16, "ef_construct": 100})
+        memory.tune_vector_store(qdrant_memory(client))
+        assert "quantization_config" not in client.updates[0][1]
+
+    def test_manager_collection_uses_same_toggle(self, qdrant_models, monkeypatch):
+        """Test MemoryManager's collection follows MEM0_QUANTIZATION too."""
+        from adw_modules.memory_manager import MemoryManager
+
+        monkeypatch.setenv("MEM0_QUANTIZATION", "none")
+        monkeypatch.setenv("ADW_MEMORY_QUANTIZATION", "int8")
+        monkeypatch.setattr(MemoryManager, "_instance", None)
+        manager = MemoryManager.get_instance()
+        client = FakeQdrantClient(memory._HNSW_PROFILES["medium"])
+        manager._memory = qdrant_memory(client)
+        manager._tune_vector_store()
+        assert client.updates == []
+
+    def test_profiles_keep_default_ef(self):
+        """Test no profile searches with a narrower beam than Qdrant's default."""
+        assert all(p["ef_construct"] >= 100 for p in memory._HNSW_PROFILES.values())
+
+    def test_non_qdrant_store_skipped(self):
+        """Test stores without a Qdrant client are left alone."""
+        memory_obj = types.SimpleNamespace(vector_store=types.SimpleNamespace())
+        assert not memory.tune_vector_store(memory_obj)
+
+
+class TestEmbeddingCache:
+    """Test caching of the self-hosted embedder."""
+
+    @pytest.fixture
+    def embedder(self, layer, monkeypatch, tmp_path):
+        """Fake mem0 embedder attached to the layer, with a fresh cache."""
+        monkeypatch.setattr(memory, "_embed_cache", QueryCache(max_size=8))
+        monkeypatch.setattr(memory, "_embed_cache_path", None)
+        monkeypatch.setattr(memory, "_embed_cache_dirty", False)
+        monkeypatch.setattr(memory.atexit, "register", lambda fn: None)
+        calls = []
+
+        def embed(text, memory_action=None):
+            calls.append((text, memory_action))
+            return [float(len(text))]
+        layer._memory.embedding_model = types.SimpleNamespace(
+            embed=embed, config=types.SimpleNamespace(model="m"), calls=calls,
+        )
+        layer._cache_embeddings()
+        return layer._memory.embedding_model
+
+    def test_repeat_query_skips_embed(self, embedder):
+        """Test identical queries (up to surrounding whitespace) embed once."""
+        assert embedder.embed("auth", "search") == [4.0]
+        assert embedder.embed(" auth\n", "search") == [4.0]
+        assert embedder.embed("auth", "add") == [4.0]
+        assert embedder.calls == [("auth", "search"), ("auth", "add")]
+
+    def test_wrapped_once(self, layer, embedder):
+        """Test re-wrapping an already cached embedder is a no-op."""
+        layer._cache_embeddings()
+        embedder.embed("auth")
+        embedder.embed("auth")
+        assert len(embedder.calls) == 1
+
+    def reload(self, tmp_path, monkeypatch):
+        """Save the cache, then load it into a fresh one as the next run would."""
+        memory._save_embed_cache()
+        monkeypatch.setattr(memory, "_embed_cache", QueryCache(ttl_seconds=3600))
+        monkeypatch.setattr(memory, "_embed_cache_path", None)
+        memory._load_embed_cache(str(tmp_path / "embed_cache.bin"))
+
+    def test_persisted_between_runs(self, embedder, tmp_path, monkeypatch):
+        """Test saved embeddings seed the next process's cache."""
+        embedder.embed("auth")
+        self.reload(tmp_path, monkeypatch)
+        vector, _ = memory._embed_cache.get(memory._embed_key("m", None, "auth"))
+        assert vector == [4.0]
+
+    def test_expired_entries_not_loaded(self, embedder, tmp_path, monkeypatch):
+        """Test embeddings older than the TTL are dropped on load."""
+        embedder.embed("auth")
+        real_time = memory.time.time
+        monkeypatch.setattr(memory.time, "time", lambda: real_time() + 7200)
+        self.reload(tmp_path, monkeypatch)
+        assert memory._embed_cache.items() == []
+
+    def test_unchanged_cache_not_written(self, embedder, tmp_path, monkeypatch):
+        """Test a run with no new embeddings leaves the file alone."""
+        embedder.embed("auth")
+        self.reload(tmp_path, monkeypatch)
+        path = tmp_path / "embed_cache.bin"
+        mtime = path.stat().st_mtime_ns
+        memory._save_embed_cache()
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_persisted_subset_bounded(self, embedder, tmp_path, monkeypatch):
+        """Test only the most recently used embeddings are saved."""
+        monkeypatch.setattr(memory, "_EMBED_PERSIST_LIMIT", 2)
+        for text in ("a", "bb", "ccc"):
+            embedder.embed(text)
+        self.reload(tmp_path, monkeypatch)
+        assert len(memory._embed_cache.items()) == 2
+        assert memory._embed_cache.get(memory._embed_key("m", None, "a")) is None
+
+
+class TestGetMemory:
+    """Test the shared layer returned by get_memory."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_default(self, monkeypatch):
+        """Reset the cached default layer."""
+        monkeypatch.setattr(memory, "_default_memory", None)
+
+    def test_noop_when_unconfigured(self, monkeypatch):
+        """Test an unconfigured mem0 yields a layer that does nothing."""
+        monkeypatch.setattr(memory, "_check_mem0_available", lambda: "")
+        layer = memory.get_memory("proj")
+        assert isinstance(layer, PersistentLearningsLayer)
+        assert not layer.enabled
+        assert layer.get_scout_hints("task") == ""
+        assert layer.search("auth") == ""
+        with layer:
+            assert layer.record_failure("e", "s") is None
+        assert layer.get_stats() == {"enabled": False}
+        assert memory.get_memory("proj") is layer
+
+    def test_real_layer_when_configured(self, monkeypatch):
+        """Test a configured mem0 yields the full layer."""
+        monkeypatch.setattr(memory, "_check_mem0_available", lambda: "cloud")
+        assert type(memory.get_memory("proj")) is PersistentLearningsLayer
+
+
+class TestQueryCache:
+    """Test the LRU + TTL search cache."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = QueryCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        """Test entries older than the TTL are misses."""
+        cache = QueryCache(ttl_seconds=0)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+        assert cache.stats()["size"] == 0
+
+
+class TestSearchCache:
+    """Test search result caching in PersistentLearningsLayer."""
+
+    def test_repeat_search_hits_cache(self, layer):
+        """Test identical lookups reach mem0 once."""
+        first = layer.get_scout_hints("add auth")
+        assert layer.get_scout_hints("add auth") == first
+        assert len(layer._memory.searches) == 1
+        assert layer.get_cache_stats()["hits"] == 1
+
+    def test_record_invalidates(self, layer):
+        """Test recording a learning forces the next search to mem0."""
+        layer.get_scout_hints("add auth")
+        layer.record_failure("boom", "fix")
+        layer.get_scout_hints("add auth")
+        assert len(layer._memory.searches) == 2
+
+
+class TestPrefetch:
+    """Test concurrent warm-up of the phase searches."""
+
+    def test_getters_hit_prefetched_results(self, layer):
+        """Test phase getters reuse the prefetched searches."""
+        layer.prefetch({"scout": "add auth", "planning": "feature", "build": "fastapi"})
+        assert len(layer._memory.searches) == 3
+        layer.get_scout_hints("add auth")
+        layer.get_planning_lessons("feature")
+        layer.get_build_patterns("fastapi")
+        assert len(layer._memory.searches) == 3
+        assert layer.get_cache_stats()["hits"] == 3
+
+
+class TestTaskIndex:
+    """Test narrowing scout searches through the local task index."""
+
+    def test_lookup_ranks_matching_tasks(self, tmp_path):
+        """Test tasks sharing words are returned, unrelated ones are not."""
+        index = memory.TaskIndex(str(tmp_path / "tasks.db"))
+        index.add("add oauth login flow", "a")
+        index.add("fix flaky login test", "b")
+        index.add("update readme", "c")
+        index.add("add oauth login flow", "a")
+        assert index.lookup("oauth login") == ["a", "b"]
+        assert index.lookup("billing") == []
+
+    def test_stop_words_do_not_match(self, tmp_path):
+        """Test common words alone do not make tasks related."""
+        index = memory.TaskIndex(str(tmp_path / "tasks.db"))
+        index.add("add the oauth login flow", "a")
+        assert index.lookup("fix the billing page") == []
+        assert index.lookup("add a new feature to it") == []
+
+    def test_lookup_without_database(self, tmp_path):
+        """Test lookups do not create the database."""
+        index = memory.TaskIndex(str(tmp_path / "tasks.db"))
+        assert index.lookup("anything") == []
+        assert not (tmp_path / "tasks.db").exists()
+
+    def test_related_discoveries_ranked_first(self, layer):
+        """Test related-task discoveries lead one unfiltered, wider search."""
+        layer.record_discovery("add oauth login", ["auth.py"])
+        layer.flush()
+        task_id = layer._memory.adds[0][1]["metadata"]["task_id"]
+        layer._memory.results = [
+            {"id": "f", "memory": "token refresh needs retry",
+             "metadata": {"type": "failure_recovery", "confidence": 0.85}},
+            {"id": "o", "memory": "billing in billing.py",
+             "metadata": {"type": "discovery_pattern", "confidence": 0.75, "task_id": "other"}},
+            {"id": "d", "memory": "auth in auth.py",
+             "metadata": {"type": "discovery_pattern", "confidence": 0.75, "task_id": task_id}},
+        ]
+        hints = layer.get_scout_hints("oauth login page")
+        assert hints.splitlines() == [
+            "1. [discovery_pattern] auth in auth.py",
+            "2. [failure_recovery] token refresh needs retry",
+            "3. [discovery_pattern] billing in billing.py",
+        ]
+        assert len(layer._memory.searches) == 1
+        _, kwargs = layer._memory.searches[0]
+        assert "filters" not in kwargs
+        assert kwargs["limit"] == memory.RELATED_SCOUT_CANDIDATES
+
+    def test_index_failure_falls_back(self, layer, monkeypatch):
+        """Test a failing task index lookup still returns the plain search."""
+        def lookup(task):
+            raise sqlite3.OperationalError("database is locked")
+        monkeypatch.setattr(layer._task_index, "lookup", lookup)
+        assert layer.get_scout_hints("oauth login") == "1. [discovery_pattern] auth lives in middleware"
+        assert layer._memory.searches[0][1]["limit"] == 5
+
+    def test_unindexed_task_single_search(self, layer):
+        """Test tasks without related history run only the full search."""
+        layer.get_scout_hints("oauth login")
+        assert len(layer._memory.searches) == 1
+        assert "filters" not in layer._memory.searches[0][1]
+        assert layer._memory.searches[0][1]["limit"] == 5
+
+
+class TestSearchFilters:
+    """Test which filters are sent to mem0."""
+
+    def test_getters_unfiltered(self, layer):
+        """Test phase getters leave confidence filtering to _format_hints."""
+        layer.get_planning_lessons("feature")
+        layer.get_build_patterns("react")
+        for _, kwargs in layer._memory.searches:
+            assert "filters" not in kwargs
+
+    def test_search_passes_caller_filters(self, layer):
+        """Test search() sends exactly the caller's filters."""
+        layer.search("timeout", filters={"type": "failure_recovery"})
+        assert layer._memory.searches[-1][1]["filters"] == {"type": "failure_recovery"}
+
+    def test_memory_without_confidence_recalled(self, layer):
+        """Test memories lacking a confidence key still become hints."""
+        layer._memory.results = [{"memory": "legacy learning", "metadata": {"type": "pattern"}}]
+        assert layer.search("legacy") == "1. [pattern] legacy learning"
+
+    def test_filters_part_of_cache_key(self, layer):
+        """Test differently filtered searches are cached separately."""
+        layer.search("timeout")
+        layer.search("timeout", filters={"type": "failure_recovery"})
+        assert len(layer._memory.searches) == 2
+
+
+class TestFormatHints:
+    """Test formatting of search results for prompts."""
+
+    def test_filters_low_confidence_keeping_numbering(self, layer):
+        """Test low-confidence results are dropped and positions preserved."""
+        results = [
+            {"memory": "a", "metadata": {"type": "pattern", "confidence": 0.8}},
+            {"memory": "b", "metadata": {"type": "pattern", "confidence": 0.2}},
+            {"text": "c"},
+            "d",
+        ]
+        assert layer._format_hints(results) == "1. [pattern] a\n3. [unknown] c\n4. d"
+
+    def test_empty(self, layer):
+        """Test no results format to an empty string."""
+        assert layer._format_hints([]) == ""
+        assert layer._format_hints([{"memory": "x", "metadata": {"confidence": 0.1}}]) == ""
+
+
+class TestBufferedWrites:
+    """Test deferring record_* calls inside a with block."""
+
+    def test_immediate_outside_block(self, layer):
+        """Test each record is written at once without a with block."""
+        layer.record_failure("e1", "s1")
+        layer.record_failure("e2", "s2")
+        assert layer.flush()
+        assert len(layer._memory.adds) == 2
+
+    def test_one_memory_per_record(self, layer):
+        """Test N buffered records become N adds with their own metadata."""
+        with layer as mem:
+            mem.record_failure("e1", "s1")
+            mem.record_failure("e2", "s2")
+            mem.record_pattern("react", "hooks")
+            assert layer._memory.adds == []
+        assert layer.flush()
+        assert [m[0]["content"] for m, _ in layer._memory.adds] == [
+            "Error: e1\nSolution: s1",
+            "Error: e2\nSolution: s2",
+            "Pattern for react: hooks",
+        ]
+        assert [kw["metadata"]["type"] for _, kw in layer._memory.adds] == [
+            "failure_recovery", "failure_recovery", "pattern",
+        ]
+        assert all(len(messages) == 1 for messages, _ in layer._memory.adds)
+
+    def test_flush_when_full(self, layer):
+        """Test the buffer is written once it reaches its limit."""
+        layer._buffer_limit = 2
+        with layer:
+            layer.record_failure("e1", "s1")
+            layer.record_failure("e2", "s2")
+            assert layer.flush()
+            assert len(layer._memory.adds) == 2
+
+
+class TestBackgroundWrites:
+    """Test record_* returns before mem0 finishes the write."""
+
+    def test_flush_waits_for_writes(self, layer):
+        """Test writes run on the writer thread until flush awaits them."""
+        release = threading.Event()
+        add = layer._memory.add
+        layer._memory.add = lambda *a, **kw: release.wait(5) and add(*a, **kw)
+        layer.record_failure("e1", "s1")
+        assert layer._memory.adds == []
+        assert not layer.flush(timeout=0.01)
+        release.set()
+        assert layer.flush(timeout=5)
+        assert len(layer._memory.adds) == 1
+        assert layer._inflight == []
+
+    def test_write_errors_logged(self, layer, monkeypatch):
+        """Test a failed background write does not raise."""
+        monkeypatch.setenv("MEM0_NO_RETRY", "1")
+
+        def fail(*a, **kw):
+            raise ValueError("bad payload")
+        layer._memory.add = fail
+        layer.record_failure("e1", "s1")
+        assert layer.flush()
+
+
+class TestDeduplication:
+    """Test repeated learnings are written once."""
+
+    def test_repeat_content_skipped(self, layer):
+        """Test identical content is only added the first time."""
+        layer.record_discovery("add oauth", ["auth.py"])
+        layer.record_discovery("add oauth", ["auth.py"])
+        layer.record_discovery("add oauth", ["auth.py", "login.py"])
+        assert layer.flush()
+        assert len(layer._memory.adds) == 2
+
+    def test_window_is_bounded(self, layer):
+        """Test content older than the window can be written again."""
+        layer._recent_hashes = memory.deque(maxlen=2)
+        for error in ("e1", "e2", "e3", "e1"):
+            layer.record_failure(error, "s")
+        assert layer.flush()
+        assert len(layer._memory.adds) == 4
+        assert len(layer._recent_set) == 2
+
+    def test_failed_write_not_suppressed(self, layer, monkeypatch):
+        """Test content whose write failed is written when recorded again."""
+        monkeypatch.setenv("MEM0_NO_RETRY", "1")
+        add = layer._memory.add
+
+        def fail_once(*a, **kw):
+            layer._memory.add = add
+            raise ValueError("bad payload")
+        layer._memory.add = fail_once
+        layer.record_failure("e1", "s1")
+        assert layer.flush()
+        layer.record_failure("e1", "s1")
+        assert layer.flush()
+        assert len(layer._memory.adds) == 1
+        assert len(layer._recent_hashes) == 1
+
+
+class TestTimestamps:
+    """Test metadata timestamps."""
+
+    def test_utc_z_format(self, monkeypatch):
+        """Test timestamps are microsecond-resolution UTC with a Z suffix."""
+        monkeypatch.setattr(memory.time, "time_ns", lambda: 86400_700_000_123)
+        assert memory._now_iso() == "1970-01-02T00:00:00.700000Z"
+
+    def test_same_second_keeps_creation_order(self, layer, monkeypatch):
+        """Test records made within one second sort in the order written."""
+        clock = iter([5_000_000, 250_000_000, 999_999_999])
+        monkeypatch.setattr(memory.time, "time_ns", lambda: next(clock))
+        layer.record_decision("t", "first", "r")
+        layer.record_failure("e", "second")
+        layer.record_pattern("react", "third")
+        layer.flush()
+        created = [kwargs["metadata"]["created_at"] for _, kwargs in layer._memory.adds]
+        assert created == [
+            "1970-01-01T00:00:00.005000Z",
+            "1970-01-01T00:00:00.250000Z",
+            "1970-01-01T00:00:00.999999Z",
+        ]
+
+    def test_hypothesis_expires_a_day_later(self, layer, monkeypatch):
+        """Test expiration is derived from the same clock reading."""
+        monkeypatch.setattr(memory.time, "time_ns", lambda: 0)
+        layer.record_hypothesis("h", "c")
+        layer.flush()
+        metadata = layer._memory.adds[0][1]["metadata"]
+        assert metadata["created_at"] == "1970-01-01T00:00:00.000000Z"
+        assert metadata["expiration_date"] == "1970-01-02T00:00:00Z"
+
+
+class HTTPStatusError(Exception):
+    """Mimics an HTTP client error carrying a response status."""
+
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.response = types.SimpleNamespace(status_code=status_code)
+
+
+class TestRecordMetadata:
+    """Test the metadata and scoping written with each learning."""
+
+    def test_decision(self, layer, monkeypatch):
+        """Test template fields plus a fresh timestamp are written."""
+        monkeypatch.setattr(memory.time, "time_ns", lambda: 0)
+        layer.record_decision("t", "use typer", "simpler")
+        layer.flush()
+        _, kwargs = layer._memory.adds[0]
+        assert kwargs["user_id"] == "proj"
+        assert kwargs["metadata"] == {
+            "type": "decision",
+            "phase": "plan",
+            "confidence": 0.85,
+            "immutable": True,
+            "created_at": "1970-01-01T00:00:00.000000Z",
+        }
+
+    def test_template_not_mutated(self, layer):
+        """Test per-call fields do not leak into the shared template."""
+        layer.record_pattern("react", "hooks")
+        layer.flush()
+        assert "framework" not in memory._PATTERN_METADATA
+        assert layer._memory.adds[0][1]["metadata"]["framework"] == "react"
+
+
+class TestGetStats:
+    """Test memory statistics."""
+
+    def test_counts_by_type(self, layer):
+        """Test memories are counted per metadata type."""
+        layer._memory.get_all = lambda **kwargs: [
+            {"metadata": {"type": "decision"}},
+            {"metadata": {"type": "pattern"}},
+            {"metadata": {"type": "decision"}},
+            {"metadata": {}},
+            "not a dict",
+        ]
+        stats = layer.get_stats()
+        assert stats["total_memories"] == 5
+        assert stats["by_type"] == {"decision": 2, "pattern": 1, "unknown": 1}
+        assert type(stats["by_type"]) is dict
+
+
+class TestRetry:
+    """Test retries of transient mem0 failures."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record backoff sleeps instead of sleeping."""
+        monkeypatch.delenv("MEM0_NO_RETRY", raising=False)
+        sleeps = []
+        monkeypatch.setattr(memory.time, "sleep", sleeps.append)
+        return sleeps
+
+    @staticmethod
+    def flaky(*errors):
+        """Callable that raises each of ``errors`` in turn, then returns "ok"."""
+        pending = list(errors)
+
+        def call():
+            if pending:
+                raise pending.pop(0)
+            return "ok"
+        return call
+
+    @pytest.mark.parametrize("error", [ConnectionError("reset"), TimeoutError(), HTTPStatusError(503)])
+    def test_transient_error_retried(self, sleeps, error):
+        """Test network errors and 429/5xx responses are retried."""
+        assert memory._retry(self.flaky(error, error)) == "ok"
+        assert len(sleeps) == 2
+        assert 0.0375 <= sleeps[0] <= 0.0625
+        assert 0.15 <= sleeps[1] <= 0.25
+
+    def test_gives_up_after_three_tries(self, sleeps):
+        """Test the last failure propagates."""
+        with pytest.raises(ConnectionError):
+            memory._retry(self.flaky(*[ConnectionError()] * 3))
+
+    def test_non_retryable_raises_immediately(self, sleeps):
+        """Test client errors are not retried."""
+        with pytest.raises(HTTPStatusError):
+            memory._retry(self.flaky(HTTPStatusError(400)))
+        assert sleeps == []
+
+    def test_disabled_by_env(self, sleeps, monkeypatch):
+        """Test MEM0_NO_RETRY=1 fails on the first error."""
+        monkeypatch.setenv("MEM0_NO_RETRY", "1")
+        with pytest.raises(ConnectionError):
+            memory._retry(self.flaky(ConnectionError()))
+        assert sleeps == []
+
+    def test_search_retried(self, layer, sleeps):
+        """Test layer searches go through the retry helper."""
+        search = layer._memory.search
+        calls = []
+
+        def flaky_search(*a, **kw):
+            calls.append(1)
+            if len(calls) == 1:
+                raise TimeoutError()
+            return search(*a, **kw)
+        layer._memory.search = flaky_search
+        assert layer.search("auth")
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("error", [ConnectionRefusedError(), HTTPStatusError(429)])
+    def test_refused_add_retried(self, layer, sleeps, error):
+        """Test adds are retried when the request was never accepted."""
+        call = self.flaky(error)
+        layer._memory.add = lambda *a, **kw: call()
+        layer.record_failure("e1", "s1")
+        assert layer.flush()
+        assert len(sleeps) == 1
+
+    @pytest.mark.parametrize("error", [TimeoutError(), ConnectionError("reset"), HTTPStatusError(503)])
+    def test_ambiguous_add_not_retried(self, layer, sleeps, error):
+        """Test adds that may have been stored are not sent again."""
+        calls = []
+
+        def add(*a, **kw):
+            calls.append(1)
+            raise error
+        layer._memory.add = add
+        layer.record_failure("e1", "s1")
+        assert layer.flush()
+        assert len(calls) == 1
+        assert sleeps == []
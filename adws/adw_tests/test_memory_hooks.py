@@ -0,0 +1,245 @@
+"""Tests for ADW memory hooks."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from adw_modules import github, memory_hooks
+from adw_modules.memory_hooks import (
+    _extract_files_changed,
+    _extract_libraries,
+    _extract_section,
+    _extract_sections,
+    get_project_id,
+    pre_scout_recall,
+    sanitize_memory_content,
+)
+
+
+class TestSanitizeMemoryContent:
+    """Test secret redaction before memories are stored."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("api_key='sk-1234'", "api_key=REDACTED'"),
+        ("TOKEN: abc-123 rest", "token=REDACTED rest"),
+        ("password=hunter2! ok", "password=REDACTED ok"),
+        ("mail me at a.b@example.com", "mail me at EMAIL_REDACTED"),
+        ("Authorization: Bearer abc.def", "Authorization: Bearer REDACTED.def"),
+        ("plain scout summary", "plain scout summary"),
+        ("", ""),
+    ])
+    def test_redacts(self, raw, expected):
+        """Test each secret pattern is replaced."""
+        assert sanitize_memory_content(raw) == expected
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("aaaaaaaaaaaaaa", "aaaaaaaaaa…[truncated]"),
+        (" aaaaaaaaaaaaa", " aaaaaaaaa…[truncated]"),
+        ("token=abcdefghijkl", "token=REDA…[truncated]"),
+        ("a@example.commmm", "EMAIL_REDA…[truncated]"),
+    ])
+    def test_hard_cut_without_whitespace(self, monkeypatch, raw, expected):
+        """Test text with no word boundary is redacted, then cut at the limit."""
+        monkeypatch.setattr(memory_hooks, "MAX_MEMORY_CHARS", 10)
+        assert sanitize_memory_content(raw) == expected
+
+    def test_rules_apply_in_sequence(self):
+        """Test later rules see earlier replacements, leaving no secret behind."""
+        assert sanitize_memory_content("Bearer token: abc") == "Bearer REDACTED=REDACTED"
+
+    def test_non_ascii_lookalikes(self):
+        """Test case-insensitive look-alike characters are still redacted."""
+        assert sanitize_memory_content("paſſword=x") == "password=REDACTED"
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("short text", "short text"),
+        ("aaaa bbbb cccc", "aaaa bbbb…[truncated]"),
+        ("aaaa bbbbbb cc", "aaaa…[truncated]"),
+    ])
+    def test_truncates_at_whitespace(self, monkeypatch, raw, expected):
+        """Test long content is cut before the word crossing the limit."""
+        monkeypatch.setattr(memory_hooks, "MAX_MEMORY_CHARS", 10)
+        assert sanitize_memory_content(raw) == expected
+
+
+class TestMaxMemoryChars:
+    """Test the MAX_MEMORY_CHARS environment knob."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, 4096),
+        ("2048", 2048),
+        ("lots", 4096),
+        ("0", 4096),
+        ("-5", 4096),
+    ])
+    def test_parsed_with_fallback(self, monkeypatch, value, expected):
+        """Test valid limits are used and anything else falls back to the default."""
+        if value is None:
+            monkeypatch.delenv("MAX_MEMORY_CHARS", raising=False)
+        else:
+            monkeypatch.setenv("MAX_MEMORY_CHARS", value)
+        assert memory_hooks._max_memory_chars() == expected
+
+
+class TestGetProjectId:
+    """Test project scoping from the git remote."""
+
+    def test_cached(self, monkeypatch):
+        """Test the remote is resolved once until the cache is cleared."""
+        calls = []
+        monkeypatch.setattr(
+            github, "get_repo_url",
+            lambda: calls.append(1) or "https://github.com/owner/scout_mvp.git",
+        )
+        get_project_id.cache_clear()
+        try:
+            assert get_project_id() == "project_scout_mvp"
+            assert get_project_id() == "project_scout_mvp"
+            assert calls == [1]
+        finally:
+            get_project_id.cache_clear()
+
+    def test_failure_not_cached(self, monkeypatch):
+        """Test a failed lookup falls back and is retried next time."""
+        def fail():
+            raise RuntimeError("no remote")
+
+        monkeypatch.setattr(github, "get_repo_url", fail)
+        get_project_id.cache_clear()
+        assert get_project_id() == "project_default"
+        monkeypatch.setattr(github, "get_repo_url", lambda: "https://github.com/o/r")
+        try:
+            assert get_project_id() == "project_r"
+        finally:
+            get_project_id.cache_clear()
+
+
+class FakeManager:
+    """MemoryManager stand-in returning canned search results."""
+
+    def __init__(self, results):
+        self.results = results
+
+    def is_available(self):
+        return True
+
+    def search(self, **kwargs):
+        return {"results": self.results}
+
+
+class TestPreScoutRecall:
+    """Test file suggestions recalled before scouting."""
+
+    def test_files_ranked_by_frequency(self, monkeypatch):
+        """Test files are ordered by count with ties in first-seen order."""
+        results = [
+            {"memory": "m1", "score": 0.9, "metadata": {"files": ["a.py", "b.py"]}},
+            {"memory": "m2", "score": 0.7, "metadata": {"files": ["c.py", "b.py"]}},
+            {"memory": "m3", "score": 0.8, "metadata": {"file": "c.py"}},
+        ]
+        monkeypatch.setattr(memory_hooks.MemoryManager, "get_instance", lambda: FakeManager(results))
+        recall = pre_scout_recall("add auth", project_id="project_x", limit=2)
+        assert recall["suggested_files"] == ["b.py", "c.py"]
+        assert recall["key_insights"] == "m1"
+        assert recall["confidence"] == pytest.approx(0.8)
+
+
+PLAN = """# Plan: add login
+
+## Architecture Overview
+Use the existing session middleware.
+
+### Risks
+Token expiry during long sessions.
+
+## Implementation Steps
+1. Add route
+"""
+
+
+class TestExtractSection:
+    """Test markdown section extraction from plans."""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("Architecture", "Use the existing session middleware."),
+        ("risks", "Token expiry during long sessions."),
+        ("Implementation", "1. Add route"),
+        ("Testing", ""),
+    ])
+    def test_sections(self, name, expected):
+        """Test each section body is returned up to the next header."""
+        assert _extract_section(PLAN, name) == expected
+
+    def test_pattern_compiled_once(self):
+        """Test the section pattern is reused between calls."""
+        _extract_section(PLAN, "Architecture")
+        pattern = memory_hooks._SECTION_PATTERNS["Architecture"]
+        _extract_section(PLAN, "Architecture")
+        assert memory_hooks._SECTION_PATTERNS["Architecture"] is pattern
+
+    def test_single_pass_matches_per_section(self):
+        """Test _extract_sections agrees with _extract_section."""
+        names = ("Architecture", "Risks", "Implementation", "Testing")
+        assert _extract_sections(PLAN, names) == {
+            name: _extract_section(PLAN, name) for name in names
+        }
+
+    def test_first_matching_header_wins(self):
+        """Test a repeated section name keeps its first occurrence."""
+        content = "# Risks\nfirst\n# Risks\nsecond\n"
+        assert _extract_sections(content, ("risks",)) == {"risks": "first"}
+
+    @pytest.mark.parametrize("content", [
+        "#### Architecture notes\n- item\n## Other\n",
+        "## Architecture\n## Risks\nnone\n## Implementation\n",
+        "# Risks\nfirst\n# Risks\nsecond\n# risks\nthird",
+        "## Architecture\nlayers\n#### Detail\nmore\n### Risks\n",
+        "Notes on C# architecture\nbody\n# Implementation",
+        "#\nArchitecture\nbody\n##\tRisks here\nrisk\n",
+        "## Risks",
+        "",
+    ])
+    def test_single_pass_matches_edge_cases(self, content):
+        """Test _extract_sections agrees with _extract_section on odd headers."""
+        names = ("architecture", "risks", "implementation")
+        assert _extract_sections(content, names) == {
+            name: _extract_section(content, name) for name in names
+        }
+
+
+class TestExtractLibraries:
+    """Test library names pulled from build reports."""
+
+    def test_import_from_and_require(self):
+        """Test every statement form is found and builtins are skipped."""
+        report = (
+            "Added `import requests` and `from flask import jsonify`.\n"
+            "Frontend uses require('axios'); also import os.\n"
+        )
+        assert _extract_libraries(report) == ["requests", "flask", "jsonify", "axios"]
+
+    def test_deduplicated_in_order(self):
+        """Test repeated libraries are kept once, at their first mention."""
+        assert _extract_libraries("import b\nimport a\nimport b") == ["b", "a"]
+
+    def test_no_statements(self):
+        """Test plain prose yields nothing."""
+        assert _extract_libraries("Refactored the build step.") == []
+
+
+class TestExtractFilesChanged:
+    """Test changed files pulled from build reports."""
+
+    def test_deduplicated_in_report_order(self):
+        """Test each file is listed once, in the order first reported."""
+        report = (
+            "Modified: adws/b.py\n"
+            "Created: adws/a.ts\n"
+            "Updated: adws/b.py\n"
+            "Deleted: adws/c.py\n"
+        )
+        assert _extract_files_changed(report) == ["adws/b.py", "adws/a.ts"]
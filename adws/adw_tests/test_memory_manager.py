@@ -0,0 +1,82 @@
+"""Tests for the mem0 MemoryManager singleton."""
+
+import sys
+import os
+import types
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from adw_modules import memory_manager
+from adw_modules.memory_manager import MemoryManager
+
+
+class TestTuneVectorStore:
+    """Test collection tuning goes through the shared memory helper."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """Fresh MemoryManager singleton."""
+        monkeypatch.setattr(MemoryManager, "_instance", None)
+        return MemoryManager.get_instance()
+
+    def test_store_without_client_skipped(self, manager):
+        """Test stores lacking a Qdrant client are left alone."""
+        manager._memory = types.SimpleNamespace(vector_store=types.SimpleNamespace())
+        manager._tune_vector_store()
+
+    def test_update_errors_swallowed(self, manager):
+        """Test a failing collection update does not break initialization."""
+        def fail(*args, **kwargs):
+            raise RuntimeError("collection missing")
+
+        client = types.SimpleNamespace(update_collection=fail)
+        manager._memory = types.SimpleNamespace(
+            vector_store=types.SimpleNamespace(client=client, collection_name="adw_memories")
+        )
+        manager._tune_vector_store()
+
+    def test_uses_shared_helper(self, manager, monkeypatch):
+        """Test the manager tunes its collection with memory.tune_vector_store."""
+        calls = []
+        monkeypatch.setattr(memory_manager, "tune_vector_store", calls.append)
+        manager._memory = object()
+        manager._tune_vector_store()
+        assert calls == [manager._memory]
+
+
+class TestMemoryConfig:
+    """Test vector store selection from the environment."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """Fresh MemoryManager with a stub mem0 MemoryConfig."""
+        base = types.ModuleType("mem0.configs.base")
+        base.MemoryConfig = lambda **kwargs: kwargs
+        monkeypatch.setitem(sys.modules, "mem0", types.ModuleType("mem0"))
+        monkeypatch.setitem(sys.modules, "mem0.configs", types.ModuleType("mem0.configs"))
+        monkeypatch.setitem(sys.modules, "mem0.configs.base", base)
+        for name in ("ADW_MEMORY_BACKEND", "ADW_MEMORY_FAISS_PATH", "ADW_MEMORY_QDRANT_PATH"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setattr(MemoryManager, "_instance", None)
+        return MemoryManager.get_instance()
+
+    def test_default(self, manager):
+        """Test mem0 defaults are used without overrides."""
+        assert manager._get_memory_config() is None
+
+    def test_faiss_backend(self, manager, monkeypatch):
+        """Test ADW_MEMORY_BACKEND=faiss selects an in-process FAISS store."""
+        monkeypatch.setenv("ADW_MEMORY_BACKEND", "FAISS")
+        monkeypatch.setenv("ADW_MEMORY_FAISS_PATH", "/tmp/adw_faiss")
+        store = manager._get_memory_config()["vector_store"]
+        assert store["provider"] == "faiss"
+        assert store["config"]["path"] == "/tmp/adw_faiss"
+
+    def test_unknown_backend_falls_back(self, manager, monkeypatch):
+        """Test unsupported backends keep the Qdrant configuration."""
+        monkeypatch.setenv("ADW_MEMORY_BACKEND", "usearch")
+        monkeypatch.setenv("ADW_MEMORY_QDRANT_PATH", "/tmp/adw_qdrant")
+        assert manager._get_memory_config()["vector_store"]["provider"] == "qdrant"
@@ -24,7 +24,7 @@ import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional
 
 import schedule
 from dotenv import load_dotenv
@@ -33,7 +33,13 @@ from dotenv import load_dotenv
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from adw_modules.utils import get_safe_subprocess_env
 
-from adw_modules.github import fetch_open_issues, fetch_issue_comments, get_repo_url, extract_repo_path
+from adw_modules.github import (
+    fetch_open_issue_numbers,
+    fetch_issue_comments,
+    fetch_issue_comments_bulk,
+    get_repo_url,
+    extract_repo_path,
+)
 
 # Load environment variables from current or parent directories
 load_dotenv()
@@ -65,9 +71,13 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 
-def should_process_issue(issue_number: int) -> bool:
-    """Determine if an issue should be processed based on comments."""
-    comments = fetch_issue_comments(REPO_PATH, issue_number)
+def should_process_issue(issue_number: int, comments: Optional[List[Dict]] = None) -> bool:
+    """Determine if an issue should be processed based on comments.
+
+    Comments are fetched unless the caller already has them.
+    """
+    if comments is None:
+        comments = fetch_issue_comments(REPO_PATH, issue_number)
     
     # If no comments, it's a new issue - process it
     if not comments:
@@ -137,28 +147,28 @@ def check_and_process_issues():
     print(f"INFO: Starting issue check cycle")
     
     try:
-        # Fetch all open issues
-        issues = fetch_open_issues(REPO_PATH)
+        # Fetch all open issue numbers
+        issue_numbers = fetch_open_issue_numbers(REPO_PATH)
         
-        if not issues:
+        if not issue_numbers:
             print(f"INFO: No open issues found")
             return
         
         # Track newly qualified issues
         new_qualifying_issues = []
         
+        # Skip issues without a number or already processed in this session
+        candidates = [
+            number for number in issue_numbers
+            if number and number not in processed_issues
+        ]
+
+        # Fetch comments for all candidates concurrently
+        comments_by_issue = fetch_issue_comments_bulk(REPO_PATH, candidates)
+
         # Check each issue
-        for issue in issues:
-            issue_number = issue.number
-            if not issue_number:
-                continue
-            
-            # Skip if already processed in this session
-            if issue_number in processed_issues:
-                continue
-            
-            # Check if issue should be processed
-            if should_process_issue(issue_number):
+        for issue_number in candidates:
+            if should_process_issue(issue_number, comments_by_issue[issue_number]):
                 new_qualifying_issues.append(issue_number)
         
         # Process qualifying issues